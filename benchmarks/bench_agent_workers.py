@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Agent Worker Pool Benchmark
+
+Compares running agent tasks on the bundled echo worker by spawning one
+process per task (as shelling out per task would) with running them on a
+warm subprocess worker pool. Both run ``--concurrency`` tasks at a time.
+
+    python benchmarks/bench_agent_workers.py --tasks 200 --concurrency 4
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import time
+
+from agentic_dev_boilerplate.agent_workers import ECHO_WORKER, WorkerPoolBackend
+from agentic_dev_boilerplate.backends import TaskPayload
+
+
+async def spawn_per_task(payload):
+    process = await asyncio.create_subprocess_exec(
+        *ECHO_WORKER,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+    )
+    request = {"id": 1, "type": "task", "payload": payload.__dict__}
+    stdout, _ = await process.communicate(json.dumps(request).encode() + b"\n")
+    return json.loads(stdout)["result"]
+
+
+async def measure(args, execute):
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies = []
+
+    async def one(i):
+        async with semaphore:
+            start = time.perf_counter()
+            await execute(TaskPayload(str(i), f"task {i}", "tester"))
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(args.tasks)))
+    return time.perf_counter() - start, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Spawn-per-task vs warm workers")
+    parser.add_argument("--tasks", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    backend = WorkerPoolBackend(
+        min_workers=args.concurrency,
+        max_workers=args.concurrency,
+        health_interval=None,
+    )
+    backend.pool("tester")  # prewarm, as a long-running coordinator would be
+    try:
+        modes = [("spawn", spawn_per_task), ("warm pool", backend.submit)]
+        print(f"{'mode':>9} {'tasks/s':>8} {'p50 ms':>7} {'p99 ms':>7}")
+        throughput = {}
+        for mode, execute in modes:
+            elapsed, latencies = asyncio.run(measure(args, execute))
+            latencies.sort()
+            throughput[mode] = args.tasks / elapsed
+            p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+            print(
+                f"{mode:>9} {throughput[mode]:>8.1f} "
+                f"{statistics.median(latencies) * 1000:>7.1f} {p99 * 1000:>7.1f}"
+            )
+        print(f"throughput gain: {throughput['warm pool'] / throughput['spawn']:.1f}x")
+    finally:
+        backend.shutdown()
+
+
+if __name__ == "__main__":
+    main()
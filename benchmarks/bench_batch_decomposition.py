@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Batch Decomposition Benchmark
+
+Decomposes a burst of problems with a simulated planner whose calls cost a
+fixed overhead plus a small per-problem time, first with one
+``decompose_problem`` call per session and then with ``decompose_many``,
+and reports problems per second and the throughput gain.
+
+    python benchmarks/bench_batch_decomposition.py --problems 500 --batch-size 32
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from agentic_dev_boilerplate.multi_agent_solver import AgentCoordinator, AgentRole
+from agentic_dev_boilerplate.planners import TemplatePlanner
+
+AGENTS = [AgentRole.PLANNER, AgentRole.TESTER, AgentRole.DEBUGGER]
+
+
+def run(args, batched):
+    planner = TemplatePlanner(
+        batch_size=args.batch_size,
+        call_seconds=args.call_ms / 1000,
+        problem_seconds=args.problem_ms / 1000,
+    )
+    coordinator = AgentCoordinator(Path(tempfile.mkdtemp()), planner=planner)
+    session_ids = [
+        coordinator.create_session(f"Issue {i}: fix flaky test", AGENTS)
+        for i in range(args.problems)
+    ]
+    start = time.perf_counter()
+    if batched:
+        coordinator.decompose_many(session_ids, args.concurrency)
+    else:
+        for session_id in session_ids:
+            coordinator.decompose_problem(session_id)
+    return time.perf_counter() - start, planner.calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batched problem decomposition")
+    parser.add_argument("--problems", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--call-ms", type=float, default=20.0)
+    parser.add_argument("--problem-ms", type=float, default=0.5)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    per_call, per_call_calls = run(args, batched=False)
+    batched, batched_calls = run(args, batched=True)
+    print(f"{'mode':>10} {'calls':>6} {'seconds':>8} {'problems/s':>11}")
+    for mode, seconds, calls in (
+        ("per-call", per_call, per_call_calls),
+        ("batched", batched, batched_calls),
+    ):
+        print(f"{mode:>10} {calls:>6} {seconds:>8.2f} {args.problems / seconds:>11.0f}")
+    print(f"throughput gain: {per_call / batched:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Coordinator Load Test Benchmark
+
+Runs a fixed, seeded matrix of load test scenarios (DAG shapes and latency
+distributions, see ``agentic_dev_boilerplate.loadtest``) and prints
+throughput, session latency percentiles and peak memory per scenario. Each
+scenario runs in its own process so peak RSS is not carried over.
+Save a run with ``--json`` and pass it to ``--compare`` on a later run to
+see how a coordinator change moved each number.
+
+    python benchmarks/bench_loadtest.py --sessions 2000 --json before.json
+    python benchmarks/bench_loadtest.py --sessions 2000 --compare before.json
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from agentic_dev_boilerplate.loadtest import CHAIN, DIAMOND, INDEPENDENT, LAYERED
+
+SCENARIOS = {
+    "independent/lognormal": (INDEPENDENT, "lognormal:0.01:0.5"),
+    "chain/lognormal": (CHAIN, "lognormal:0.01:0.5"),
+    "diamond/bimodal": (DIAMOND, "bimodal:0.005:0.05:20"),
+    "layered/bimodal": (LAYERED, "bimodal:0.005:0.05:20"),
+}
+
+COLUMNS = (
+    ("sessions_per_second", "sess/s", 1),
+    ("tasks_per_second", "tasks/s", 1),
+    ("latency_p50", "p50 ms", 1000),
+    ("latency_p95", "p95 ms", 1000),
+    ("latency_p99", "p99 ms", 1000),
+    ("peak_rss_mb", "RSS MB", 1),
+)
+
+
+def run_scenario(args, shape, latency):
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp) / "report.json"
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "agentic_dev_boilerplate.loadtest",
+                f"--sessions={args.sessions}",
+                f"--concurrency={args.concurrency}",
+                f"--tasks={args.tasks}",
+                f"--shape={shape}",
+                f"--latency={latency}",
+                f"--failure-rate={args.failure_rate}",
+                f"--json={output}",
+            ],
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        return json.loads(output.read_text())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Coordinator load test matrix")
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--tasks", type=int, default=8)
+    parser.add_argument("--failure-rate", type=float, default=0.01)
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="Run only these scenarios (default: all)",
+    )
+    parser.add_argument("--json", type=Path, default=None)
+    parser.add_argument("--compare", type=Path, default=None)
+    args = parser.parse_args()
+    baseline = json.loads(args.compare.read_text()) if args.compare else {}
+
+    print(f"{'scenario':24}" + "".join(f"{title:>10}" for _, title, _ in COLUMNS))
+    reports = {}
+    for name in args.scenario or SCENARIOS:
+        shape, latency = SCENARIOS[name]
+        report = run_scenario(args, shape, latency)
+        reports[name] = report
+        row = f"{name:24}"
+        for key, _, scale in COLUMNS:
+            value = report[key]
+            row += f"{'-' if value is None else f'{value * scale:.1f}':>10}"
+        print(row)
+        if name in baseline:
+            row = f"{'  vs baseline':24}"
+            for key, _, _ in COLUMNS:
+                before, after = baseline[name].get(key), report[key]
+                change = f"{(after / before - 1) * 100:+.1f}%" if before else "-"
+                row += f"{change:>10}"
+            print(row)
+
+    if args.json:
+        args.json.write_text(json.dumps(reports, indent=2))
+        print(f"Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Message History Memory Benchmark
+
+Stores N messages as the original plain dataclasses in a list, as a
+``MessageLog``, and through ``AgentCoordinator.send_message`` (session log
+plus message bus, as sessions really store them), and reports traced memory
+for each (tracemalloc; payloads the log spills to disk are not counted,
+which is the point).
+
+    python benchmarks/bench_message_memory.py --messages 1000000
+"""
+
+import argparse
+import gc
+import logging
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from agentic_dev_boilerplate.ids import new_id
+from agentic_dev_boilerplate.message_log import MessageLog
+from agentic_dev_boilerplate.multi_agent_solver import (
+    AgentCoordinator,
+    AgentMessage,
+    AgentRole,
+    MessageType,
+)
+
+
+@dataclass
+class DictMessage:
+    """AgentMessage as it was before slots."""
+
+    sender: AgentRole
+    recipient: AgentRole
+    message_type: MessageType
+    content: Dict[str, Any]
+    timestamp: float = field(default_factory=time.time)
+    message_id: str = field(default_factory=lambda: new_id("msg"))
+    session_id: Optional[str] = None
+
+
+def fill(store, cls, count, session_id="session_bench"):
+    roles = list(AgentRole)
+    for i in range(count):
+        store.append(
+            cls(
+                roles[i % len(roles)],
+                roles[(i + 1) % len(roles)],
+                MessageType.STATUS_UPDATE,
+                {"step": i, "status": "ok"},
+                session_id=session_id,
+            )
+        )
+    return store
+
+
+class Sender:
+    """Appends by sending through a coordinator session."""
+
+    def __init__(self, coordinator, session_id):
+        self.coordinator = coordinator
+        self.session_id = session_id
+
+    def append(self, message):
+        self.coordinator.send_message(message)
+
+
+def measure(label, build, count):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    store = build(count)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<26} {current / 2**20:>9.1f} MiB  peak {peak / 2**20:>7.1f} MiB  "
+        f"{current / count:>6.1f} B/msg  {elapsed:>6.1f}s"
+    )
+    return store
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Message history memory")
+    parser.add_argument("--messages", type=int, default=1_000_000)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(f"{args.messages:,} messages")
+    measure(
+        "list[dataclass] (before)", lambda n: fill([], DictMessage, n), args.messages
+    )
+    measure("list[slots dataclass]", lambda n: fill([], AgentMessage, n), args.messages)
+    log = measure(
+        "MessageLog (after)",
+        lambda n: fill(MessageLog(AgentMessage), AgentMessage, n),
+        args.messages,
+    )
+    print(f"MessageLog columns: {log.nbytes() / 2**20:.1f} MiB, spilled: {log.spilled}")
+
+    # Set up outside the measurement: imports, capability index, metrics.
+    coordinator = AgentCoordinator(Path(tempfile.mkdtemp()))
+    session_id = coordinator.create_session("bench", list(AgentRole))
+    sender = Sender(coordinator, session_id)
+    measure(
+        "send_message",
+        lambda n: fill(sender, AgentMessage, n, session_id),
+        args.messages,
+    )
+    coordinator.close_session(session_id)
+    coordinator.close()
+
+
+if __name__ == "__main__":
+    main()
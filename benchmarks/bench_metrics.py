@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Metrics Overhead Benchmark
+
+Measures what coordinator instrumentation costs:
+
+- per-operation cost of counter increments and histogram observations
+  (fixed buckets, so independent of how many values were observed);
+- rendering the OpenMetrics exposition for ``--series`` label children;
+- end-to-end session throughput with metrics recorded versus discarded.
+
+    python benchmarks/bench_metrics.py --sessions 20 --tasks 200
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+import timeit
+from pathlib import Path
+
+from agentic_dev_boilerplate.metrics import CoordinatorMetrics, MetricsRegistry
+from agentic_dev_boilerplate.multi_agent_solver import AgentCoordinator, AgentRole, Task
+
+
+class _Discard:
+    """Stands in for every metric family and child; records nothing."""
+
+    def labels(self, *values):
+        return self
+
+    def inc(self, amount=1):
+        pass
+
+    def observe(self, value):
+        pass
+
+
+def per_op(statement, number=200000):
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number
+
+
+def run_sessions(args, discard):
+    coordinator = AgentCoordinator(Path(tempfile.mkdtemp()))
+    if discard:
+        for name in vars(coordinator._metrics):
+            if name != "registry":
+                setattr(coordinator._metrics, name, _Discard())
+
+    async def instant(task):
+        return {"confidence": 0.9}
+
+    coordinator._execute_agent_task_async = instant
+    roles = list(AgentRole)
+    start = time.perf_counter()
+    for _ in range(args.sessions):
+        session_id = coordinator.create_session("bench", roles)
+        coordinator.active_sessions[session_id].tasks = [
+            Task(
+                task_id=f"t{i}",
+                description="bench",
+                assigned_agent=roles[i % len(roles)],
+            )
+            for i in range(args.tasks)
+        ]
+        coordinator.execute_session(session_id)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cost of coordinator metrics")
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--tasks", type=int, default=200)
+    parser.add_argument("--series", type=int, default=200)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    metrics = CoordinatorMetrics(MetricsRegistry())
+    counter = metrics.tasks.labels("tester", "completed")
+    histogram = metrics.task_latency.labels("tester")
+    print(f"counter inc:          {per_op(counter.inc) * 1e9:7.0f} ns")
+    print(
+        f"histogram observe:    {per_op(lambda: histogram.observe(0.3)) * 1e9:7.0f} ns"
+    )
+    print(
+        "labels() + inc:       "
+        f"{per_op(lambda: metrics.tasks.labels('tester', 'completed').inc()) * 1e9:7.0f} ns"
+    )
+
+    for i in range(args.series):
+        metrics.task_latency.labels(f"role{i}").observe(0.1)
+    render = min(timeit.repeat(metrics.registry.render, number=10, repeat=3)) / 10
+    print(f"render {args.series} histogram series: {render * 1e3:.2f} ms")
+
+    run_sessions(args, discard=True)  # warm up imports and capability index
+    without = run_sessions(args, discard=True)
+    with_metrics = run_sessions(args, discard=False)
+    total = args.sessions * args.tasks
+    print(
+        f"sessions without metrics: {total / without:8.0f} tasks/s\n"
+        f"sessions with metrics:    {total / with_metrics:8.0f} tasks/s "
+        f"({(with_metrics / without - 1) * 100:+.1f}%)"
+    )
+
+
+if __name__ == "__main__":
+    main()
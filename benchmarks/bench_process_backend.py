@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Process Backend Scaling Benchmark
+
+Runs a batch of CPU-bound agent tasks through the inline, thread and
+process backends and reports throughput relative to inline execution.
+Threads serialize on the GIL; processes should scale with the worker count
+up to the number of cores.
+
+    python benchmarks/bench_process_backend.py --tasks 64 --work 200000
+"""
+
+import argparse
+import functools
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from agentic_dev_boilerplate.backends import TaskPayload
+from agentic_dev_boilerplate.multi_agent_solver import AgentCoordinator, AgentRole, Task
+
+
+def parse_logs(payload: TaskPayload, work: int):
+    """CPU-bound stand-in for log parsing / static analysis."""
+    total = 0
+    for i in range(work):
+        total += (i * 2654435761) % 977
+    return {"agent": payload.agent, "task": payload.description, "confidence": 0.9}
+
+
+def run(backend: str, workers: int, tasks: int, work: int) -> float:
+    with AgentCoordinator(
+        Path(tempfile.mkdtemp()),
+        backend=backend,
+        max_workers=workers,
+        task_fn=functools.partial(parse_logs, work=work),
+    ) as coordinator:
+        session_id = coordinator.create_session("bench", [AgentRole.DEBUGGER])
+        coordinator.active_sessions[session_id].tasks = [
+            Task(f"t{i}", "parse logs", AgentRole.DEBUGGER) for i in range(tasks)
+        ]
+        start = time.perf_counter()
+        coordinator.execute_session(session_id)
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Process backend scaling")
+    parser.add_argument("--tasks", type=int, default=64)
+    parser.add_argument(
+        "--work", type=int, default=200_000, help="Loop iterations/task"
+    )
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    baseline = run("inline", 1, args.tasks, args.work)
+    print(f"cores: {os.cpu_count()}  tasks: {args.tasks}")
+    print(f"{'backend':<8} {'workers':>7} {'seconds':>8} {'speedup':>8}")
+    print(f"{'inline':<8} {1:>7} {baseline:>8.2f} {1.0:>7.2f}x")
+    workers = 1
+    while workers <= args.max_workers:
+        for backend in ("thread", "process"):
+            elapsed = run(backend, workers, args.tasks, args.work)
+            print(
+                f"{backend:<8} {workers:>7} {elapsed:>8.2f} "
+                f"{baseline / elapsed:>7.2f}x"
+            )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Retry and Circuit Breaker Benchmark
+
+Injects failures into agent task execution and reports how much of each
+session's work completes and how long sessions take:
+
+- ``flaky``: every attempt fails with probability ``--failure-rate``;
+  compares no retries with jittered-backoff retries.
+- ``outage``: the tester backend is down and each failing attempt takes
+  ``--outage-seconds``; compares retrying into it with a circuit breaker
+  that reroutes tester tasks to the debugger.
+
+    python benchmarks/bench_resilience.py --sessions 10 --tasks 50
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from agentic_dev_boilerplate.multi_agent_solver import AgentCoordinator, AgentRole, Task
+from agentic_dev_boilerplate.resilience import BreakerPolicy, RetryPolicy
+
+
+def run(args, execute, **options):
+    coordinator = AgentCoordinator(Path(tempfile.mkdtemp()), **options)
+    coordinator._execute_agent_task_async = execute
+    completed = total = 0
+    start = time.perf_counter()
+    for _ in range(args.sessions):
+        session_id = coordinator.create_session("bench", [AgentRole.TESTER])
+        coordinator.active_sessions[session_id].tasks = [
+            Task(task_id=f"t{i}", description="bench", assigned_agent=AgentRole.TESTER)
+            for i in range(args.tasks)
+        ]
+        result = coordinator.execute_session(session_id)
+        completed += len(result["results"])
+        total += args.tasks
+    return completed / total, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Task failures with and without retries"
+    )
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--tasks", type=int, default=50)
+    parser.add_argument("--failure-rate", type=float, default=0.2)
+    parser.add_argument("--outage-seconds", type=float, default=0.2)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    rng = random.Random(0)
+    retry = {AgentRole.TESTER: RetryPolicy(4, base_delay=0.01, max_delay=0.1)}
+
+    async def flaky(task):
+        await asyncio.sleep(0.01)
+        if rng.random() < args.failure_rate:
+            raise ConnectionError("transient failure")
+        return {"confidence": 0.9}
+
+    async def outage(task):
+        if task.assigned_agent == AgentRole.TESTER:
+            await asyncio.sleep(args.outage_seconds)
+            raise ConnectionError("tester backend down")
+        await asyncio.sleep(0.01)
+        return {"confidence": 0.9}
+
+    scenarios = [
+        ("flaky", "no retry", flaky, {}),
+        ("flaky", "retry", flaky, {"retry_policies": retry}),
+        ("outage", "retry", outage, {"retry_policies": retry}),
+        (
+            "outage",
+            "breaker",
+            outage,
+            {
+                "retry_policies": retry,
+                "breaker_policy": BreakerPolicy(failure_threshold=5),
+                "fallback_roles": {AgentRole.TESTER: AgentRole.DEBUGGER},
+            },
+        ),
+    ]
+    print(f"{'scenario':>8} {'mode':>9} {'done %':>7} {'total s':>8}")
+    for scenario, mode, execute, options in scenarios:
+        done, elapsed = run(args, execute, **options)
+        print(f"{scenario:>8} {mode:>9} {done * 100:>7.1f} {elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Result Cache Benchmark
+
+Runs the same decomposed problem repeatedly against one code revision, as a
+CI loop re-validating an unchanged tree would, and compares total run time
+with and without the result cache. Agent work is the simulated default.
+
+    python benchmarks/bench_result_cache.py --sessions 20
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from agentic_dev_boilerplate.multi_agent_solver import AgentCoordinator, AgentRole
+from agentic_dev_boilerplate.result_cache import ResultCache
+
+
+def run(args, cache):
+    coordinator = AgentCoordinator(Path(tempfile.mkdtemp()), result_cache=cache)
+    agents = [AgentRole.PLANNER, AgentRole.TESTER, AgentRole.DEBUGGER]
+    start = time.perf_counter()
+    for _ in range(args.sessions):
+        session_id = coordinator.create_session(
+            "Fix the flaky integration test", agents, context={"revision": "abc123"}
+        )
+        coordinator.decompose_problem(session_id)
+        coordinator.execute_session(session_id)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Repeated sessions with caching")
+    parser.add_argument("--sessions", type=int, default=20)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    uncached = run(args, None)
+    cache = ResultCache(disk_dir=Path(tempfile.mkdtemp()))
+    cached = run(args, cache)
+    print(f"{'mode':>8} {'total s':>8}")
+    print(f"{'uncached':>8} {uncached:>8.3f}")
+    print(f"{'cached':>8} {cached:>8.3f}")
+    print(
+        f"hit rate: {cache.stats()['hit_rate']:.2f}, speedup: {uncached / cached:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Sampling Profiler Overhead Benchmark
+
+Runs a CPU-bound workload with a deep call stack, alternating plain and
+sampled runs, and reports the median slowdown.
+
+    python benchmarks/bench_sampling_overhead.py --rate 100 --mode signal
+"""
+
+import argparse
+import statistics
+import time
+
+from agentic_dev_boilerplate.profiling import SamplingProfiler
+
+
+def workload(iterations: int) -> int:
+    x = 0
+    for i in range(iterations):
+        x += i * i % 7
+    return x
+
+
+def nested(depth: int, iterations: int) -> int:
+    if depth == 0:
+        return workload(iterations)
+    return nested(depth - 1, iterations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sampling profiler overhead")
+    parser.add_argument("--rate", type=float, default=100.0, help="Sampling rate (Hz)")
+    parser.add_argument("--mode", default="auto", choices=["auto", "signal", "thread"])
+    parser.add_argument("--depth", type=int, default=30, help="Call stack depth")
+    parser.add_argument("--iterations", type=int, default=1_000_000)
+    parser.add_argument("--rounds", type=int, default=15)
+    args = parser.parse_args()
+
+    plain, sampled = [], []
+    samples = 0
+    for _ in range(args.rounds):
+        start = time.perf_counter()
+        nested(args.depth, args.iterations)
+        plain.append(time.perf_counter() - start)
+
+        with SamplingProfiler(args.rate, mode=args.mode) as sampler:
+            start = time.perf_counter()
+            nested(args.depth, args.iterations)
+            sampled.append(time.perf_counter() - start)
+        samples += sampler.samples
+
+    base = statistics.median(plain)
+    profiled = statistics.median(sampled)
+    print(f"mode:       {sampler.mode} @ {args.rate:.0f} Hz")
+    print(f"plain:      {base * 1000:.1f} ms (median of {args.rounds})")
+    print(f"sampled:    {profiled * 1000:.1f} ms ({samples} samples)")
+    print(f"overhead:   {(profiled / base - 1) * 100:+.2f}%")
+
+
+if __name__ == "__main__":
+    main()
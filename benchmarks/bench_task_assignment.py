@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Task Assignment Benchmark
+
+Assigns a batch of synthetic task descriptions to the repository's agent
+roles with ``TaskAssigner`` and reports the batch time for the NumPy path
+(when installed) and the pure-Python fallback, plus how often the assigner
+agrees with the role each description was generated for.
+
+    python benchmarks/bench_task_assignment.py --tasks 100000
+"""
+
+import argparse
+import logging
+import random
+import time
+from pathlib import Path
+
+from agentic_dev_boilerplate.assignment import ROLE_KEYWORDS, TaskAssigner, np
+from agentic_dev_boilerplate.capabilities import get_capability_index
+from agentic_dev_boilerplate.multi_agent_solver import AgentRole
+
+FILLER = (
+    "the module service api database cache component parser workflow "
+    "for new old final shared user data"
+).split()
+
+
+def descriptions(count, rng):
+    """(description, intended role) pairs: one seed keyword plus filler."""
+    roles = list(AgentRole)
+    tasks = []
+    for _ in range(count):
+        role = rng.choice(roles)
+        words = rng.choices(FILLER, k=6)
+        words.insert(rng.randrange(7), rng.choice(ROLE_KEYWORDS[role.value]))
+        tasks.append((" ".join(words).capitalize(), role))
+    return tasks
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch task assignment time")
+    parser.add_argument("--tasks", type=int, default=100_000)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    root = Path(__file__).resolve().parent.parent
+    index = get_capability_index(root / ".github" / "instructions")
+    tasks = descriptions(args.tasks, random.Random(1))
+    texts = [text for text, _ in tasks]
+
+    modes = [True, False] if np is not None else [False]
+    print(f"{'path':>8} {'tasks':>8} {'seconds':>8} {'agreement':>10}")
+    for vectorized in modes:
+        assigner = TaskAssigner.for_roles(AgentRole, index, vectorized=vectorized)
+        assigner.assign(texts[:1000])  # warm the word cache
+        start = time.perf_counter()
+        assigned = assigner.assign(texts)
+        elapsed = time.perf_counter() - start
+        agreement = sum(a == role for a, (_, role) in zip(assigned, tasks))
+        path = "numpy" if vectorized else "python"
+        print(
+            f"{path:>8} {args.tasks:>8} {elapsed:>8.3f} "
+            f"{agreement / args.tasks:>10.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
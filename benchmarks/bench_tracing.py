@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Tracing Overhead Benchmark
+
+Runs the same sessions with tracing disabled and with span export to an
+OTLP/JSON file at several sampling ratios, and reports task throughput and
+the spans written.
+
+    python benchmarks/bench_tracing.py --sessions 20 --tasks 200 --ratios 0.1 1
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from agentic_dev_boilerplate.multi_agent_solver import AgentCoordinator, AgentRole, Task
+from agentic_dev_boilerplate.tracing import OTLPJsonFileExporter, Tracer
+
+
+def run(args, tracer):
+    coordinator = AgentCoordinator(Path(tempfile.mkdtemp()), tracer=tracer)
+
+    async def instant(task):
+        return {"confidence": 0.9}
+
+    coordinator._execute_agent_task_async = instant
+    roles = list(AgentRole)
+    start = time.perf_counter()
+    for _ in range(args.sessions):
+        session_id = coordinator.create_session("bench", roles)
+        coordinator.active_sessions[session_id].tasks = [
+            Task(
+                task_id=f"t{i}",
+                description="bench",
+                assigned_agent=roles[i % len(roles)],
+                # Chains of four tasks, so spans have dependency parents.
+                dependencies=[f"t{i - 1}"] if i % 4 else [],
+            )
+            for i in range(args.tasks)
+        ]
+        coordinator.execute_session(session_id)
+    elapsed = time.perf_counter() - start
+    coordinator.close()
+    return args.sessions * args.tasks / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cost of session tracing")
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--tasks", type=int, default=200)
+    parser.add_argument("--ratios", type=float, nargs="+", default=[0.1, 1.0])
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    run(args, None)  # warm up imports and capability index
+    baseline = run(args, None)
+    print(f"tracing disabled:   {baseline:8.0f} tasks/s")
+    for ratio in args.ratios:
+        path = Path(tempfile.mkdtemp()) / "trace.jsonl"
+        exporter = OTLPJsonFileExporter(path)
+        throughput = run(args, Tracer(exporter, sample_ratio=ratio))
+        print(
+            f"sample ratio {ratio:4.2f}:  {throughput:8.0f} tasks/s "
+            f"({(baseline / throughput - 1) * 100:+.1f}% time), "
+            f"{exporter.exported} spans, {exporter.dropped} dropped, "
+            f"{path.stat().st_size if path.exists() else 0} bytes"
+        )
+
+
+if __name__ == "__main__":
+    main()
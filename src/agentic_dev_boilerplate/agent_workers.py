@@ -0,0 +1,505 @@
+#!/usr/bin/env python3
+"""
+Agent Worker Pools
+
+Runs agent tasks on long-lived worker subprocesses instead of spawning a
+process per task. Each role has a :class:`WorkerPool` of workers started
+from that role's command line; a worker handles one task at a time and
+speaks a line-delimited JSON protocol over stdin/stdout:
+
+- request: ``{"id": N, "type": "task", "payload": {...}}`` or
+  ``{"id": N, "type": "ping"}``
+- response: ``{"id": N, "ok": true, "result": ...}`` or
+  ``{"id": N, "ok": false, "error": "..."}``
+
+Pools size themselves between ``min_workers`` and ``max_workers``: a worker
+is started whenever work is queued and none is idle, and workers idle for
+longer than ``idle_timeout`` are stopped again. A worker is recycled after
+``max_tasks_per_worker`` tasks, and a background monitor pings idle
+workers every ``health_interval`` seconds, replacing any that do not
+answer. Workers that crash fail their task; a task whose caller gives up
+(e.g. on a timeout) gets its worker killed, since a busy CLI cannot be
+interrupted any other way.
+
+Workers are plain ``subprocess.Popen`` processes read by threads, so pools
+outlive the event loop of any single ``asyncio.run`` call.
+"""
+
+import asyncio
+import dataclasses
+import functools
+import itertools
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from .backends import TaskPayload
+
+logger = logging.getLogger(__name__)
+
+SUBPROCESS = "subprocess"
+
+# Command line of the bundled echo worker.
+ECHO_WORKER = (sys.executable, str(Path(__file__).with_name("echo_worker.py")))
+
+DEFAULT_MAX_TASKS_PER_WORKER = 100
+DEFAULT_IDLE_TIMEOUT = 60.0
+DEFAULT_HEALTH_INTERVAL = 5.0
+DEFAULT_HEALTH_TIMEOUT = 2.0
+
+# Called with (ok, result or exception) when a request is answered.
+Callback = Callable[[bool, Any], None]
+
+
+class WorkerError(RuntimeError):
+    """A worker reported a task failure, or died before answering."""
+
+
+class AgentWorker:
+    """One long-lived worker subprocess."""
+
+    def __init__(self, role: str, command: Sequence[str]):
+        self.role = role
+        self.process = subprocess.Popen(
+            list(command),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+        )
+        stdin, stdout = self.process.stdin, self.process.stdout
+        assert stdin is not None and stdout is not None
+        self._stdin: IO[str] = stdin
+        self._stdout: IO[str] = stdout
+        self.tasks_run = 0
+        self.last_used = time.monotonic()
+        self._ids = itertools.count(1)
+        self._waiters: Dict[int, Callback] = {}
+        self._lock = threading.Lock()
+        self._reader = threading.Thread(
+            target=self._read, name=f"agent-worker-{role}-{self.pid}", daemon=True
+        )
+        self._reader.start()
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def request(self, message: Dict[str, Any], callback: Callback) -> None:
+        """Send ``message``; ``callback`` runs on a reader thread when answered."""
+        with self._lock:
+            request_id = next(self._ids)
+            self._waiters[request_id] = callback
+        line = json.dumps({"id": request_id, **message}, default=str)
+        try:
+            self._stdin.write(line + "\n")
+            self._stdin.flush()
+        except (OSError, ValueError) as e:
+            # Broken pipe or closed stdin: the worker is gone.
+            self._settle(request_id, False, WorkerError(f"Worker {self.pid}: {e}"))
+
+    def ping(self, timeout: float) -> bool:
+        """Round-trip a ping; False if the worker does not answer in time."""
+        answered = threading.Event()
+        outcome: List[bool] = []
+
+        def pong(ok: bool, value: Any) -> None:
+            outcome.append(ok and value == "pong")
+            answered.set()
+
+        self.request({"type": "ping"}, pong)
+        return answered.wait(timeout) and outcome[0]
+
+    def _read(self) -> None:
+        for line in self._stdout:
+            try:
+                message = json.loads(line)
+            except ValueError:
+                logger.warning(f"Worker {self.pid} wrote a non-JSON line: {line!r}")
+                continue
+            if message.get("ok"):
+                self._settle(message.get("id"), True, message.get("result"))
+            else:
+                error = WorkerError(message.get("error", "Worker reported an error"))
+                self._settle(message.get("id"), False, error)
+        # End of output: the worker exited. Fail whatever it still owed.
+        returncode = self.process.wait()
+        with self._lock:
+            waiters, self._waiters = self._waiters, {}
+        for callback in waiters.values():
+            callback(False, WorkerError(f"Worker {self.pid} exited ({returncode})"))
+
+    def _settle(self, request_id: Any, ok: bool, value: Any) -> None:
+        with self._lock:
+            callback = self._waiters.pop(request_id, None)
+        if callback is not None:
+            callback(ok, value)
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Ask the worker to exit (EOF on stdin), killing it if it lingers."""
+        try:
+            self._stdin.close()
+        except OSError:
+            pass
+        try:
+            self.process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            self.kill()
+
+    def kill(self) -> None:
+        if self.alive:
+            self.process.kill()
+        self.process.wait()
+
+
+class Ticket:
+    """Handle on a submitted request, used to cancel it."""
+
+    def __init__(self, pool: "WorkerPool", message: Dict[str, Any], callback: Callback):
+        self.pool = pool
+        self.message = message
+        self.callback = callback
+        self.worker: Optional[AgentWorker] = None
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.pool.cancel(self)
+
+
+class WorkerPool:
+    """Autosized pool of workers for one role, one task per worker at a time."""
+
+    def __init__(
+        self,
+        role: str,
+        command: Sequence[str],
+        min_workers: int = 1,
+        max_workers: Optional[int] = None,
+        max_tasks_per_worker: int = DEFAULT_MAX_TASKS_PER_WORKER,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    ):
+        max_workers = _check_bounds(min_workers, max_workers, max_tasks_per_worker)
+        self.role = role
+        self.command = tuple(command)
+        self.min_workers = min_workers
+        self.max_workers = max_workers
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        # Most recently used last, so busy periods reuse warm workers and
+        # the rest age out.
+        self._idle: List[AgentWorker] = []
+        self._busy: Dict[AgentWorker, Ticket] = {}
+        # Workers taken out of rotation for a health check.
+        self._checking: List[AgentWorker] = []
+        self._queue: Deque[Ticket] = deque()
+        self.closed = False
+        self.stats_counts = {
+            "spawned": 0,
+            "recycled": 0,
+            "crashed": 0,
+            "unhealthy": 0,
+            "reaped": 0,
+            "tasks": 0,
+        }
+
+    @property
+    def size(self) -> int:
+        return len(self._idle) + len(self._busy) + len(self._checking)
+
+    def submit(self, message: Dict[str, Any], callback: Callback) -> Ticket:
+        """Queue a request; ``callback`` gets the worker's answer."""
+        ticket = Ticket(self, message, callback)
+        with self._lock:
+            if self.closed:
+                raise WorkerError(f"Worker pool for {self.role} is shut down")
+            self._queue.append(ticket)
+        self._dispatch()
+        return ticket
+
+    def _spawn(self) -> AgentWorker:
+        worker = AgentWorker(self.role, self.command)
+        self.stats_counts["spawned"] += 1
+        logger.debug(f"Started {self.role} worker {worker.pid}")
+        return worker
+
+    def _dispatch(self) -> None:
+        assignments: List[Tuple[AgentWorker, Ticket]] = []
+        failures: List[Tuple[Ticket, Exception]] = []
+        with self._lock:
+            while self._queue:
+                worker = None
+                while self._idle and worker is None:
+                    candidate = self._idle.pop()
+                    if candidate.alive:
+                        worker = candidate
+                    else:
+                        self.stats_counts["crashed"] += 1
+                if worker is None and self.size < self.max_workers:
+                    try:
+                        worker = self._spawn()
+                    except OSError as e:
+                        failures.append((self._queue.popleft(), e))
+                        continue
+                if worker is None:
+                    break
+                ticket = self._queue.popleft()
+                ticket.worker = worker
+                self._busy[worker] = ticket
+                assignments.append((worker, ticket))
+        for ticket, error in failures:
+            ticket.callback(
+                False, WorkerError(f"Cannot start {self.role} worker: {error}")
+            )
+        for worker, ticket in assignments:
+            worker.request(
+                ticket.message, functools.partial(self._done, worker, ticket)
+            )
+
+    def _done(self, worker: AgentWorker, ticket: Ticket, ok: bool, value: Any) -> None:
+        retire = None
+        with self._lock:
+            self._busy.pop(worker, None)
+            worker.tasks_run += 1
+            worker.last_used = time.monotonic()
+            self.stats_counts["tasks"] += 1
+            if not worker.alive:
+                if not ticket.cancelled:
+                    self.stats_counts["crashed"] += 1
+            elif self.closed:
+                retire = worker
+            elif worker.tasks_run >= self.max_tasks_per_worker:
+                retire = worker
+                self.stats_counts["recycled"] += 1
+            else:
+                self._idle.append(worker)
+        if retire is not None:
+            retire.close()
+        if not ticket.cancelled:
+            ticket.callback(ok, value)
+        self._dispatch()
+
+    def cancel(self, ticket: Ticket) -> None:
+        """Drop a queued request, or kill the worker running it."""
+        with self._lock:
+            if ticket.cancelled:
+                return
+            ticket.cancelled = True
+            if ticket in self._queue:
+                self._queue.remove(ticket)
+                return
+            worker = ticket.worker
+            if worker is not None and self._busy.get(worker) is ticket:
+                logger.info(f"Killing {self.role} worker {worker.pid}: task abandoned")
+                # Its reader sees EOF and settles the request through _done.
+                worker.process.kill()
+
+    def maintain(self, health_timeout: float = DEFAULT_HEALTH_TIMEOUT) -> None:
+        """Health-check idle workers, stop surplus idle ones, keep the minimum."""
+        now = time.monotonic()
+        with self._lock:
+            if self.closed:
+                return
+            checking, self._idle = self._idle, []
+            self._checking.extend(checking)
+        healthy: List[AgentWorker] = []
+        stop: List[AgentWorker] = []
+        for worker in checking:
+            if not worker.alive or not worker.ping(health_timeout):
+                logger.warning(f"{self.role} worker {worker.pid} failed health check")
+                self.stats_counts["unhealthy"] += 1
+                worker.kill()
+            else:
+                healthy.append(worker)
+        with self._lock:
+            for worker in checking:
+                self._checking.remove(worker)
+            self._idle.extend(healthy)
+            self._idle.sort(key=lambda w: w.last_used)
+            # Shrink: stop the longest-idle workers beyond the minimum.
+            while (
+                self._idle
+                and not self._queue
+                and self.size > self.min_workers
+                and now - self._idle[0].last_used > self.idle_timeout
+            ):
+                stop.append(self._idle.pop(0))
+                self.stats_counts["reaped"] += 1
+        for worker in stop:
+            worker.close()
+        self.prewarm()
+
+    def prewarm(self) -> None:
+        """Start workers until the pool holds at least ``min_workers``."""
+        with self._lock:
+            while not self.closed and self.size < self.min_workers:
+                try:
+                    self._idle.insert(0, self._spawn())
+                except OSError as e:
+                    logger.warning(f"Cannot start {self.role} worker: {e}")
+                    break
+        self._dispatch()
+
+    def close(self) -> None:
+        """Stop every worker; queued and running requests fail."""
+        with self._lock:
+            self.closed = True
+            queued, self._queue = list(self._queue), deque()
+            idle, self._idle = self._idle, []
+            busy = list(self._busy)
+        for ticket in queued:
+            ticket.callback(False, WorkerError(f"Worker pool for {self.role} closed"))
+        for worker in idle:
+            worker.close()
+        for worker in busy:
+            worker.kill()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.size,
+                "idle": len(self._idle),
+                "busy": len(self._busy),
+                "queued": len(self._queue),
+                **self.stats_counts,
+            }
+
+
+class WorkerPoolBackend:
+    """Execution backend running each role's tasks on its worker pool."""
+
+    name = SUBPROCESS
+
+    def __init__(
+        self,
+        commands: Optional[Dict[str, Sequence[str]]] = None,
+        default_command: Optional[Sequence[str]] = ECHO_WORKER,
+        min_workers: int = 1,
+        max_workers: Optional[int] = None,
+        max_tasks_per_worker: int = DEFAULT_MAX_TASKS_PER_WORKER,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        health_interval: Optional[float] = DEFAULT_HEALTH_INTERVAL,
+        health_timeout: float = DEFAULT_HEALTH_TIMEOUT,
+    ):
+        """``commands`` maps role values to worker command lines; roles not
+        listed use ``default_command`` (the echo worker unless None)."""
+        _check_bounds(min_workers, max_workers, max_tasks_per_worker)
+        self.commands = {role: tuple(cmd) for role, cmd in (commands or {}).items()}
+        self.default_command = default_command
+        self.pool_options: Dict[str, Any] = {
+            "min_workers": min_workers,
+            "max_workers": max_workers,
+            "max_tasks_per_worker": max_tasks_per_worker,
+            "idle_timeout": idle_timeout,
+        }
+        self.health_interval = health_interval
+        self.health_timeout = health_timeout
+        self.pools: Dict[str, WorkerPool] = {}
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._monitor: Optional[threading.Thread] = None
+
+    def pool(self, role: str) -> WorkerPool:
+        """Worker pool for ``role`` (created and prewarmed on first use)."""
+        with self._lock:
+            pool = self.pools.get(role)
+            if pool is None:
+                command = self.commands.get(role, self.default_command)
+                if command is None:
+                    raise ValueError(f"No worker command for role {role}")
+                pool = WorkerPool(role, command, **self.pool_options)
+                self.pools[role] = pool
+                created = True
+            else:
+                created = False
+            if self._monitor is None and self.health_interval:
+                self._monitor = threading.Thread(
+                    target=self._maintain, name="agent-worker-monitor", daemon=True
+                )
+                self._monitor.start()
+        if created:
+            pool.prewarm()
+        return pool
+
+    def submit(self, payload: "TaskPayload") -> "asyncio.Future[Dict[str, Any]]":
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def settle(ok: bool, value: Any) -> None:
+            # Runs on a worker's reader thread; the loop may be gone.
+            if not loop.is_closed():
+                try:
+                    loop.call_soon_threadsafe(_resolve, future, ok, value)
+                except RuntimeError:
+                    pass
+
+        message = {"type": "task", "payload": dataclasses.asdict(payload)}
+        ticket = self.pool(payload.agent).submit(message, settle)
+        future.add_done_callback(lambda f: ticket.cancel() if f.cancelled() else None)
+        return future
+
+    def _maintain(self) -> None:
+        while not self._stopping.wait(self.health_interval):
+            for pool in list(self.pools.values()):
+                try:
+                    pool.maintain(self.health_timeout)
+                except Exception as e:
+                    logger.warning(f"Maintaining {pool.role} workers failed: {e}")
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {role: pool.stats() for role, pool in self.pools.items()}
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the monitor and every worker."""
+        self._stopping.set()
+        if self._monitor is not None and wait:
+            self._monitor.join()
+        self._monitor = None
+        for pool in self.pools.values():
+            pool.close()
+        self.pools = {}
+        self._stopping = threading.Event()
+
+
+def _check_bounds(
+    min_workers: int, max_workers: Optional[int], max_tasks_per_worker: int
+) -> int:
+    max_workers = max_workers or os.cpu_count() or 1
+    if not 0 <= min_workers <= max_workers:
+        raise ValueError("Worker bounds must satisfy 0 <= min_workers <= max_workers")
+    if max_tasks_per_worker < 1:
+        raise ValueError("max_tasks_per_worker must be at least 1")
+    return max_workers
+
+
+def _resolve(future: asyncio.Future, ok: bool, value: Any) -> None:
+    if future.done():
+        return
+    if ok:
+        future.set_result(value)
+    else:
+        future.set_exception(value)
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Task Assignment
+
+Scores task descriptions against agent roles with BM25 and assigns each task
+to its best-scoring role. Every role is a document made of its name and its
+instruction file's scope and Core Responsibilities, plus a field of boosted
+seed keywords; a task description is the query.
+
+Term weights are computed once per assigner as a (terms x roles) matrix, so
+scoring a batch is a gather and a per-role ``bincount`` over the batch's term
+ids with NumPy installed, or a postings-list walk in pure Python otherwise.
+Ties (including tasks that match no role at all) go to the least-loaded
+candidate, counting both the current queue load and the tasks assigned
+earlier in the same batch.
+"""
+
+import math
+import re
+from collections import Counter
+from itertools import chain
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+# Seed vocabulary per role value, carried over from the original keyword
+# rules and extended to the roles those rules never selected.
+ROLE_KEYWORDS: Dict[str, Sequence[str]] = {
+    "planner": ("plan", "decompose", "breakdown", "roadmap"),
+    "tester": ("test", "validate", "verify", "coverage"),
+    "debugger": ("debug", "fix", "bug", "error", "failure"),
+    "deployer": ("deploy", "production", "release", "rollout"),
+    "systems_engineer": ("architecture", "design", "system", "performance"),
+    "devops_specialist": ("ci", "pipeline", "infrastructure", "container"),
+    "orchestrator": ("coordinate", "integrate", "orchestrate"),
+}
+
+# Weight of a seed keyword match, on the scale of a saturated BM25 term
+# frequency (k1 + 1), so seeds outrank incidental instruction-file wording.
+KEYWORD_BOOST = 5.0
+
+# Distinct words whose stems are memoized per assigner.
+WORD_CACHE_SIZE = 100_000
+
+_WORD = re.compile(r"[a-z0-9]+")
+# Batches are tokenized in one pass: the descriptions are joined by a NUL
+# word (mapped to _SEPARATOR between rows), encoded, and every ASCII byte
+# outside [a-z0-9] is translated to a space before a bytes split.
+_KEEP = set(b"abcdefghijklmnopqrstuvwxyz0123456789\x00") | set(range(128, 256))
+_BATCH_TABLE = bytes(c if c in _KEEP else ord(" ") for c in range(256))
+_SEPARATOR = -2
+_SUFFIXES = (
+    "ations",
+    "ation",
+    "ition",
+    "ments",
+    "ment",
+    "ings",
+    "ing",
+    "ions",
+    "ion",
+    "ers",
+    "er",
+    "ates",
+    "ate",
+    "es",
+    "ed",
+    "s",
+    "e",
+)
+
+
+def stem(word: str) -> str:
+    """Crude suffix stripping: ``testing``, ``tests`` and ``tester`` -> ``test``."""
+    for suffix in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            if suffix == "s" and word.endswith("ss"):
+                break
+            word = word[: -len(suffix)]
+            break
+    if len(word) > 3 and word[-1] == word[-2] and word[-1] not in "ls":
+        word = word[:-1]  # planning -> plann -> plan
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    return [stem(word) for word in _WORD.findall(text.lower())]
+
+
+class _WordIds(dict):
+    """Raw (encoded) word -> term id, -1 if unknown; stems each word once."""
+
+    def __init__(self, term_ids: Dict[str, int]):
+        super().__init__()
+        self.term_ids = term_ids
+        self[b"\x00"] = _SEPARATOR
+
+    def __missing__(self, word: bytes) -> int:
+        if len(self) >= WORD_CACHE_SIZE:
+            self.clear()
+            self[b"\x00"] = _SEPARATOR
+        terms = tokenize(word.decode(errors="ignore"))
+        term_id = self.term_ids.get(terms[0], -1) if len(terms) == 1 else -1
+        self[word] = term_id
+        return term_id
+
+
+class TaskAssigner:
+    """BM25 matcher from task descriptions to roles."""
+
+    def __init__(
+        self,
+        documents: Dict[Any, str],
+        keywords: Optional[Mapping[Any, Iterable[str]]] = None,
+        k1: float = 1.5,
+        b: float = 0.75,
+        vectorized: Optional[bool] = None,
+    ):
+        if vectorized and np is None:
+            raise ValueError("vectorized assignment requires numpy")
+        self.vectorized = np is not None if vectorized is None else vectorized
+        self.roles = list(documents)
+        keywords = keywords or {}
+        term_counts = [Counter(tokenize(documents[role])) for role in self.roles]
+        keyword_terms = [
+            {term for keyword in keywords.get(role, ()) for term in tokenize(keyword)}
+            for role in self.roles
+        ]
+
+        self.term_ids: Dict[str, int] = {}
+        for terms, seeded in zip(term_counts, keyword_terms):
+            for term in chain(terms, sorted(seeded)):
+                self.term_ids.setdefault(term, len(self.term_ids))
+
+        lengths = [sum(terms.values()) for terms in term_counts]
+        average = sum(lengths) / len(lengths) if lengths else 0.0
+        n_roles = len(self.roles)
+        weights_by_term: List[Dict[int, float]] = [{} for _ in self.term_ids]
+        for column, (terms, seeded) in enumerate(zip(term_counts, keyword_terms)):
+            norm = k1 * (1 - b + b * lengths[column] / average) if average else k1
+            for term, tf in terms.items():
+                weights_by_term[self.term_ids[term]][column] = (
+                    tf * (k1 + 1) / (tf + norm)
+                )
+            for term in seeded:
+                weights = weights_by_term[self.term_ids[term]]
+                weights[column] = weights.get(column, 0.0) + KEYWORD_BOOST
+        # term id -> [(role column, weight)]
+        self.postings: List[List[Tuple[int, float]]] = []
+        for weights in weights_by_term:
+            df = len(weights)
+            idf = math.log(1 + (n_roles - df + 0.5) / (df + 0.5))
+            self.postings.append(
+                [(column, weight * idf) for column, weight in weights.items()]
+            )
+
+        self._weights: Optional["np.ndarray"] = None
+        if self.vectorized:
+            self._weights = np.zeros((len(self.term_ids), n_roles))
+            for term_id, posting in enumerate(self.postings):
+                for column, weight in posting:
+                    self._weights[term_id, column] = weight
+        self._word_ids = _WordIds(self.term_ids)
+
+    def _batch_term_ids(self, descriptions: Sequence[str]) -> Iterator[int]:
+        """Term ids of all descriptions (-1 if unknown), rows separated."""
+        text = " \x00 ".join(descriptions)
+        if text.count("\x00") != len(descriptions) - 1:
+            text = " \x00 ".join(d.replace("\x00", " ") for d in descriptions)
+        words = text.lower().encode().translate(_BATCH_TABLE).split()
+        return map(self._word_ids.__getitem__, words)
+
+    def score(self, descriptions: Sequence[str]) -> List[List[float]]:
+        """BM25 score of every description against every role."""
+        if not descriptions:
+            return []
+        scores = self._scores(descriptions)
+        rows: List[List[float]] = scores.tolist() if self.vectorized else scores
+        return rows
+
+    def _scores(self, descriptions: Sequence[str]) -> Any:
+        """Score rows as an array when vectorized, else as lists."""
+        term_ids = self._batch_term_ids(descriptions)
+        n_roles = len(self.roles)
+        if self._weights is None:
+            postings = self.postings
+            scores: List[List[float]] = []
+            row = [0.0] * n_roles
+            for term_id in term_ids:
+                if term_id >= 0:
+                    for column, weight in postings[term_id]:
+                        row[column] += weight
+                elif term_id == _SEPARATOR:
+                    scores.append(row)
+                    row = [0.0] * n_roles
+            scores.append(row)
+            return scores
+
+        ids = np.fromiter(term_ids, dtype=np.intp)
+        rows = np.cumsum(ids == _SEPARATOR)
+        known = ids >= 0
+        gathered = self._weights[ids[known]]
+        rows = rows[known]
+        matrix = np.empty((len(descriptions), n_roles))
+        for column in range(n_roles):
+            matrix[:, column] = np.bincount(
+                rows, weights=gathered[:, column], minlength=len(descriptions)
+            )
+        return matrix
+
+    def assign(
+        self,
+        descriptions: Sequence[str],
+        available: Optional[Sequence[Any]] = None,
+        loads: Optional[Dict[Any, float]] = None,
+    ) -> List[Any]:
+        """Best role in ``available`` (default: all roles) per description.
+
+        ``loads`` is the current queue load per role; ties go to the least
+        loaded role, then to the one listed first in ``available``.
+        """
+        candidates = list(self.roles if available is None else available)
+        if not candidates:
+            raise ValueError("No agents available for assignment")
+        unknown = [role for role in candidates if role not in self.roles]
+        if unknown:
+            raise ValueError(f"Unknown roles for assignment: {unknown}")
+        if not descriptions:
+            return []
+        columns = [self.roles.index(role) for role in candidates]
+        load = [float((loads or {}).get(role, 0)) for role in candidates]
+
+        scores = self._scores(descriptions)
+        if self.vectorized:
+            scores = scores[:, columns]
+            best = scores.max(axis=1)
+            tied_mask = (scores == best[:, None]).sum(axis=1) > 1
+            choice = scores.argmax(axis=1)
+            counts = np.bincount(choice[~tied_mask], minlength=len(candidates))
+            load = [value + count for value, count in zip(load, counts.tolist())]
+            tied = np.flatnonzero(tied_mask).tolist()
+            tied_rows = scores[tied_mask].tolist()
+            choice = choice.tolist()
+        else:
+            choice, tied, tied_rows = [], [], []
+            remap = columns != list(range(len(self.roles)))
+            for index, row in enumerate(scores):
+                if remap:
+                    row = [row[column] for column in columns]
+                best = max(row)
+                position = row.index(best)
+                choice.append(position)
+                if row.count(best) > 1:
+                    tied.append(index)
+                    tied_rows.append(row)
+                else:
+                    load[position] += 1
+
+        for index, row in zip(tied, tied_rows):
+            best = max(row)
+            position = min(
+                (p for p, value in enumerate(row) if value == best),
+                key=lambda p: (load[p], p),
+            )
+            choice[index] = position
+            load[position] += 1
+        return [candidates[position] for position in choice]
+
+    @classmethod
+    def for_roles(
+        cls, roles: Iterable[Any], capability_index: Any = None, **kwargs: Any
+    ) -> "TaskAssigner":
+        """Assigner for role enum members, described by a capability index."""
+        documents, keywords = {}, {}
+        for role in roles:
+            parts = [role.value.replace("_", " ")]
+            if capability_index is not None:
+                parts.append(capability_index.scope(role.value))
+                parts.extend(capability_index.get(role.value) or [])
+            documents[role] = "\n".join(parts)
+            keywords[role] = ROLE_KEYWORDS.get(role.value, ())
+        return cls(documents, keywords, **kwargs)
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Execution Backends
+
+Where agent task work runs for :class:`AgentCoordinator`:
+
+- ``inline``: on the event loop itself (the default).
+- ``thread``: in a ``ThreadPoolExecutor``, for blocking I/O-bound work.
+- ``process``: in a ``ProcessPoolExecutor``, for CPU-bound work (static
+  analysis, log parsing) that would otherwise serialize on the GIL.
+- ``subprocess``: on long-lived agent worker subprocesses, one pool per
+  role (see :mod:`agent_workers`), for agents that are external CLIs.
+
+Any object with a ``name``, ``submit(payload)`` returning an awaitable and
+``shutdown(wait)`` can serve as a backend (:class:`AgentBackend`).
+
+Work crosses the executor boundary as a :class:`TaskPayload` handed to a
+module-level task function, both of which pickle by reference. Payloads
+submitted in the same event-loop tick are batched into chunks, so thousands
+of small tasks cost a handful of executor round trips instead of one each.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import time
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+)
+
+from .agent_workers import SUBPROCESS, WorkerPoolBackend
+
+if TYPE_CHECKING:
+    from .multi_agent_solver import Task
+
+logger = logging.getLogger(__name__)
+
+INLINE = "inline"
+THREAD = "thread"
+PROCESS = "process"
+BACKENDS = (INLINE, THREAD, PROCESS, SUBPROCESS)
+
+# Simulated agent processing time until real agents are invoked.
+SIMULATED_TASK_SECONDS = 0.1
+
+# Upper bound on payloads per executor job when chunking automatically.
+MAX_AUTO_CHUNK = 32
+
+TaskFn = Callable[["TaskPayload"], Dict[str, Any]]
+# Payloads of one executor job with the futures awaiting their results.
+_Chunk = List[Tuple["TaskPayload", "asyncio.Future[Dict[str, Any]]"]]
+
+
+@dataclass(frozen=True)
+class TaskPayload:
+    """Picklable snapshot of a task, as handed to a task function."""
+
+    task_id: str
+    description: str
+    agent: str
+    dependencies: Tuple[str, ...] = ()
+    # Wall-clock time (``time.time()``) after which the result is unwanted.
+    deadline: Optional[float] = None
+
+    @classmethod
+    def from_task(cls, task: "Task", deadline: Optional[float] = None) -> "TaskPayload":
+        return cls(
+            task_id=task.task_id,
+            description=task.description,
+            agent=task.assigned_agent.value,
+            dependencies=tuple(task.dependencies),
+            deadline=deadline,
+        )
+
+
+class AgentBackend(Protocol):
+    """Where :class:`AgentCoordinator` sends task payloads."""
+
+    name: str
+
+    def submit(self, payload: TaskPayload) -> Awaitable[Dict[str, Any]]: ...
+
+    def shutdown(self, wait: bool = True) -> None: ...
+
+
+def task_result(payload: TaskPayload) -> Dict[str, Any]:
+    """Result record for a finished task."""
+    return {
+        "agent": payload.agent,
+        "task": payload.description,
+        "result": f"Completed {payload.description}",
+        "confidence": 0.9,
+        "timestamp": time.time(),
+    }
+
+
+def execute_task_payload(payload: TaskPayload) -> Dict[str, Any]:
+    """Default task function: simulate agent execution."""
+    # In practice, this would invoke the actual agent
+    time.sleep(SIMULATED_TASK_SECONDS)
+    return task_result(payload)
+
+
+def _execute_chunk(
+    task_fn: TaskFn, payloads: List[TaskPayload]
+) -> List[Tuple[bool, Any]]:
+    # One failing payload must not fail the rest of its chunk.
+    outcomes: List[Tuple[bool, Any]] = []
+    for payload in payloads:
+        if payload.deadline is not None and time.time() >= payload.deadline:
+            # Its caller has given up waiting; don't start the work.
+            outcomes.append(
+                (False, TimeoutError(f"Deadline passed: {payload.task_id}"))
+            )
+            continue
+        try:
+            outcomes.append((True, task_fn(payload)))
+        except Exception as e:
+            outcomes.append((False, e))
+    return outcomes
+
+
+class InlineBackend:
+    """Runs task functions on the event loop.
+
+    Without a task function, execution is simulated with ``asyncio.sleep`` so
+    concurrent tasks overlap.
+    """
+
+    name = INLINE
+
+    def __init__(self, task_fn: Optional[TaskFn] = None):
+        self.task_fn = task_fn
+
+    def submit(self, payload: TaskPayload) -> "asyncio.Future[Dict[str, Any]]":
+        return asyncio.ensure_future(self._run(payload))
+
+    async def _run(self, payload: TaskPayload) -> Dict[str, Any]:
+        if self.task_fn is None:
+            await asyncio.sleep(SIMULATED_TASK_SECONDS)
+            return task_result(payload)
+        return self.task_fn(payload)
+
+    def shutdown(self, wait: bool = True) -> None:
+        pass
+
+
+class ExecutorBackend:
+    """Dispatches task functions to a thread or process pool in chunks."""
+
+    def __init__(
+        self,
+        name: str,
+        task_fn: Optional[TaskFn] = None,
+        max_workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ):
+        if name not in (THREAD, PROCESS):
+            raise ValueError(f"Unknown executor backend: {name}")
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.name = name
+        self.task_fn = task_fn or execute_task_payload
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.chunks_submitted = 0
+        self._executor: Optional[Executor] = None
+        self._pending: _Chunk = []
+        self._flush_scheduled = False
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            if self.name == PROCESS:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="agent-task"
+                )
+        return self._executor
+
+    def submit(self, payload: TaskPayload) -> "asyncio.Future[Dict[str, Any]]":
+        """Queue a payload; it is sent with the rest of this tick's payloads."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((payload, future))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            loop.call_soon(self._flush)
+        return future
+
+    def _chunk_size_for(self, count: int) -> int:
+        if self.chunk_size:
+            return self.chunk_size
+        # Aim for a few chunks per worker so stragglers still balance out.
+        return max(1, min(MAX_AUTO_CHUNK, count // (self.max_workers * 4)))
+
+    def _flush(self) -> None:
+        self._flush_scheduled = False
+        pending = [(p, f) for p, f in self._pending if not f.cancelled()]
+        self._pending = []
+        if not pending:
+            return
+        loop = asyncio.get_running_loop()
+        size = self._chunk_size_for(len(pending))
+        for start in range(0, len(pending), size):
+            chunk = pending[start : start + size]
+            try:
+                job = self.executor.submit(
+                    _execute_chunk, self.task_fn, [payload for payload, _ in chunk]
+                )
+            except Exception as e:
+                # e.g. the pool was shut down or is broken
+                for _, future in chunk:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            self.chunks_submitted += 1
+            job.add_done_callback(functools.partial(self._on_job_done, loop, chunk))
+
+    def _on_job_done(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        chunk: _Chunk,
+        job: "Future[List[Tuple[bool, Any]]]",
+    ) -> None:
+        # Runs on an executor thread; the loop may be gone after shutdown.
+        if not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(self._resolve, job, chunk)
+            except RuntimeError:
+                pass
+
+    @staticmethod
+    def _resolve(job: "Future[List[Tuple[bool, Any]]]", chunk: _Chunk) -> None:
+        if job.cancelled():
+            for _, future in chunk:
+                future.cancel()
+            return
+        try:
+            outcomes = job.result()
+        except Exception as e:
+            # The whole job failed: unpicklable task function, dead worker...
+            outcomes = [(False, e)] * len(chunk)
+        for (_, future), (ok, value) in zip(chunk, outcomes):
+            if future.done():
+                continue
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the pool; queued chunks that have not started are cancelled."""
+        if self._executor is not None:
+            logger.info(f"Shutting down {self.name} backend")
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+
+def create_backend(
+    name: str = INLINE,
+    task_fn: Optional[TaskFn] = None,
+    max_workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> AgentBackend:
+    """Build the backend called ``name`` (one of :data:`BACKENDS`)."""
+    if name == INLINE:
+        return InlineBackend(task_fn)
+    if name in (THREAD, PROCESS):
+        return ExecutorBackend(name, task_fn, max_workers, chunk_size)
+    if name == SUBPROCESS:
+        if task_fn is not None:
+            raise ValueError("The subprocess backend runs worker commands, not task_fn")
+        return WorkerPoolBackend(max_workers=max_workers)
+    raise ValueError(f"Unknown execution backend: {name}")
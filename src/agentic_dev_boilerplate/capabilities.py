@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Agent Capability Index
+
+Parses the ``Core Responsibilities`` list and ``Role`` (scope) line of every
+``.github/instructions/<role>.instructions.md`` file once and indexes them by
+normalized role, so ``systems-engineer.instructions.md`` serves the
+``systems_engineer`` role.
+
+The index is memoized per process and persisted as JSON under the temp
+directory, keyed by each file's path, mtime and size. Checking it costs one
+``stat`` per file; only new or modified files are parsed again. Processes
+that share a workspace (e.g. workers of a process pool) load the persisted
+index instead of re-reading the instruction files.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .template_registry import normalize_role
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 2
+INSTRUCTIONS_SUFFIX = ".instructions.md"
+
+
+def extract_capabilities(content: str) -> List[str]:
+    """Extract the ``**Core Responsibilities**:`` bullet list."""
+    capabilities = []
+    lines = content.split("\n")
+    in_responsibilities = False
+
+    for line in lines:
+        if "**Core Responsibilities**:" in line:
+            in_responsibilities = True
+            continue
+        elif in_responsibilities and line.strip().startswith("- "):
+            capabilities.append(line.strip()[2:])
+        elif in_responsibilities and line.strip() and not line.startswith(" "):
+            break
+
+    return capabilities
+
+
+def extract_scope(content: str) -> str:
+    """Extract the ``**Role**:`` line describing the agent's scope."""
+    for line in content.split("\n"):
+        if line.strip().startswith("**Role**:"):
+            return line.split(":", 1)[1].strip()
+    return ""
+
+
+class CapabilityIndex:
+    """Capabilities per normalized role for one instructions directory."""
+
+    def __init__(self, instructions_dir: Path, files: Dict[str, Dict[str, Any]]):
+        self.instructions_dir = instructions_dir
+        # file name -> {"mtime_ns", "size", "role", "capabilities", "scope"}
+        self.files = files
+        self._by_role = {
+            entry["role"]: entry["capabilities"] for entry in files.values()
+        }
+        self._scopes: Dict[str, str] = {
+            entry["role"]: entry["scope"] for entry in files.values()
+        }
+
+    @property
+    def stats(self) -> Dict[str, Tuple[int, int]]:
+        return {name: (e["mtime_ns"], e["size"]) for name, e in self.files.items()}
+
+    def get(self, role: str) -> Optional[List[str]]:
+        """Capabilities for ``role`` (any spelling), or ``None``."""
+        return self._by_role.get(normalize_role(role))
+
+    def scope(self, role: str) -> str:
+        """The ``**Role**:`` description for ``role``, or ``""``."""
+        return self._scopes.get(normalize_role(role), "")
+
+    def roles(self) -> List[str]:
+        return sorted(self._by_role)
+
+    def resolve(self, roles: Iterable[Any]) -> Dict[Any, List[str]]:
+        """Map role enum members (by ``.value``) to their capabilities."""
+        resolved = {}
+        for role in roles:
+            capabilities = self.get(role.value)
+            if capabilities is not None:
+                resolved[role] = capabilities
+        return resolved
+
+    @classmethod
+    def build(
+        cls,
+        instructions_dir: Path,
+        stats: Dict[str, Tuple[int, int]],
+        previous: Optional["CapabilityIndex"] = None,
+    ) -> "CapabilityIndex":
+        """Index ``stats``' files, reusing unchanged entries of ``previous``."""
+        files = {}
+        parsed = 0
+        for name, (mtime_ns, size) in stats.items():
+            old = previous.files.get(name) if previous else None
+            if old and (old["mtime_ns"], old["size"]) == (mtime_ns, size):
+                files[name] = old
+                continue
+            try:
+                content = (instructions_dir / name).read_text()
+            except OSError as e:
+                logger.warning(f"Could not read {name}: {e}")
+                continue
+            parsed += 1
+            files[name] = {
+                "mtime_ns": mtime_ns,
+                "size": size,
+                "role": normalize_role(name[: -len(INSTRUCTIONS_SUFFIX)]),
+                "capabilities": extract_capabilities(content),
+                "scope": extract_scope(content),
+            }
+        if parsed:
+            logger.debug(f"Parsed {parsed} instruction files in {instructions_dir}")
+        return cls(instructions_dir, files)
+
+    def to_index(self) -> Dict[str, Any]:
+        return {"version": INDEX_VERSION, "files": self.files}
+
+    @classmethod
+    def from_index(
+        cls, instructions_dir: Path, index: Dict[str, Any]
+    ) -> Optional["CapabilityIndex"]:
+        if index.get("version") != INDEX_VERSION:
+            return None
+        return cls(instructions_dir, index["files"])
+
+
+def _instruction_stats(instructions_dir: Path) -> Dict[str, Tuple[int, int]]:
+    stats: Dict[str, Tuple[int, int]] = {}
+    try:
+        entries = list(os.scandir(instructions_dir))
+    except OSError:
+        return stats
+    for entry in entries:
+        if entry.name.endswith(INSTRUCTIONS_SUFFIX) and entry.is_file():
+            stat = entry.stat()
+            stats[entry.name] = (stat.st_mtime_ns, stat.st_size)
+    return stats
+
+
+# Indexes already built in this process, keyed by instructions directory.
+_indexes: Dict[Path, CapabilityIndex] = {}
+
+
+def _index_path(instructions_dir: Path) -> Path:
+    from .tmp_manager import get_tmp_manager
+
+    dir_hash = hashlib.sha256(str(instructions_dir).encode()).hexdigest()[:16]
+    index_dir = get_tmp_manager("agentic-dev-boilerplate").get_task_dir(
+        "capability-index"
+    )
+    return index_dir / f"{dir_hash}.json"
+
+
+def get_capability_index(
+    instructions_dir: Path, index_path: Optional[Path] = None
+) -> CapabilityIndex:
+    """Get the index for a directory, parsing only new or modified files."""
+    instructions_dir = Path(instructions_dir).resolve()
+    stats = _instruction_stats(instructions_dir)
+
+    cached = _indexes.get(instructions_dir)
+    if cached is not None and cached.stats == stats:
+        return cached
+
+    if index_path is None:
+        try:
+            index_path = _index_path(instructions_dir)
+        except OSError as e:
+            logger.warning(f"Capability index directory unavailable: {e}")
+
+    previous = cached
+    if previous is None and index_path is not None and index_path.exists():
+        try:
+            with open(index_path, "r") as f:
+                previous = CapabilityIndex.from_index(instructions_dir, json.load(f))
+        except (OSError, ValueError, KeyError, TypeError):
+            previous = None
+
+    if previous is not None and previous.stats == stats:
+        index = previous
+    else:
+        index = CapabilityIndex.build(instructions_dir, stats, previous)
+        if index_path is not None:
+            try:
+                with open(index_path, "w") as f:
+                    json.dump(index.to_index(), f)
+            except OSError as e:
+                logger.warning(f"Could not persist capability index: {e}")
+
+    _indexes[instructions_dir] = index
+    return index
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Consensus Engine
+
+Incremental, weighted consensus over a session's task results. The score is
+the weight-averaged ``confidence`` of all expected results, where each
+result's weight comes from its role and a failed task counts as confidence
+0. Consensus also needs a quorum: the share of total weight that must
+report successfully.
+
+Confidences lie in [0, 1], so after each result the final score is bounded
+by what is already known: outstanding results can add at most their weight
+and at least nothing. As soon as the lower bound reaches the threshold (and
+the quorum is met) consensus is guaranteed; as soon as the upper bound falls
+below it (or the quorum can no longer be met) consensus is impossible. With
+early termination enabled, the coordinator then cancels outstanding tasks
+instead of waiting for stragglers.
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ConsensusPolicy:
+    """How results are weighed and when a decision may be taken early."""
+
+    # Weight per role (default 1.0); a weight of 0 makes a role advisory.
+    weights: Dict[Any, float] = field(default_factory=dict)
+    # Fraction of total weight that must report successfully.
+    quorum: float = 0.0
+    # Cancel outstanding tasks once the outcome is decided.
+    early_termination: bool = False
+
+    def __post_init__(self) -> None:
+        if not 0.0 <= self.quorum <= 1.0:
+            raise ValueError("quorum must be between 0.0 and 1.0")
+        for role, weight in self.weights.items():
+            if weight < 0:
+                raise ValueError(f"Weight for {role} must not be negative")
+
+    def weight(self, role: Any) -> float:
+        return self.weights.get(role, 1.0)
+
+
+class ConsensusEngine:
+    """Tracks results as they arrive and decides as early as possible."""
+
+    def __init__(
+        self,
+        threshold: float,
+        expected: Iterable[Tuple[Hashable, Any]],
+        policy: Optional[ConsensusPolicy] = None,
+    ):
+        """``expected`` holds a ``(key, role)`` pair per result to wait for."""
+        self.threshold = threshold
+        self.policy = policy or ConsensusPolicy()
+        self._weights = {key: self.policy.weight(role) for key, role in expected}
+        self._unresolved = set(self._weights)
+        self.total_weight = sum(self._weights.values())
+        self.outstanding_weight = self.total_weight
+        self.reported_weight = 0.0
+        self.weighted_confidence = 0.0
+        self.reported = 0
+        self.failed = 0
+        self._decision: Optional[bool] = None
+        self.decided_early = False
+        # Monotonic times of creation and of the decision.
+        self.started_at = time.monotonic()
+        self.decided_at: Optional[float] = None
+
+    @property
+    def expected(self) -> int:
+        return len(self._weights)
+
+    @property
+    def outstanding(self) -> int:
+        return len(self._unresolved)
+
+    def observe(self, key: Hashable, confidence: float) -> Optional[bool]:
+        """Record a successful result; returns the decision, if any."""
+        weight = self._resolve(key)
+        confidence = min(max(float(confidence), 0.0), 1.0)
+        self.weighted_confidence += weight * confidence
+        self.reported_weight += weight
+        self.reported += 1
+        return self._evaluate()
+
+    def observe_failure(self, key: Hashable) -> Optional[bool]:
+        """Record a task that produced no result (confidence 0)."""
+        self._resolve(key)
+        self.failed += 1
+        return self._evaluate()
+
+    def fail_outstanding(self) -> Optional[bool]:
+        """Count every outstanding result as failed, e.g. after a cancel."""
+        for key in list(self._unresolved):
+            self._resolve(key)
+            self.failed += 1
+        return self._evaluate()
+
+    def _resolve(self, key: Hashable) -> float:
+        if key not in self._unresolved:
+            raise KeyError(f"Unexpected or duplicate result: {key}")
+        self._unresolved.discard(key)
+        weight = self._weights[key]
+        self.outstanding_weight -= weight
+        return weight
+
+    @property
+    def lower_bound(self) -> float:
+        """Final score if every outstanding result had confidence 0."""
+        if not self.total_weight:
+            return 0.0
+        return self.weighted_confidence / self.total_weight
+
+    @property
+    def upper_bound(self) -> float:
+        """Final score if every outstanding result had confidence 1."""
+        if not self.total_weight:
+            return 0.0
+        return (self.weighted_confidence + self.outstanding_weight) / self.total_weight
+
+    def _evaluate(self) -> Optional[bool]:
+        if self._decision is not None:
+            return self._decision
+        quorum = self.policy.quorum * self.total_weight
+        if self.lower_bound >= self.threshold and self.reported_weight >= quorum:
+            self._decide(True)
+        elif (
+            self.upper_bound < self.threshold
+            or self.reported_weight + self.outstanding_weight < quorum
+        ):
+            self._decide(False)
+        elif self.outstanding == 0:
+            # Only reachable with zero total weight (no bounds to compare).
+            self._decide(False)
+        return self._decision
+
+    def _decide(self, reached: bool) -> None:
+        self._decision = reached
+        self.decided_early = self.outstanding > 0
+        self.decided_at = time.monotonic()
+        if self.decided_early:
+            logger.info(
+                f"Consensus {'reached' if reached else 'unreachable'} with "
+                f"{self.outstanding} of {self.expected} results outstanding"
+            )
+
+    @property
+    def decision(self) -> Optional[bool]:
+        """``True``/``False`` once the outcome is certain, else ``None``."""
+        if self._decision is None and self.outstanding == 0:
+            self._evaluate()
+        return self._decision
+
+    @property
+    def should_stop(self) -> bool:
+        return self.policy.early_termination and self._decision is not None
+
+    def summary(self, participant_count: int) -> Dict[str, Any]:
+        reached = bool(self.decision)
+        return {
+            "consensus_reached": reached,
+            "average_confidence": (
+                self.weighted_confidence / self.reported_weight
+                if self.reported_weight
+                else 0
+            ),
+            "weighted_score_bounds": (self.lower_bound, self.upper_bound),
+            "participant_count": participant_count,
+            "results_reported": self.reported,
+            "results_failed": self.failed,
+            "results_expected": self.expected,
+            "decided_early": self.decided_early,
+            "recommendation": (
+                "Proceed with solution" if reached else "Require additional review"
+            ),
+        }
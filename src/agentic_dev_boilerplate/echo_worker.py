@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Echo Agent Worker
+
+A minimal long-lived agent worker speaking the line-delimited JSON protocol
+of :mod:`agent_workers`, for tests and benchmarks. Each request is one JSON
+object per line on stdin, answered by one line on stdout with the same
+``id``:
+
+    {"id": 1, "type": "ping"}                  -> {"id": 1, "ok": true, "result": "pong"}
+    {"id": 2, "type": "task", "payload": {...}} -> {"id": 2, "ok": true, "result": {...}}
+
+Task descriptions starting with ``fail`` are answered with an error,
+``crash`` exits the worker and ``hang`` never answers, so failure handling
+can be exercised without a real agent. Runs standalone (no package
+imports) to keep startup cheap.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+
+def handle(message: Dict[str, Any], delay: float) -> Dict[str, Any]:
+    if message.get("type") == "ping":
+        return {"ok": True, "result": "pong"}
+    payload = message["payload"]
+    description = payload["description"]
+    if description.startswith("crash"):
+        os._exit(1)
+    if description.startswith("hang"):
+        while True:
+            time.sleep(3600)
+    if delay:
+        time.sleep(delay)
+    if description.startswith("fail"):
+        return {"ok": False, "error": f"Echo worker refused: {description}"}
+    return {
+        "ok": True,
+        "result": {
+            "agent": payload["agent"],
+            "task": description,
+            "result": f"Completed {description}",
+            "confidence": 0.9,
+            "timestamp": time.time(),
+            "worker_pid": os.getpid(),
+        },
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Echo agent worker")
+    parser.add_argument(
+        "--delay", type=float, default=0.0, help="Seconds of simulated work per task"
+    )
+    args = parser.parse_args(argv)
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            message = json.loads(line)
+            response = handle(message, args.delay)
+        except (ValueError, KeyError, TypeError) as e:
+            message, response = {}, {"ok": False, "error": f"Bad request: {e}"}
+        response["id"] = message.get("id")
+        sys.stdout.write(json.dumps(response) + "\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,16 +5,25 @@ Agentic Development Boilerplate Generator
 Generates tailored development workflows and automations based on project schema.
 """
 
+import hashlib
 import json
 import os
 import shutil
+import time
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, ContextManager, Dict, List, Optional, Tuple, Union
 
 import click
 import yaml
 from jinja2 import Environment, FileSystemLoader
 
+from .output_plan import GenerationPlan, PlannedOutput
+from .profiling import MemoryProfiler, SamplingProfiler
+from .schema_loader import resolve_schema
+from .template_registry import AGENT, SCRIPT, get_template_registry
+from .tmp_manager import get_tmp_manager
+
 try:
     from chngbrgr import ChangelogGenerator
 except ImportError:
@@ -29,17 +38,41 @@ class BoilerplateGenerator:
         template_type: str = "default",
         fleet_pack: bool | None = None,
         fleet_pack_path: str | None = None,
+        profiler: Optional[MemoryProfiler] = None,
+        render_cache_dir: Optional[Path] = None,
     ):
         self.schema_path = Path(schema_path)
         self.output_dir = Path(output_dir) if output_dir else Path.cwd()
         self.template_type = template_type
-        self.schema = self.load_schema()
+        # Optional tracemalloc profiler; every generation step is one phase
+        self.profiler = profiler
+        with self._phase("load_schema"):
+            self.schema = self.load_schema()
         self.templates_dir = (
             Path(__file__).parent.parent.parent / "templates" / self.template_type
             if self.template_type != "default"
             else Path(__file__).parent.parent.parent / "templates"
         )
         self.jinja_env = Environment(loader=FileSystemLoader(str(self.templates_dir)))
+        # Role/script -> template lookups, scanned once per pack and persisted
+        self.templates = get_template_registry(self.templates_dir)
+        # Rendered output per (template, context) — shared by plan() and generate(),
+        # and persisted so a real run after --plan does not render again
+        self._render_cache: Dict[Tuple[str, str], str] = {}
+        self.render_cache_dir: Optional[Path] = None
+        try:
+            self.render_cache_dir = (
+                Path(render_cache_dir)
+                if render_cache_dir
+                else self._default_render_cache_dir()
+            )
+            self.render_cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            click.echo(f"⚠️ Render cache directory unavailable: {e}", err=True)
+            self.render_cache_dir = None
+        self.render_stats = {"hits": 0, "misses": 0}
+        # Collects outputs instead of writing them while plan() runs
+        self._planned: Optional[Dict[str, PlannedOutput]] = None
         # Prefer explicit CLI flag; else schema workflows.fleet_standards; default True
         # when CI is emitted so new projects get fleet-aware Actions.
         if fleet_pack is not None:
@@ -69,10 +102,18 @@ class BoilerplateGenerator:
             return workstation
         return pkg_pack
 
+    @staticmethod
+    def _default_render_cache_dir() -> Path:
+        """Render cache under the shared tmp manager (pruned with it)."""
+        return get_tmp_manager("agentic-dev-boilerplate").get_task_dir("render-cache")
+
     def load_schema(self) -> Dict[str, Any]:
-        """Load and validate the project schema."""
-        with open(self.schema_path, "r") as f:
-            schema = yaml.safe_load(f)
+        """Load and validate the project schema.
+
+        ``extends:`` and ``$ref`` links to other schema files are resolved and
+        deep-merged first; shared base schemas are cached per process.
+        """
+        schema = resolve_schema(self.schema_path)
 
         # Validate required fields
         required_fields = ["project", "languages", "agents", "workflows"]
@@ -91,21 +132,146 @@ class BoilerplateGenerator:
         )
 
         # Create output directory structure
-        self.create_directory_structure()
+        with self._phase("create_directory_structure"):
+            self.create_directory_structure()
 
+        self._generate_outputs()
+
+        click.echo("✅ Boilerplate generation complete!")
+
+    def plan(self) -> GenerationPlan:
+        """Compute every output and compare it with the workspace, writing nothing.
+
+        Rendered templates land in the render cache (kept on disk), so a
+        ``generate()`` afterwards, here or in a later run, only pays for the writes.
+        """
+        start = time.perf_counter()
+        self._planned = {}
+        try:
+            self._generate_outputs()
+            outputs = self._planned
+        finally:
+            self._planned = None
+        return GenerationPlan.build(
+            self.output_dir,
+            outputs,
+            elapsed=time.perf_counter() - start,
+            render_stats=dict(self.render_stats),
+        )
+
+    def _generate_outputs(self) -> None:
+        """Run every generation step; writes go through ``_emit``."""
         # Generate core components
-        self.generate_agent_instructions()
-        self.generate_prompts()
-        self.generate_github_workflows()
-        self.generate_scripts()
-        self.generate_task_tracking()
-        self.generate_ci_cd()
-        self.generate_git_config()
-        self.generate_documentation()
+        steps = [
+            "generate_agent_instructions",
+            "generate_prompts",
+            "generate_github_workflows",
+            "generate_scripts",
+            "generate_task_tracking",
+            "generate_ci_cd",
+            "generate_git_config",
+            "generate_documentation",
+        ]
         if self.fleet_pack:
-            self.inject_fleet_pack()
+            steps.append("inject_fleet_pack")
+
+        for step in steps:
+            with self._phase(step):
+                getattr(self, step)()
+
+    def _phase(self, name: str) -> ContextManager[None]:
+        """Profiling boundary for one generation step (no-op when not profiling)."""
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.phase(name)
+
+    def _echo(self, message: str) -> None:
+        """Progress output, silenced while planning."""
+        if self._planned is None:
+            click.echo(message)
+
+    def _render(self, template_name: str, **context: Any) -> str:
+        """Render a template with the schema, memoized on name and context."""
+        fingerprint = hashlib.sha256(
+            json.dumps([self.schema, context], sort_keys=True, default=str).encode()
+        ).hexdigest()
+        key = (template_name, fingerprint)
+        content = self._render_cache.get(key)
+        if content is None:
+            content = self._load_render(key)
+            if content is not None:
+                self._render_cache[key] = content
+        if content is None:
+            template = self.jinja_env.get_template(template_name)
+            content = template.render(schema=self.schema, **context)
+            self._render_cache[key] = content
+            self._store_render(key, content)
+            self.render_stats["misses"] += 1
+        else:
+            self.render_stats["hits"] += 1
+        return content
+
+    def _render_path(self, key: Tuple[str, str]) -> Optional[Path]:
+        """Disk cache file for a render; the pack signature covers template edits."""
+        if self.render_cache_dir is None:
+            return None
+        digest = hashlib.sha256(
+            "\0".join(
+                [str(self.templates_dir), self.templates.signature, *key]
+            ).encode()
+        ).hexdigest()
+        return self.render_cache_dir / f"{digest}.txt"
+
+    def _load_render(self, key: Tuple[str, str]) -> Optional[str]:
+        path = self._render_path(key)
+        if path is None:
+            return None
+        try:
+            return path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def _store_render(self, key: Tuple[str, str], content: str) -> None:
+        path = self._render_path(key)
+        if path is None:
+            return
+        # Write then rename, so a concurrent run never reads a partial file.
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(content, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+    def _emit(
+        self, rel_path: str, content: Union[str, bytes], mode: Optional[int] = None
+    ) -> None:
+        """Write one output file, or record it when planning."""
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        if self._planned is not None:
+            self._planned[rel_path] = PlannedOutput(rel_path, data, mode)
+            return
 
-        click.echo("✅ Boilerplate generation complete!")
+        output_path = self.output_dir / rel_path
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, "wb") as f:
+            f.write(data)
+        if mode is not None:
+            os.chmod(output_path, mode)
+
+    def _emit_copy(
+        self, rel_path: str, source: Path, mode: Optional[int] = None
+    ) -> None:
+        """Copy a static file into the output, or record it when planning."""
+        if self._planned is not None:
+            self._planned[rel_path] = PlannedOutput(rel_path, source.read_bytes(), mode)
+            return
+
+        dest = self.output_dir / rel_path
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(source, dest)
+        if mode is not None:
+            os.chmod(dest, mode)
 
     def inject_fleet_pack(self):
         """Copy fleet-standard workflows/docs into the generated project.
@@ -116,10 +282,10 @@ class BoilerplateGenerator:
 
         If the pack is missing, print a shell-out note instead of failing generation.
         """
-        click.echo("📦 Injecting fleet standards pack...")
+        self._echo("📦 Injecting fleet standards pack...")
         pack = self.fleet_pack_path
         if not pack.is_dir():
-            click.echo(
+            self._echo(
                 "⚠️  Fleet pack not found at "
                 f"{pack}. Shell out to apply later:\n"
                 "    bash /root/work/plans/fleet-standards/scripts/"
@@ -131,41 +297,34 @@ class BoilerplateGenerator:
 
         # Workflows
         src_wf = pack / ".github" / "workflows"
-        dst_wf = self.output_dir / ".github" / "workflows"
         if src_wf.is_dir():
-            dst_wf.mkdir(parents=True, exist_ok=True)
             for yml in sorted(src_wf.glob("*.yml")):
-                shutil.copy2(yml, dst_wf / yml.name)
-                click.echo(f"  + .github/workflows/{yml.name}")
+                self._emit_copy(f".github/workflows/{yml.name}", yml)
+                self._echo(f"  + .github/workflows/{yml.name}")
 
         # Docs
         src_docs = pack / "docs" / "FLEET_STANDARDS.md"
         if src_docs.is_file():
-            docs_dir = self.output_dir / "docs"
-            docs_dir.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src_docs, docs_dir / "FLEET_STANDARDS.md")
-            click.echo("  + docs/FLEET_STANDARDS.md")
+            self._emit_copy("docs/FLEET_STANDARDS.md", src_docs)
+            self._echo("  + docs/FLEET_STANDARDS.md")
 
         # Helper scripts
         src_scripts = pack / "scripts"
         if src_scripts.is_dir():
-            scripts_dir = self.output_dir / "scripts"
-            scripts_dir.mkdir(parents=True, exist_ok=True)
             for script in sorted(src_scripts.iterdir()):
                 if script.is_file():
-                    dest = scripts_dir / script.name
-                    shutil.copy2(script, dest)
-                    if script.suffix == ".sh":
-                        os.chmod(dest, 0o755)
-                    click.echo(f"  + scripts/{script.name}")
+                    self._emit_copy(
+                        f"scripts/{script.name}",
+                        script,
+                        0o755 if script.suffix == ".sh" else None,
+                    )
+                    self._echo(f"  + scripts/{script.name}")
 
         # Optional PR template
         src_pr = pack / ".github" / "PULL_REQUEST_TEMPLATE.md"
         if src_pr.is_file():
-            gh = self.output_dir / ".github"
-            gh.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src_pr, gh / "PULL_REQUEST_TEMPLATE.md")
-            click.echo("  + .github/PULL_REQUEST_TEMPLATE.md")
+            self._emit_copy(".github/PULL_REQUEST_TEMPLATE.md", src_pr)
+            self._echo("  + .github/PULL_REQUEST_TEMPLATE.md")
 
     def create_directory_structure(self):
         """Create the basic directory structure."""
@@ -186,125 +345,56 @@ class BoilerplateGenerator:
 
     def generate_agent_instructions(self):
         """Generate agent instruction files."""
-        click.echo("🤖 Generating agent instructions...")
-
-        # Define template mappings based on template type
-        if self.template_type == "bootdisk-agentic-structure":
-            agent_templates = {
-                "swe": "agent_swe_instructions.md.j2",
-                "test_engineer": "agent_test_engineer_instructions.md.j2",
-            }
-        else:
-            agent_templates = {
-                "planner": "agent_planner_instructions.md.j2",
-                "tester": "agent_tester_instructions.md.j2",
-                "debugger": "agent_debugger_instructions.md.j2",
-                "deployer": "agent_deployer_instructions.md.j2",
-                "systems-engineer": "agent_systems_engineer_instructions.md.j2",
-                "devops-specialist": "agent_devops_specialist_instructions.md.j2",
-                "orchestrator": "agent_orchestrator_instructions.md.j2",
-                "software-engineer": "agent_software_engineer_instructions.md.j2",
-                "ai-engineer": "agent_ai_engineer_instructions.md.j2",
-                "security": "agent_security_instructions.md.j2",
-                "api-developer": "agent_api_developer_instructions.md.j2",
-                "project-manager": "agent_project_manager_instructions.md.j2",
-                "frontend-developer": "frontend-developer.agent.md",
-                "backend-developer": "backend-developer.agent.md",
-                "fullstack-developer": "fullstack-developer.agent.md",
-                "mobile-developer": "mobile-developer.agent.md",
-                "data-scientist": "data-scientist.agent.md",
-                "ml-engineer": "ml-engineer.agent.md",
-            }
+        self._echo("🤖 Generating agent instructions...")
 
         for agent in self.schema.get("agents", []):
             if not agent.get("enabled", True):
                 continue
 
             role = agent["role"]
-            if role in agent_templates:
-                template = self.jinja_env.get_template(agent_templates[role])
-                content = template.render(schema=self.schema, agent=agent)
-
-                output_path = (
-                    self.output_dir
-                    / ".github"
-                    / "instructions"
-                    / f"{role}.instructions.md"
-                )
-                with open(output_path, "w") as f:
-                    f.write(content)
+            entry = self.templates.get(AGENT, role)
+            if entry is None:
+                continue
+            path = entry.output_path(role=role)
+            if path is not None:
+                content = self._render(entry.name, agent=agent)
+                self._emit(path, content, entry.mode)
 
     def generate_prompts(self):
         """Generate reusable prompt templates."""
-        click.echo("📝 Skipping prompt templates (not implemented)...")
+        self._echo("📝 Skipping prompt templates (not implemented)...")
         # TODO: Implement prompt template generation
         pass
 
     def generate_github_workflows(self):
         """Generate GitHub Actions workflows."""
-        click.echo("🔄 Generating GitHub Actions workflows...")
+        self._echo("🔄 Generating GitHub Actions workflows...")
 
         if self.schema.get("workflows", {}).get("pr_automation"):
-            template = self.jinja_env.get_template("workflow_pr_automation.yml.j2")
-            content = template.render(schema=self.schema)
-
-            output_path = (
-                self.output_dir / ".github" / "workflows" / "pr-automation.yml"
-            )
-            with open(output_path, "w") as f:
-                f.write(content)
+            content = self._render("workflow_pr_automation.yml.j2")
+            self._emit(".github/workflows/pr-automation.yml", content)
 
         if self.schema.get("workflows", {}).get("ci_cd"):
-            template = self.jinja_env.get_template("workflow_ci_cd.yml.j2")
-            content = template.render(schema=self.schema)
-
-            output_path = self.output_dir / ".github" / "workflows" / "ci-cd.yml"
-            with open(output_path, "w") as f:
-                f.write(content)
+            content = self._render("workflow_ci_cd.yml.j2")
+            self._emit(".github/workflows/ci-cd.yml", content)
 
         if self.schema.get("workflows", {}).get("multi_agent_coordination"):
-            template = self.jinja_env.get_template("workflow_agent_coordination.yml.j2")
-            content = template.render(schema=self.schema)
-
-            output_path = (
-                self.output_dir / ".github" / "workflows" / "agent-coordination.yml"
-            )
-            with open(output_path, "w") as f:
-                f.write(content)
+            content = self._render("workflow_agent_coordination.yml.j2")
+            self._emit(".github/workflows/agent-coordination.yml", content)
 
     def generate_scripts(self):
         """Generate utility scripts."""
-        click.echo("🛠️ Generating utility scripts...")
-
-        scripts = [
-            "create_pr_local.py",
-            "git_setup.py",
-            "validate_project.py",
-            "setup_gpg.py",
-            "setup_uv.py",
-            "multi_agent_solver.py",
-        ]
-
-        for script_file in scripts:
-            template_name = f"script_{script_file}.j2"
-            try:
-                template = self.jinja_env.get_template(template_name)
-                content = template.render(schema=self.schema)
-
-                output_path = self.output_dir / "scripts" / script_file
-                with open(output_path, "w") as f:
-                    f.write(content)
+        self._echo("🛠️ Generating utility scripts...")
 
-                # Make scripts executable
-                os.chmod(output_path, 0o755)
-            except Exception as e:
-                click.echo(
-                    f"⚠️ Skipping {script_file}: template {template_name} not found or error: {e}"
-                )
+        for entry in self.templates.of_kind(SCRIPT):
+            path = entry.output_path()
+            if path is not None:
+                content = self._render(entry.name)
+                self._emit(path, content, entry.mode)
 
     def generate_task_tracking(self):
         """Generate task tracking system."""
-        click.echo("📋 Generating task tracking system...")
+        self._echo("📋 Generating task tracking system...")
 
         if self.schema.get("workflows", {}).get("task_tracking"):
             # Generate initial tracker
@@ -315,27 +405,23 @@ class BoilerplateGenerator:
                 "milestones": [],
             }
 
-            output_path = self.output_dir / "tasking" / "tracker.yaml"
-            output_path.parent.mkdir(exist_ok=True)
-            with open(output_path, "w") as f:
-                yaml.dump(tracker_data, f, default_flow_style=False)
+            self._emit(
+                "tasking/tracker.yaml",
+                yaml.dump(tracker_data, default_flow_style=False),
+            )
 
             # Generate plan template
             try:
-                template = self.jinja_env.get_template("plan_template.md.j2")
-                content = template.render(schema=self.schema)
-
-                output_path = self.output_dir / "tasking" / "plan.md"
-                with open(output_path, "w") as f:
-                    f.write(content)
+                content = self._render("plan_template.md.j2")
+                self._emit("tasking/plan.md", content)
             except Exception as e:
-                click.echo(
+                self._echo(
                     f"⚠️ Skipping plan.md generation: template plan_template.md.j2 not found or error: {e}"
                 )
 
     def generate_ci_cd(self):
         """Generate CI/CD configuration."""
-        click.echo("🚀 Generating CI/CD configuration...")
+        self._echo("🚀 Generating CI/CD configuration...")
 
         ci_cd_config = self.schema.get("ci_cd", {})
         if ci_cd_config.get("provider") == "github_actions":
@@ -361,29 +447,23 @@ class BoilerplateGenerator:
                             }
                         )
 
-                output_path = self.output_dir / ".github" / "dependabot.yml"
-                with open(output_path, "w") as f:
-                    yaml.dump(dependabot_config, f, default_flow_style=False)
+                self._emit(
+                    ".github/dependabot.yml",
+                    yaml.dump(dependabot_config, default_flow_style=False),
+                )
 
     def generate_git_config(self):
         """Generate git configuration files."""
-        click.echo("🔧 Generating git configuration...")
+        self._echo("🔧 Generating git configuration...")
 
         # Generate .gitignore
-        gitignore_content = self.generate_gitignore()
-        output_path = self.output_dir / ".gitignore"
-        with open(output_path, "w") as f:
-            f.write(gitignore_content)
+        self._emit(".gitignore", self.generate_gitignore())
 
         # Generate pyproject.toml for Python projects
         for lang in self.schema.get("languages", []):
             if lang["name"] == "python":
-                template = self.jinja_env.get_template("pyproject.toml.j2")
-                content = template.render(schema=self.schema, lang=lang)
-
-                output_path = self.output_dir / "pyproject.toml"
-                with open(output_path, "w") as f:
-                    f.write(content)
+                content = self._render("pyproject.toml.j2", lang=lang)
+                self._emit("pyproject.toml", content)
                 break  # Only generate one pyproject.toml
 
         # Generate pre-commit hooks if commit signing is enabled
@@ -512,57 +592,38 @@ fi
 echo "✅ Commit is properly signed"
 """
 
-        hooks_dir = self.output_dir / ".git" / "hooks"
-        hooks_dir.mkdir(parents=True, exist_ok=True)
-
-        hook_path = hooks_dir / "pre-commit"
-        with open(hook_path, "w") as f:
-            f.write(hook_content)
-
-        os.chmod(hook_path, 0o755)
+        self._emit(".git/hooks/pre-commit", hook_content, 0o755)
 
     def generate_documentation(self):
         """Generate documentation files."""
-        click.echo("📚 Generating documentation...")
+        self._echo("📚 Generating documentation...")
 
         docs_config = self.schema.get("documentation", {})
 
         if docs_config.get("readme_generation"):
             try:
-                template = self.jinja_env.get_template("README.md.j2")
-                content = template.render(schema=self.schema)
-
-                output_path = self.output_dir / "README.md"
-                with open(output_path, "w") as f:
-                    f.write(content)
+                content = self._render("README.md.j2")
+                self._emit("README.md", content)
             except Exception as e:
-                click.echo(
+                self._echo(
                     f"⚠️ Skipping README.md generation: template README.md.j2 not found or error: {e}"
                 )
 
         if self.schema.get("project", {}).get("license"):
             try:
-                template = self.jinja_env.get_template("LICENSE.j2")
-                content = template.render(schema=self.schema)
-
-                output_path = self.output_dir / "LICENSE"
-                with open(output_path, "w") as f:
-                    f.write(content)
+                content = self._render("LICENSE.j2")
+                self._emit("LICENSE", content)
             except Exception as e:
-                click.echo(
+                self._echo(
                     f"⚠️ Skipping LICENSE generation: template LICENSE.j2 not found or error: {e}"
                 )
 
         if docs_config.get("contributing_guide"):
             try:
-                template = self.jinja_env.get_template("CONTRIBUTING.md.j2")
-                content = template.render(schema=self.schema)
-
-                output_path = self.output_dir / "CONTRIBUTING.md"
-                with open(output_path, "w") as f:
-                    f.write(content)
+                content = self._render("CONTRIBUTING.md.j2")
+                self._emit("CONTRIBUTING.md", content)
             except Exception as e:
-                click.echo(
+                self._echo(
                     f"⚠️ Skipping CONTRIBUTING.md generation: template CONTRIBUTING.md.j2 not found or error: {e}"
                 )
 
@@ -572,8 +633,7 @@ echo "✅ Commit is properly signed"
                 changelog_content = generator.generate_initial_changelog(
                     self.schema["project"].get("repository")
                 )
-                output_path = self.output_dir / "CHANGELOG.md"
-                generator.write_changelog(changelog_content, output_path)
+                self._emit("CHANGELOG.md", changelog_content)
             else:
                 # Fallback to inline generation if chngbrgr not available
                 changelog_content = f"""# Changelog
@@ -608,9 +668,7 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
 - N/A
 """
 
-                output_path = self.output_dir / "CHANGELOG.md"
-                with open(output_path, "w") as f:
-                    f.write(changelog_content)
+                self._emit("CHANGELOG.md", changelog_content)
 
 
 @click.command()
@@ -634,11 +692,50 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
     default=None,
     help="Path to fleet-standards pack (default: pack/fleet-standards in this repo)",
 )
-def main(schema, output, template, fleet_pack, fleet_pack_path):
+@click.option(
+    "--plan",
+    "plan_only",
+    is_flag=True,
+    default=False,
+    help="Show what would be created or updated (with diffs) without writing files",
+)
+@click.option(
+    "--memprofile",
+    default=None,
+    help="Write per-phase tracemalloc allocation sites and growth to this JSON file",
+)
+@click.option(
+    "--sample-profile",
+    default=None,
+    help="Sample stacks while generating and write collapsed stacks to this file",
+)
+@click.option(
+    "--sample-rate",
+    default=100.0,
+    show_default=True,
+    help="Sampling rate in Hz for --sample-profile",
+)
+def main(
+    schema,
+    output,
+    template,
+    fleet_pack,
+    fleet_pack_path,
+    plan_only,
+    memprofile,
+    sample_profile,
+    sample_rate,
+):
     """Generate agentic development boilerplate from schema.
 
     Prefer https://github.com/tzervas/tz-forge ``tz-new`` for new product repos.
     """
+    profiler = MemoryProfiler() if memprofile else None
+    if profiler:
+        profiler.start()
+    sampler = SamplingProfiler(sample_rate) if sample_profile else None
+    if sampler:
+        sampler.start()
     try:
         generator = BoilerplateGenerator(
             schema,
@@ -646,11 +743,27 @@ def main(schema, output, template, fleet_pack, fleet_pack_path):
             template,
             fleet_pack=fleet_pack,
             fleet_pack_path=fleet_pack_path,
+            profiler=profiler,
         )
-        generator.generate()
+        if plan_only:
+            click.echo(generator.plan().format())
+        else:
+            generator.generate()
+        if profiler:
+            profiler.write(memprofile)
+            click.echo(f"🧠 Memory profile written to {memprofile}")
+            click.echo(profiler.format_summary())
+            profiler.stop()
     except Exception as e:
         click.echo(f"❌ Error: {e}", err=True)
         raise click.Abort()
+    finally:
+        if sampler:
+            sampler.stop()
+            sampler.write(sample_profile)
+            click.echo(
+                f"🔥 {sampler.samples} stack samples written to {sample_profile}"
+            )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Hedged Execution
+
+Speculative duplicate attempts for straggling agent tasks. Each role keeps a
+window of recent attempt durations; once a task has run longer than the
+role's configured latency percentile, a second attempt of the same task is
+started (for executor backends, on another worker). Whichever attempt
+finishes first wins and the other is cancelled.
+
+A hedge win also records how long the cancelled primary had run, as a
+lower bound, so the slow tail does not drop out of the window.
+
+Hedges add load, so they are capped by a budget: at most ``max_ratio``
+hedges per primary attempt overall and ``max_in_flight`` at once. No hedge
+is launched until a role has ``min_samples`` durations to learn from.
+"""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HedgePolicy:
+    """When to hedge and how much extra load hedges may add."""
+
+    # Hedge once an attempt runs longer than this percentile of its role.
+    percentile: float = 95.0
+    # Durations a role needs before it can be hedged.
+    min_samples: int = 20
+    # Recent durations kept per role.
+    window: int = 256
+    # Hedges allowed per primary attempt, over the coordinator's lifetime.
+    max_ratio: float = 0.1
+    # Hedges allowed to run at the same time (None: no limit).
+    max_in_flight: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if not 0.0 < self.percentile < 100.0:
+            raise ValueError("percentile must be between 0 and 100")
+        if self.min_samples < 1 or self.window < self.min_samples:
+            raise ValueError("window must be at least min_samples (>= 1)")
+        if self.max_ratio < 0:
+            raise ValueError("max_ratio must not be negative")
+
+
+class Hedger:
+    """Runs attempts with a per-role learned hedge delay."""
+
+    def __init__(self, policy: Optional[HedgePolicy] = None):
+        self.policy = policy or HedgePolicy()
+        self._durations: Dict[Hashable, Deque[float]] = defaultdict(
+            lambda: deque(maxlen=self.policy.window)
+        )
+        self.primaries = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.budget_denied = 0
+        self.in_flight = 0
+
+    def observe(self, role: Hashable, seconds: float) -> None:
+        self._durations[role].append(seconds)
+
+    def delay(self, role: Hashable) -> Optional[float]:
+        """Seconds after which an attempt for ``role`` is hedged, if known."""
+        durations = self._durations.get(role)
+        if not durations or len(durations) < self.policy.min_samples:
+            return None
+        ordered = sorted(durations)
+        # Nearest-rank percentile.
+        rank = max(0, -(-len(ordered) * self.policy.percentile // 100) - 1)
+        return ordered[int(rank)]
+
+    def _allow(self) -> bool:
+        policy = self.policy
+        if self.hedges + 1 > policy.max_ratio * self.primaries:
+            return False
+        if policy.max_in_flight is not None and self.in_flight >= policy.max_in_flight:
+            return False
+        return True
+
+    async def run(self, role: Hashable, attempt: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``attempt()``, hedging it with a second call if it straggles."""
+        self.primaries += 1
+        delay = self.delay(role)
+        started = time.perf_counter()
+        primary = asyncio.ensure_future(self._timed(role, attempt))
+        if delay is None:
+            return await primary
+
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done or not self._allow():
+                if not done:
+                    self.budget_denied += 1
+                return await primary
+
+            self.hedges += 1
+            self.in_flight += 1
+            logger.debug(f"Hedging {role} attempt after {delay:.3f}s")
+            hedge = asyncio.ensure_future(self._timed(role, attempt))
+            try:
+                pending = {primary, hedge}
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    # Prefer a success; fail only once both attempts have.
+                    winner = next((f for f in done if f.exception() is None), None)
+                    if winner is None and pending:
+                        continue
+                    if winner is hedge:
+                        self.hedge_wins += 1
+                        if not primary.done():
+                            # Lower bound for the primary being cancelled.
+                            self.observe(role, time.perf_counter() - started)
+                    return (winner or done.pop()).result()
+            finally:
+                self.in_flight -= 1
+                hedge.cancel()
+        finally:
+            primary.cancel()
+
+    async def _timed(
+        self, role: Hashable, attempt: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        started = time.perf_counter()
+        result = await attempt()
+        self.observe(role, time.perf_counter() - started)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "primaries": self.primaries,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "budget_denied": self.budget_denied,
+            "hedge_rate": self.hedges / self.primaries if self.primaries else 0.0,
+            "win_rate": self.hedge_wins / self.hedges if self.hedges else 0.0,
+        }
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Identifiers
+
+Unique, time-sortable IDs for sessions, tasks and messages::
+
+    session_0192a3b4c5d6e7f8a9b0000000042
+            |-----------||---||--------|
+             ms since     node  counter
+             the epoch
+
+All fields are fixed-width lowercase hex, so plain string order is creation
+order (to the millisecond across processes, exactly within a process). The
+node id is random per process and re-drawn in forked children; the counter
+is an ``itertools.count``, whose ``next`` is atomic under the GIL, so no
+lock is taken. The timestamp prefix is formatted once per millisecond and
+the counter is rendered with ``hex`` rather than a format spec, which keeps
+generation around a microsecond per ID.
+"""
+
+import itertools
+import os
+import time
+from typing import Tuple
+
+_time_ns = time.time_ns
+
+_TIME_DIGITS = 12  # 48-bit milliseconds, good until the year 10889
+_NODE_DIGITS = 5  # 20-bit random node id
+_COUNTER_DIGITS = 10  # 40-bit per-process counter
+
+# Counting from 1 << 40 makes hex() fixed width: "0x1" + 10 digits.
+_COUNTER_BASE = 1 << (4 * _COUNTER_DIGITS)
+
+
+class _State:
+    def __init__(self) -> None:
+        self.node = f"{int.from_bytes(os.urandom(3), 'big') >> 4:0{_NODE_DIGITS}x}"
+        self.counter = itertools.count(_COUNTER_BASE)
+        self.last_ms = -1
+        self.prefix = ""
+
+
+_state = _State()
+
+
+def _reseed() -> None:
+    global _state
+    _state = _State()
+
+
+if hasattr(os, "register_at_fork"):
+    # A forked child would otherwise repeat the parent's node and counter.
+    os.register_at_fork(after_in_child=_reseed)
+
+
+def new_id(prefix: str = "") -> str:
+    """Return a new unique ID, optionally as ``<prefix>_<id>``."""
+    state = _state
+    now = _time_ns() // 1_000_000
+    if now > state.last_ms:
+        # Never step back, even if the wall clock does.
+        state.last_ms = now
+        state.prefix = f"{now:0{_TIME_DIGITS}x}{state.node}"
+    value = state.prefix + hex(next(state.counter))[3:]
+    return prefix + "_" + value if prefix else value
+
+
+def parse_id(value: str) -> Tuple[float, str, int]:
+    """Split an ID into (unix timestamp, node id, counter)."""
+    body = value.rsplit("_", 1)[-1]
+    millis = int(body[:_TIME_DIGITS], 16)
+    node = body[_TIME_DIGITS : _TIME_DIGITS + _NODE_DIGITS]
+    counter = int(body[_TIME_DIGITS + _NODE_DIGITS :], 16)
+    return millis / 1000, node, counter
@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Coordinator Load Test
+
+Drives an :class:`AgentCoordinator` with many concurrent sessions against a
+synthetic agent backend, to measure coordinator capacity independently of
+real agents. Each session gets a task DAG of a configurable shape; the
+:class:`SyntheticBackend` sleeps for a latency drawn from a
+:class:`LatencyDistribution` and fails a configurable share of attempts.
+
+The report gives sessions and tasks per second, session latency
+percentiles and peak memory. Runs are seeded, so the same configuration
+produces the same workload and results can be compared across coordinator
+changes (see ``benchmarks/bench_loadtest.py``).
+
+    python -m agentic_dev_boilerplate.loadtest --sessions 2000 \\
+        --shape layered --latency bimodal:0.005:0.05:20 --failure-rate 0.01
+"""
+
+import asyncio
+import json
+import logging
+import math
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, Iterator, List, Optional
+
+resource: Optional[ModuleType]
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+from .backends import TaskPayload, task_result
+from .multi_agent_solver import AgentCoordinator, AgentRole, Task
+
+logger = logging.getLogger(__name__)
+
+CONSTANT = "constant"
+LOGNORMAL = "lognormal"
+BIMODAL = "bimodal"
+DISTRIBUTIONS = (CONSTANT, LOGNORMAL, BIMODAL)
+
+INDEPENDENT = "independent"
+CHAIN = "chain"
+DIAMOND = "diamond"
+LAYERED = "layered"
+SHAPES = (INDEPENDENT, CHAIN, DIAMOND, LAYERED)
+
+SYNTHETIC = "synthetic"
+
+
+class SyntheticFailure(RuntimeError):
+    """Injected failure of a synthetic agent attempt."""
+
+
+@dataclass
+class LatencyDistribution:
+    """Seconds a synthetic agent takes per attempt.
+
+    ``lognormal`` has the given ``median`` and log-space spread ``sigma``;
+    ``bimodal`` mixes it with a slow mode ``slow_factor`` times slower,
+    drawn for a ``slow_fraction`` share of attempts; ``constant`` always
+    takes ``median``.
+    """
+
+    kind: str = LOGNORMAL
+    median: float = 0.01
+    sigma: float = 0.5
+    slow_fraction: float = 0.05
+    slow_factor: float = 20.0
+
+    def __post_init__(self) -> None:
+        if self.kind not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {self.kind}")
+        if self.median < 0 or self.sigma < 0:
+            raise ValueError("median and sigma must not be negative")
+        if not 0.0 <= self.slow_fraction <= 1.0 or self.slow_factor < 1:
+            raise ValueError("need 0 <= slow_fraction <= 1 and slow_factor >= 1")
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyDistribution":
+        """Parse ``constant:SECONDS``, ``lognormal:MEDIAN[:SIGMA]`` or
+        ``bimodal:MEDIAN[:SLOW_FRACTION[:SLOW_FACTOR]]``."""
+        kind, *values = spec.split(":")
+        names = {
+            CONSTANT: ("median",),
+            LOGNORMAL: ("median", "sigma"),
+            BIMODAL: ("median", "slow_fraction", "slow_factor"),
+        }.get(kind)
+        if names is None or len(values) > len(names) or not values:
+            raise ValueError(f"Invalid latency distribution: {spec}")
+        return cls(kind, **dict(zip(names, map(float, values))))
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == CONSTANT or self.median == 0:
+            return self.median
+        median = self.median
+        if self.kind == BIMODAL and rng.random() < self.slow_fraction:
+            median *= self.slow_factor
+        return rng.lognormvariate(math.log(median), self.sigma)
+
+
+class SyntheticBackend:
+    """Agent backend that sleeps and fails according to a distribution.
+
+    Stands in for real agent execution (the backend the coordinator submits
+    each task's payload to), so only coordinator work is measured.
+    """
+
+    name = SYNTHETIC
+
+    def __init__(
+        self,
+        latency: Optional[LatencyDistribution] = None,
+        failure_rate: float = 0.0,
+        seed: Optional[int] = None,
+        role_latency: Optional[Dict[str, LatencyDistribution]] = None,
+    ):
+        if not 0.0 <= failure_rate <= 1.0:
+            raise ValueError("failure_rate must be between 0.0 and 1.0")
+        self.latency = latency or LatencyDistribution()
+        self.role_latency = dict(role_latency or {})
+        self.failure_rate = failure_rate
+        self._rng = random.Random(seed)
+        self.submitted = 0
+        self.failed = 0
+
+    def submit(self, payload: TaskPayload) -> "asyncio.Future[Dict[str, Any]]":
+        return asyncio.ensure_future(self._run(payload))
+
+    async def _run(self, payload: TaskPayload) -> Dict[str, Any]:
+        self.submitted += 1
+        latency = self.role_latency.get(payload.agent, self.latency)
+        await asyncio.sleep(latency.sample(self._rng))
+        if self._rng.random() < self.failure_rate:
+            self.failed += 1
+            raise SyntheticFailure(f"Synthetic failure of task {payload.task_id}")
+        return task_result(payload)
+
+    def shutdown(self, wait: bool = True) -> None:
+        pass
+
+
+def build_tasks(
+    shape: str, size: int, roles: List[AgentRole], rng: random.Random
+) -> List[Task]:
+    """A session's task DAG of ``size`` tasks, assigned to ``roles`` in turn.
+
+    ``independent`` tasks have no dependencies; a ``chain`` runs one after
+    another; a ``diamond`` fans out from one task and joins into the last;
+    ``layered`` has layers about ``sqrt(size)`` wide, each task depending on
+    one or two tasks of the previous layer.
+    """
+    if shape not in SHAPES:
+        raise ValueError(f"Unknown DAG shape: {shape}")
+    if size < 1:
+        raise ValueError("size must be at least 1")
+    ids = [f"t{i}" for i in range(size)]
+    dependencies: List[List[str]] = [[] for _ in ids]
+    if shape == CHAIN or (shape == DIAMOND and size < 3):
+        for i in range(1, size):
+            dependencies[i] = [ids[i - 1]]
+    elif shape == DIAMOND:
+        for i in range(1, size - 1):
+            dependencies[i] = [ids[0]]
+        dependencies[-1] = ids[1:-1]
+    elif shape == LAYERED:
+        width = max(1, round(math.sqrt(size)))
+        for i in range(width, size):
+            start = (i // width - 1) * width
+            previous = ids[start : start + width]
+            dependencies[i] = rng.sample(previous, min(len(previous), 2))
+    return [
+        Task(
+            task_id=task_id,
+            description=f"{shape} task {i}",
+            assigned_agent=roles[i % len(roles)],
+            dependencies=dependencies[i],
+        )
+        for i, task_id in enumerate(ids)
+    ]
+
+
+def percentile(ordered: List[float], p: float) -> float:
+    """Nearest-rank percentile of an ascending list (0.0 when empty)."""
+    if not ordered:
+        return 0.0
+    rank = max(0, math.ceil(len(ordered) * p / 100) - 1)
+    return ordered[rank]
+
+
+@dataclass
+class LoadTestConfig:
+    """Workload of one load test run."""
+
+    sessions: int = 1000
+    # Sessions executing at once.
+    concurrency: int = 64
+    tasks_per_session: int = 8
+    shape: str = LAYERED
+    latency: LatencyDistribution = field(default_factory=LatencyDistribution)
+    failure_rate: float = 0.0
+    agents: List[AgentRole] = field(default_factory=lambda: list(AgentRole))
+    task_timeout: Optional[float] = None
+    seed: int = 0
+    # Measure peak Python heap with tracemalloc (slows the run down).
+    trace_memory: bool = False
+    # Extra AgentCoordinator options, e.g. retry policies or role limits.
+    coordinator_options: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if self.sessions < 1 or self.concurrency < 1:
+            raise ValueError("sessions and concurrency must be at least 1")
+        if self.shape not in SHAPES:
+            raise ValueError(f"Unknown DAG shape: {self.shape}")
+        if not self.agents:
+            raise ValueError("at least one agent role is required")
+        if not 0.0 <= self.failure_rate <= 1.0:
+            raise ValueError("failure_rate must be between 0.0 and 1.0")
+
+
+@dataclass
+class LoadTestReport:
+    """Throughput, latency and memory of a load test run."""
+
+    sessions: int
+    tasks: int
+    failed_tasks: int
+    sessions_with_errors: int
+    duration_seconds: float
+    sessions_per_second: float
+    tasks_per_second: float
+    latency_p50: float
+    latency_p95: float
+    latency_p99: float
+    latency_max: float
+    peak_rss_mb: Optional[float]
+    peak_traced_mb: Optional[float]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    def format(self) -> str:
+        lines = [
+            f"sessions:      {self.sessions} "
+            f"({self.sessions_with_errors} with failed tasks)",
+            f"tasks:         {self.tasks} ({self.failed_tasks} failed)",
+            f"duration:      {self.duration_seconds:.2f}s",
+            f"throughput:    {self.sessions_per_second:.1f} sessions/s, "
+            f"{self.tasks_per_second:.1f} tasks/s",
+            f"latency:       p50 {self.latency_p50 * 1000:.1f}ms, "
+            f"p95 {self.latency_p95 * 1000:.1f}ms, "
+            f"p99 {self.latency_p99 * 1000:.1f}ms, "
+            f"max {self.latency_max * 1000:.1f}ms",
+        ]
+        if self.peak_rss_mb is not None:
+            lines.append(f"peak RSS:      {self.peak_rss_mb:.1f} MB")
+        if self.peak_traced_mb is not None:
+            lines.append(f"peak heap:     {self.peak_traced_mb:.1f} MB (tracemalloc)")
+        return "\n".join(lines)
+
+
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS and kilobytes elsewhere.
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / 1024
+
+
+async def run_load_test_async(
+    config: LoadTestConfig, workspace: Optional[Path] = None
+) -> LoadTestReport:
+    """Run the configured sessions; see :func:`run_load_test`."""
+    backend = SyntheticBackend(config.latency, config.failure_rate, config.seed)
+    coordinator = AgentCoordinator(
+        workspace or Path(tempfile.mkdtemp(prefix="loadtest-")),
+        backend=backend,
+        task_timeout=config.task_timeout,
+        **config.coordinator_options,
+    )
+    rng = random.Random(config.seed)
+    workloads = [
+        build_tasks(config.shape, config.tasks_per_session, config.agents, rng)
+        for _ in range(config.sessions)
+    ]
+    latencies: List[float] = []
+    failed_tasks = 0
+    sessions_with_errors = 0
+
+    async def worker(pending: Iterator[int]) -> None:
+        nonlocal failed_tasks, sessions_with_errors
+        for index in pending:
+            started = time.perf_counter()
+            session_id = coordinator.create_session(
+                f"load test session {index}", config.agents
+            )
+            coordinator.active_sessions[session_id].tasks = workloads[index]
+            result = await coordinator.execute_session_async(session_id)
+            coordinator.close_session(session_id)
+            latencies.append(time.perf_counter() - started)
+            if result["errors"]:
+                failed_tasks += len(result["errors"])
+                sessions_with_errors += 1
+
+    tracing = config.trace_memory and not tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.start()
+    pending = iter(range(config.sessions))
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(
+            *(worker(pending) for _ in range(min(config.concurrency, config.sessions)))
+        )
+        duration = time.perf_counter() - started
+        peak_traced = tracemalloc.get_traced_memory()[1] if tracing else None
+    finally:
+        if tracing:
+            tracemalloc.stop()
+        coordinator.close()
+
+    latencies.sort()
+    tasks = config.sessions * config.tasks_per_session
+    return LoadTestReport(
+        sessions=config.sessions,
+        tasks=tasks,
+        failed_tasks=failed_tasks,
+        sessions_with_errors=sessions_with_errors,
+        duration_seconds=duration,
+        sessions_per_second=config.sessions / duration,
+        tasks_per_second=tasks / duration,
+        latency_p50=percentile(latencies, 50),
+        latency_p95=percentile(latencies, 95),
+        latency_p99=percentile(latencies, 99),
+        latency_max=latencies[-1],
+        peak_rss_mb=_peak_rss_mb(),
+        peak_traced_mb=peak_traced / (1 << 20) if peak_traced is not None else None,
+    )
+
+
+def run_load_test(
+    config: LoadTestConfig, workspace: Optional[Path] = None
+) -> LoadTestReport:
+    """Run ``config.sessions`` sessions, ``config.concurrency`` at a time.
+
+    Every session gets a freshly generated DAG and runs on one coordinator
+    backed by a :class:`SyntheticBackend`; session latency covers creation
+    and execution. ``workspace`` defaults to an empty temporary directory
+    (no agent instruction files).
+    """
+    return asyncio.run(run_load_test_async(config, workspace))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command-line entry point for coordinator load tests."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Coordinator load test")
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument(
+        "--concurrency", type=int, default=64, help="Sessions executing at once"
+    )
+    parser.add_argument(
+        "--tasks", type=int, default=8, help="Tasks per session (default: 8)"
+    )
+    parser.add_argument("--shape", choices=SHAPES, default=LAYERED)
+    parser.add_argument(
+        "--latency",
+        default="lognormal:0.01:0.5",
+        help="constant:SECONDS, lognormal:MEDIAN[:SIGMA] or "
+        "bimodal:MEDIAN[:SLOW_FRACTION[:SLOW_FACTOR]]",
+    )
+    parser.add_argument(
+        "--failure-rate", type=float, default=0.0, help="Share of attempts that fail"
+    )
+    parser.add_argument(
+        "--agents",
+        nargs="+",
+        choices=[role.value for role in AgentRole],
+        default=[role.value for role in AgentRole],
+    )
+    parser.add_argument("--task-timeout", type=float, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="Also report peak Python heap via tracemalloc (slower)",
+    )
+    parser.add_argument(
+        "--json", type=Path, default=None, help="Also write the report to this file"
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="Keep the coordinator's INFO logging"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        config = LoadTestConfig(
+            sessions=args.sessions,
+            concurrency=args.concurrency,
+            tasks_per_session=args.tasks,
+            shape=args.shape,
+            latency=LatencyDistribution.parse(args.latency),
+            failure_rate=args.failure_rate,
+            agents=[AgentRole(agent) for agent in args.agents],
+            task_timeout=args.task_timeout,
+            seed=args.seed,
+            trace_memory=args.trace_memory,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    if not args.verbose:
+        # Per-task INFO logging would dominate the measurement.
+        logging.disable(logging.INFO)
+
+    report = run_load_test(config)
+    print(report.format())
+    if args.json:
+        args.json.write_text(json.dumps(report.to_dict(), indent=2))
+        print(f"Report written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Message Bus
+
+Session-scoped delivery of agent messages. Every (session, recipient) pair
+an agent receives on has its own ``asyncio.Queue`` inbox that it can
+``await``. Inboxes are opened by the first receive; messages to a role that
+is not receiving are not queued (the session's message log is the history),
+so a session's messages are not held twice. Routing is a dictionary lookup
+whether the message names its session or only its sender and recipient
+roles, so delivery cost does not grow with the number of active sessions.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from .multi_agent_solver import AgentMessage, AgentRole
+
+logger = logging.getLogger(__name__)
+
+
+class MessageBus:
+    """Per-(session, recipient) inboxes with O(1) routing indexes."""
+
+    def __init__(self, maxsize: int = 0):
+        self.maxsize = maxsize
+        self._participants: Dict[str, Set["AgentRole"]] = {}
+        # (sender, recipient) -> sessions containing both roles
+        self._sessions_by_pair: Dict[Tuple["AgentRole", "AgentRole"], Set[str]] = (
+            defaultdict(set)
+        )
+        self._inboxes: Dict[Tuple[str, "AgentRole"], "asyncio.Queue[AgentMessage]"] = {}
+
+    def register_session(self, session_id: str, agents: Iterable["AgentRole"]) -> None:
+        """Make a session's participants addressable."""
+        participants = set(agents)
+        self._participants[session_id] = participants
+        for sender in participants:
+            for recipient in participants:
+                self._sessions_by_pair[(sender, recipient)].add(session_id)
+
+    def unregister_session(self, session_id: str) -> None:
+        """Forget a session and drop its inboxes."""
+        participants = self._participants.pop(session_id, set())
+        for sender in participants:
+            for recipient in participants:
+                pair = (sender, recipient)
+                self._sessions_by_pair[pair].discard(session_id)
+                if not self._sessions_by_pair[pair]:
+                    del self._sessions_by_pair[pair]
+            self._inboxes.pop((session_id, sender), None)
+
+    def route(self, sender: "AgentRole", recipient: "AgentRole") -> Optional[str]:
+        """Session for a message that does not name one.
+
+        Returns ``None`` when no session has both roles and raises
+        ``ValueError`` when several do, rather than guessing.
+        """
+        sessions = self._sessions_by_pair.get((sender, recipient))
+        if not sessions:
+            return None
+        if len(sessions) > 1:
+            raise ValueError(
+                f"Message from {sender.value} to {recipient.value} matches "
+                f"{len(sessions)} sessions; set AgentMessage.session_id"
+            )
+        return next(iter(sessions))
+
+    def _check_participant(self, session_id: str, role: "AgentRole") -> None:
+        if role not in self._participants.get(session_id, ()):
+            raise ValueError(
+                f"{role.value} is not a participant of session {session_id}"
+            )
+
+    def inbox(
+        self, session_id: str, role: "AgentRole"
+    ) -> "asyncio.Queue[AgentMessage]":
+        """Queue of messages for ``role`` in ``session_id``, opened on first use.
+
+        Only messages delivered after the inbox is opened are queued.
+        """
+        key = (session_id, role)
+        queue = self._inboxes.get(key)
+        if queue is None:
+            self._check_participant(session_id, role)
+            queue = self._inboxes[key] = asyncio.Queue(self.maxsize)
+        return queue
+
+    def deliver(self, message: "AgentMessage") -> None:
+        """Put a message with a resolved ``session_id`` into its inbox.
+
+        Messages are only queued for recipients that have opened their inbox,
+        and not for sessions that are no longer registered. Raises
+        ``asyncio.QueueFull`` if a bounded inbox is full.
+        """
+        if message.session_id not in self._participants:
+            return
+        queue = self._inboxes.get((message.session_id, message.recipient))
+        if queue is None:
+            self._check_participant(message.session_id, message.recipient)
+            return
+        queue.put_nowait(message)
+
+    async def receive(self, session_id: str, role: "AgentRole") -> "AgentMessage":
+        """Wait for the next message addressed to ``role`` in ``session_id``."""
+        return await self.inbox(session_id, role).get()
+
+    def pending(self, session_id: str, role: "AgentRole") -> int:
+        queue = self._inboxes.get((session_id, role))
+        return queue.qsize() if queue else 0
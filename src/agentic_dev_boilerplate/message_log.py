@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Message Log
+
+Columnar, append-only storage for a session's message history. Senders,
+recipients and message types are interned to small ints in ``array('B')``
+columns, timestamps live in an ``array('d')``, and the variable-size part
+of each message (ID, session ID, content) is pickled into a byte buffer
+that moves to an anonymous temporary file once it outgrows
+``SPILL_THRESHOLD``. Per message, memory then holds 3 bytes of codes, an
+8-byte timestamp and a 12-byte offset/length, instead of a dataclass
+instance, its content dict and its ID strings. Short histories never touch
+the disk (or use a file descriptor).
+
+The log behaves like a read-only list of messages plus ``append``: reading
+an entry rebuilds the message object from its columns.
+"""
+
+import os
+import pickle
+import tempfile
+from array import array
+from pathlib import Path
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
+
+_MAX_CODES = 256
+
+# Payload bytes kept in memory before a log spills to a temporary file.
+SPILL_THRESHOLD = 64 * 1024
+
+
+class _Interned:
+    """Small-int codes for a column of repeated values (enum members)."""
+
+    def __init__(self) -> None:
+        self.values: List[Hashable] = []
+        self.codes: Dict[Hashable, int] = {}
+
+    def encode(self, value: Hashable) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            if len(self.values) >= _MAX_CODES:
+                raise ValueError("Too many distinct values for a message log column")
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class MessageLog:
+    """Append-only, array-backed sequence of messages."""
+
+    def __init__(
+        self,
+        message_cls: Callable[..., Any],
+        messages: Iterable[Any] = (),
+        spill_dir: Optional[Path] = None,
+    ):
+        self.message_cls = message_cls
+        self.spill_dir = spill_dir
+        self._senders = array("B")
+        self._recipients = array("B")
+        self._types = array("B")
+        self._timestamps = array("d")
+        self._offsets = array("Q")
+        self._lengths = array("I")
+        self._roles = _Interned()
+        self._message_types = _Interned()
+        self._buffer = bytearray()
+        self._file: Optional[IO[bytes]] = None
+        self._end = 0
+        self._closed = False
+        self.extend(messages)
+
+    @property
+    def spilled(self) -> bool:
+        return self._file is not None
+
+    def _write(self, data: bytes) -> None:
+        if self._file is not None:
+            self._file.write(data)
+            return
+        self._buffer += data
+        if len(self._buffer) > SPILL_THRESHOLD:
+            self._file = tempfile.TemporaryFile(
+                prefix="messages-", dir=str(self.spill_dir) if self.spill_dir else None
+            )
+            self._file.write(self._buffer)
+            self._buffer = bytearray()
+
+    def append(self, message: Any) -> None:
+        if self._closed:
+            raise ValueError("message log is closed")
+        data = pickle.dumps(
+            (message.message_id, message.session_id, message.content),
+            pickle.HIGHEST_PROTOCOL,
+        )
+        self._write(data)
+        self._senders.append(self._roles.encode(message.sender))
+        self._recipients.append(self._roles.encode(message.recipient))
+        self._types.append(self._message_types.encode(message.message_type))
+        self._timestamps.append(message.timestamp)
+        self._offsets.append(self._end)
+        self._lengths.append(len(data))
+        self._end += len(data)
+
+    def extend(self, messages: Iterable[Any]) -> None:
+        for message in messages:
+            self.append(message)
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def _load(self, index: int) -> Any:
+        if self._closed:
+            raise ValueError("message log is closed")
+        offset, length = self._offsets[index], self._lengths[index]
+        data: Union[bytes, bytearray]
+        if self._file is None:
+            data = self._buffer[offset : offset + length]
+        else:
+            self._file.flush()
+            data = os.pread(self._file.fileno(), length, offset)
+        message_id, session_id, content = pickle.loads(data)
+        roles = self._roles.values
+        return self.message_cls(
+            sender=roles[self._senders[index]],
+            recipient=roles[self._recipients[index]],
+            message_type=self._message_types.values[self._types[index]],
+            content=content,
+            timestamp=self._timestamps[index],
+            message_id=message_id,
+            session_id=session_id,
+        )
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self._load(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("message log index out of range")
+        return self._load(index)
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self)):
+            yield self._load(index)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (MessageLog, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"MessageLog({len(self)} messages)"
+
+    def nbytes(self) -> int:
+        """Bytes held in memory by the columns and any unspilled payloads."""
+        columns = (
+            self._senders,
+            self._recipients,
+            self._types,
+            self._timestamps,
+            self._offsets,
+            self._lengths,
+        )
+        return len(self._buffer) + sum(
+            column.itemsize * len(column) for column in columns
+        )
+
+    def close(self) -> None:
+        """Discard the payloads; the log cannot be used afterwards."""
+        self._closed = True
+        self._buffer = bytearray()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
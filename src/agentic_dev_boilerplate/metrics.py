@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+Coordinator Metrics
+
+A small in-process metrics registry with OpenMetrics text exposition, so
+coordinator throughput and latency can be scraped without extra
+dependencies. :class:`Counter` and :class:`Histogram` families are
+registered on a :class:`MetricsRegistry` and split into label children;
+histograms use fixed bucket bounds, so an observation is one binary search
+and a few additions whatever the traffic.
+
+The registry can be written to a file periodically (:class:`FileExporter`,
+e.g. for a node exporter's textfile collector) or served on a local HTTP
+port (:class:`HttpExporter`).
+"""
+
+import logging
+import math
+import os
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Generic, List, Optional, Sequence, Tuple, TypeVar, Union
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Upper bounds in seconds; agent tasks range from milliseconds to minutes.
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+)
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _CounterChild:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.value: float = 0
+
+    def inc(self, amount: float = 1) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        with self._lock:
+            self.value += amount
+
+
+class _HistogramChild:
+    __slots__ = ("_lock", "_bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+        self._lock = threading.Lock()
+        self._bounds = bounds
+        # Per-bucket (not cumulative) counts; the last bucket is +Inf.
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self._bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def snapshot(self) -> Tuple[List[int], float, int]:
+        with self._lock:
+            return list(self.counts), self.sum, self.count
+
+
+_Child = TypeVar("_Child", _CounterChild, _HistogramChild)
+_F = TypeVar("_F", bound="_Family[Any]")
+
+
+class _Family(ABC, Generic[_Child]):
+    kind = ""
+    unit = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], _Child] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            self._default: _Child = self.labels()
+
+    @abstractmethod
+    def _new_child(self) -> _Child:
+        """A new child holding one label combination's values."""
+
+    def labels(self, *values: str) -> _Child:
+        """Child for one combination of label values (created on first use)."""
+        child = self._children.get(values)
+        if child is None:
+            child = self._add_child(values)
+        return child
+
+    def _add_child(self, values: Tuple[str, ...]) -> _Child:
+        if len(values) != len(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {values}"
+            )
+        key = tuple(str(v) for v in values)
+        with self._lock:
+            child = self._children.get(key)
+            if child is None:
+                child = self._children[key] = self._new_child()
+            return child
+
+    @abstractmethod
+    def _samples(self) -> List[str]:
+        """Exposition lines for all children."""
+
+    def render(self) -> List[str]:
+        lines = [f"# TYPE {self.name} {self.kind}"]
+        if self.unit:
+            lines.append(f"# UNIT {self.name} {self.unit}")
+        lines.append(f"# HELP {self.name} {_escape(self.documentation)}")
+        return lines + self._samples()
+
+    def _items(self) -> List[Tuple[Tuple[str, ...], _Child]]:
+        with self._lock:
+            return sorted(self._children.items())
+
+
+class Counter(_Family[_CounterChild]):
+    """Monotonic count; unlabelled counters can be incremented directly."""
+
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1) -> None:
+        self._default.inc(amount)
+
+    def value(self, *labels: str) -> float:
+        return self.labels(*labels).value
+
+    def _samples(self) -> List[str]:
+        return [
+            f"{self.name}_total{_labels(self.labelnames, key)} "
+            f"{_format_value(child.value)}"
+            for key, child in self._items()
+        ]
+
+
+class Histogram(_Family[_HistogramChild]):
+    """Distribution over fixed buckets; reports cumulative counts and sum."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        unit: str = "",
+    ):
+        bounds = tuple(sorted(float(b) for b in buckets if not math.isinf(b)))
+        if not bounds:
+            raise ValueError("Histograms need at least one finite bucket")
+        self.buckets = bounds
+        self.unit = unit
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._default.observe(value)
+
+    def _samples(self) -> List[str]:
+        lines = []
+        bounds = [_format_value(b) for b in self.buckets] + ["+Inf"]
+        for key, child in self._items():
+            counts, total, count = child.snapshot()
+            cumulative = 0
+            for bound, bucket_count in zip(bounds, counts):
+                cumulative += bucket_count
+                labels = _labels(self.labelnames + ("le",), key + (bound,))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _labels(self.labelnames, key)
+            lines.append(f"{self.name}_count{labels} {count}")
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named metric families, rendered together as OpenMetrics text."""
+
+    def __init__(self) -> None:
+        self._families: Dict[str, _Family[Any]] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, family: _F) -> _F:
+        with self._lock:
+            existing = self._families.get(family.name)
+            if existing is None:
+                self._families[family.name] = family
+                return family
+        if type(existing) is not type(family) or (
+            existing.labelnames != family.labelnames
+        ):
+            raise ValueError(f"Metric {family.name} already registered differently")
+        return existing
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        """Register a counter, or return the one already registered as ``name``."""
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        unit: str = "",
+    ) -> Histogram:
+        """Register a histogram, or return the one already registered as ``name``."""
+        return self._register(Histogram(name, documentation, labelnames, buckets, unit))
+
+    def get(self, name: str) -> Optional[_Family[Any]]:
+        return self._families.get(name)
+
+    def render(self) -> str:
+        """All families in OpenMetrics text format, ending with ``# EOF``."""
+        with self._lock:
+            families = sorted(self._families.items())
+        lines: List[str] = []
+        for _, family in families:
+            lines.extend(family.render())
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write_file(self, path: Union[str, Path]) -> None:
+        """Write the exposition atomically, so readers never see half a file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(self.render(), encoding="utf-8")
+        os.replace(tmp, path)
+
+
+class CoordinatorMetrics:
+    """The metric families an :class:`AgentCoordinator` records."""
+
+    def __init__(self, registry: MetricsRegistry):
+        self.registry = registry
+        self.sessions_created = registry.counter(
+            "agentic_sessions_created", "Multi-agent sessions created"
+        )
+        self.sessions_completed = registry.counter(
+            "agentic_sessions_completed",
+            "Session executions finished, by outcome",
+            ["outcome"],
+        )
+        self.tasks = registry.counter(
+            "agentic_tasks",
+            "Task status transitions, by role and new status",
+            ["role", "status"],
+        )
+        self.task_latency = registry.histogram(
+            "agentic_task_latency_seconds",
+            "Time an agent spent on a task, retries included",
+            ["role"],
+            unit="seconds",
+        )
+        self.queue_wait = registry.histogram(
+            "agentic_queue_wait_seconds",
+            "Time a ready task waited in its role pool for a slot",
+            ["role"],
+            unit="seconds",
+        )
+        self.consensus_latency = registry.histogram(
+            "agentic_consensus_latency_seconds",
+            "Time from session execution start to the consensus decision",
+            unit="seconds",
+        )
+        self.messages_sent = registry.counter(
+            "agentic_messages_sent", "Agent messages sent, by type", ["type"]
+        )
+
+
+class FileExporter:
+    """Rewrites an OpenMetrics file every ``interval`` seconds."""
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        path: Union[str, Path],
+        interval: float = 15.0,
+    ):
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.registry = registry
+        self.path = Path(path)
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "FileExporter":
+        self._thread = threading.Thread(
+            target=self._loop, name="metrics-file-exporter", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._write()
+
+    def _write(self) -> None:
+        try:
+            self.registry.write_file(self.path)
+        except OSError as e:
+            logger.warning(f"Could not write metrics to {self.path}: {e}")
+
+    def stop(self) -> None:
+        """Stop the writer and write a final snapshot."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._write()
+
+
+class HttpExporter:
+    """Serves the registry at ``/metrics`` on a local port.
+
+    Binds to the loopback interface by default; ``port=0`` picks a free
+    port, available as :attr:`port` once started.
+    """
+
+    def __init__(
+        self, registry: MetricsRegistry, port: int = 0, host: str = "127.0.0.1"
+    ):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "HttpExporter":
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                logger.debug(f"metrics {self.address_string()}: {format % args}")
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="metrics-http", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Serving metrics on {self.url}")
+        return self
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/metrics"
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -7,21 +7,69 @@ through orchestrated teamwork, cross-validation, and consensus building.
 """
 
 import asyncio
+import functools
 import json
 import logging
 import os
+import random
+import shlex
 import subprocess
 import sys
 import time
+from collections import defaultdict
+from contextlib import nullcontext
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 # Add the project root to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from .agent_workers import SUBPROCESS, WorkerPoolBackend
+from .assignment import TaskAssigner
+from .backends import (
+    BACKENDS,
+    INLINE,
+    AgentBackend,
+    TaskFn,
+    TaskPayload,
+    create_backend,
+)
+from .capabilities import CapabilityIndex, get_capability_index
+from .consensus import ConsensusEngine, ConsensusPolicy
+from .hedging import HedgePolicy, Hedger
+from .ids import new_id
+from .message_bus import MessageBus
+from .message_log import MessageLog
+from .metrics import (
+    CoordinatorMetrics,
+    FileExporter,
+    HttpExporter,
+    MetricsRegistry,
+)
+from .planners import PlannerBackend, PlanningRequest, TemplatePlanner
+from .profiling import MemoryProfiler, SamplingProfiler
+from .resilience import BreakerPolicy, CircuitBreaker, CircuitOpenError, RetryPolicy
+from .result_cache import ResultCache, cache_key
+from .role_pools import RoleLimit, RolePool, RolePoolFullError
+from .scheduler import CRITICAL_PATH, POLICIES, TaskGraph
+from .session_store import SessionStore, SQLiteSessionStore
 from .tmp_manager import TmpManager, get_tmp_manager
+from .tracing import AnySpan, OTLPJsonFileExporter, Span, Tracer, current_span
 
 # Configure logging
 logging.basicConfig(
@@ -29,6 +77,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Wall-clock deadline of the task attempt being executed, if it has one.
+_task_deadline: ContextVar[Optional[float]] = ContextVar("task_deadline", default=None)
+
+
+class TaskTimeoutError(TimeoutError):
+    """Raised when a task exceeds its timeout or its session's deadline."""
+
 
 class AgentRole(Enum):
     PLANNER = "planner"
@@ -57,7 +112,7 @@ class MessageType(Enum):
     SOLUTION_PROPOSAL = "solution_proposal"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentMessage:
     """Message structure for inter-agent communication."""
 
@@ -66,10 +121,12 @@ class AgentMessage:
     message_type: MessageType
     content: Dict[str, Any]
     timestamp: float = field(default_factory=time.time)
-    message_id: str = field(default_factory=lambda: f"msg_{int(time.time() * 1000)}")
+    message_id: str = field(default_factory=lambda: new_id("msg"))
+    # Session the message belongs to; resolved from the roles when omitted.
+    session_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Represents a task in the multi-agent workflow."""
 
@@ -83,7 +140,7 @@ class Task:
     completed_at: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MultiAgentSession:
     """Manages a multi-agent problem-solving session."""
 
@@ -91,69 +148,167 @@ class MultiAgentSession:
     problem_description: str
     participating_agents: List[AgentRole]
     tasks: List[Task] = field(default_factory=list)
-    messages: List[AgentMessage] = field(default_factory=list)
+    # Columnar history; payloads are spilled to a temporary file.
+    messages: MessageLog = field(default_factory=lambda: MessageLog(AgentMessage))
     consensus_threshold: float = 0.8  # Percentage of agents needed for consensus
     created_at: float = field(default_factory=time.time)
     completed_at: Optional[float] = None
+    # Inputs the tasks' results depend on (e.g. the code revision); part of
+    # the result cache key.
+    context: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        # A plain list of messages is accepted and copied into a log.
+        messages: Iterable[AgentMessage] = self.messages
+        if not isinstance(messages, MessageLog):
+            self.messages = MessageLog(AgentMessage, messages)
 
 
 class AgentCoordinator:
     """Coordinates communication and task assignment between agents."""
 
-    def __init__(self, workspace_root: Path):
+    def __init__(
+        self,
+        workspace_root: Path,
+        role_limits: Optional[Dict[AgentRole, RoleLimit]] = None,
+        backend: Union[str, AgentBackend] = INLINE,
+        max_workers: Optional[int] = None,
+        task_fn: Optional[TaskFn] = None,
+        scheduling_policy: str = CRITICAL_PATH,
+        role_estimates: Optional[Dict[AgentRole, float]] = None,
+        session_store: Optional[SessionStore] = None,
+        planner: Optional[PlannerBackend] = None,
+        consensus_policy: Optional[ConsensusPolicy] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        result_cache: Optional[ResultCache] = None,
+        task_timeout: Optional[float] = None,
+        retry_policies: Optional[Dict[AgentRole, RetryPolicy]] = None,
+        breaker_policy: Optional[BreakerPolicy] = None,
+        fallback_roles: Optional[Dict[AgentRole, AgentRole]] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        tracer: Optional[Tracer] = None,
+    ):
+        if scheduling_policy not in POLICIES:
+            raise ValueError(f"Unknown scheduling policy: {scheduling_policy}")
         self.workspace_root = workspace_root
+        if isinstance(backend, str):
+            backend = create_backend(backend, task_fn, max_workers)
+        self.backend = backend
+        self.scheduling_policy = scheduling_policy
+        # Expected seconds per task for each role; refined from observed
+        # durations as tasks complete.
+        self.role_estimates: Dict[AgentRole, float] = dict(role_estimates or {})
         self.active_sessions: Dict[str, MultiAgentSession] = {}
+        self.session_store = session_store
+        self.planner = planner or TemplatePlanner()
+        self.consensus_policy = consensus_policy or ConsensusPolicy()
+        # Duplicate attempts for straggling tasks (disabled without a policy).
+        self.hedger = Hedger(hedge_policy) if hedge_policy else None
+        # Results reused across sessions (disabled without a cache).
+        self.result_cache = result_cache
+        self._cache_counts: Dict[str, Dict[str, int]] = {}
+        # Seconds a single task may run (None: no limit).
+        self.task_timeout = task_timeout
+        # Failed attempts are retried per role; roles whose backend keeps
+        # failing are cut off by a circuit breaker (disabled without a
+        # policy) and their tasks go to the fallback role, if any.
+        self.retry_policies = dict(retry_policies or {})
+        self.breaker_policy = breaker_policy
+        self.fallback_roles = dict(fallback_roles or {})
+        self._breakers: Dict[AgentRole, CircuitBreaker] = {}
+        self._rng = random.Random()
+        # Cancellation events of running sessions, with their event loops.
+        self._cancel_events: Dict[
+            str, Tuple[asyncio.AbstractEventLoop, asyncio.Event]
+        ] = {}
+        # Throughput and latency metrics, exportable as OpenMetrics text; pass
+        # a shared registry to aggregate several coordinators.
+        self.metrics = metrics or MetricsRegistry()
+        self._metrics = CoordinatorMetrics(self.metrics)
+        # Session timelines as spans (disabled without an exporter); each
+        # session's trace hangs off its session span until it finishes.
+        self.tracer = tracer or Tracer()
+        self._session_spans: Dict[str, AnySpan] = {}
+        self.message_bus = MessageBus()
+        self.role_limits = dict(role_limits or {})
+        self._role_pools: Dict[AgentRole, RolePool] = {}
         self.agent_capabilities = self._load_agent_capabilities()
+        self._assigner: Optional[TaskAssigner] = None
         self.tmp_manager = get_tmp_manager("agentic-dev-boilerplate")
 
-    def _load_agent_capabilities(self) -> Dict[AgentRole, List[str]]:
-        """Load agent capabilities from instruction files."""
-        capabilities = {}
-        instructions_dir = self.workspace_root / ".github" / "instructions"
+    def close(self) -> None:
+        """Shut down the execution backend and flush the session store.
 
-        if instructions_dir.exists():
-            for instruction_file in instructions_dir.glob("*.instructions.md"):
-                agent_name = instruction_file.stem
-                try:
-                    role = AgentRole(agent_name)
-                    # Parse capabilities from instruction file
-                    with open(instruction_file, "r") as f:
-                        content = f.read()
-                        # Extract responsibilities from the file
-                        capabilities[role] = self._extract_capabilities(content)
-                except ValueError:
-                    continue
+        Message histories of sessions still open are discarded (closing any
+        spill files), and their trace spans end.
+        """
+        for session in self.active_sessions.values():
+            session.messages.close()
+        for span in self._session_spans.values():
+            span.end()
+        self._session_spans.clear()
+        self.backend.shutdown(wait=True)
+        self.tracer.shutdown()
+        if self.session_store:
+            self.session_store.close()
 
-        return capabilities
+    def __enter__(self) -> "AgentCoordinator":
+        return self
 
-    def _extract_capabilities(self, content: str) -> List[str]:
-        """Extract agent capabilities from instruction content."""
-        capabilities = []
-        lines = content.split("\n")
-        in_responsibilities = False
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
-        for line in lines:
-            if "**Core Responsibilities**:" in line:
-                in_responsibilities = True
-                continue
-            elif in_responsibilities and line.strip().startswith("- "):
-                capabilities.append(line.strip()[2:])
-            elif in_responsibilities and line.strip() and not line.startswith(" "):
-                break
+    def _capability_index(self) -> CapabilityIndex:
+        instructions_dir = self.workspace_root / ".github" / "instructions"
+        return get_capability_index(instructions_dir)
 
-        return capabilities
+    def _load_agent_capabilities(self) -> Dict[AgentRole, List[str]]:
+        """Load agent capabilities from the cached instruction-file index."""
+        return self._capability_index().resolve(AgentRole)
+
+    @property
+    def task_assigner(self) -> TaskAssigner:
+        """BM25 role matcher over the agents' instruction files (built once)."""
+        if self._assigner is None:
+            self._assigner = TaskAssigner.for_roles(AgentRole, self._capability_index())
+        return self._assigner
 
     def create_session(
-        self, problem_description: str, required_agents: List[AgentRole]
+        self,
+        problem_description: str,
+        required_agents: List[AgentRole],
+        consensus_threshold: float = 0.8,
+        context: Optional[Dict[str, Any]] = None,
     ) -> str:
-        """Create a new multi-agent problem-solving session."""
-        session_id = f"session_{int(time.time() * 1000)}"
-        session = MultiAgentSession(
-            session_id=session_id,
-            problem_description=problem_description,
-            participating_agents=required_agents,
+        """Create a new multi-agent problem-solving session.
+
+        ``context`` describes the inputs the session works on, such as the
+        code revision; cached task results are only reused within the same
+        context.
+        """
+        session_id = new_id("session")
+        # Root of the session's trace; open until the session finishes
+        # executing (or is closed), so it covers all of its children.
+        session_span = self.tracer.span(
+            "session",
+            attributes={
+                "session.id": session_id,
+                "session.agents": [a.value for a in required_agents],
+            },
         )
-        self.active_sessions[session_id] = session
+        with self.tracer.span("create_session", parent=session_span):
+            session = MultiAgentSession(
+                session_id=session_id,
+                problem_description=problem_description,
+                participating_agents=required_agents,
+                consensus_threshold=consensus_threshold,
+                context=dict(context or {}),
+            )
+            self.active_sessions[session_id] = session
+            self.message_bus.register_session(session_id, required_agents)
+            self._save_session(session)
+        self._session_spans[session_id] = session_span
+        self._metrics.sessions_created.inc()
         logger.info(
             f"Created multi-agent session {session_id} with agents: {[a.value for a in required_agents]}"
         )
@@ -161,152 +316,869 @@ class AgentCoordinator:
 
     def decompose_problem(self, session_id: str) -> List[Task]:
         """Decompose a complex problem into agent-specific tasks."""
+        session = self._get_session(session_id)
+
+        with self.tracer.span(
+            "decompose_problem",
+            parent=self._session_spans.get(session_id),
+            attributes={"session.id": session_id},
+        ) as span:
+            # Use planner agent to decompose the problem
+            (plan,) = self.planner.plan([self._planning_request(session)])
+            tasks = self._create_tasks([(session, plan)])[session_id]
+            span.set_attribute("session.tasks", len(tasks))
+        return tasks
+
+    def decompose_many(
+        self, session_ids: List[str], max_concurrent_batches: int = 4
+    ) -> Dict[str, List[Task]]:
+        """Blocking wrapper around :meth:`decompose_many_async`."""
+        return asyncio.run(
+            self.decompose_many_async(session_ids, max_concurrent_batches)
+        )
+
+    async def decompose_many_async(
+        self, session_ids: List[str], max_concurrent_batches: int = 4
+    ) -> Dict[str, List[Task]]:
+        """Decompose many sessions with batched planner calls.
+
+        Problems go to the planner ``planner.batch_size`` at a time, with up
+        to ``max_concurrent_batches`` batches in flight; each batch is turned
+        into tasks as soon as it returns. Returns tasks by session ID.
+        """
+        sessions = {
+            session_id: self._get_session(session_id)
+            for session_id in dict.fromkeys(session_ids)
+        }
+        requests = [self._planning_request(session) for session in sessions.values()]
+        size = self.planner.batch_size
+        batches = [requests[i : i + size] for i in range(0, len(requests), size)]
+        semaphore = asyncio.Semaphore(max_concurrent_batches)
+
+        async def plan_batch(
+            batch: List[PlanningRequest],
+        ) -> Tuple[List[PlanningRequest], List[List[str]]]:
+            async with semaphore:
+                return batch, await self.planner.plan_async(batch)
+
+        pending = [asyncio.ensure_future(plan_batch(batch)) for batch in batches]
+        results: Dict[str, List[Task]] = {}
+        try:
+            for future in asyncio.as_completed(pending):
+                batch, plans = await future
+                results.update(
+                    self._create_tasks(
+                        [
+                            (sessions[request.session_id], plan)
+                            for request, plan in zip(batch, plans)
+                        ]
+                    )
+                )
+        finally:
+            for future in pending:
+                future.cancel()
+        logger.info(
+            f"Decomposed {len(sessions)} problems in {len(batches)} planner calls"
+        )
+        return {session_id: results[session_id] for session_id in sessions}
+
+    def _get_session(self, session_id: str) -> MultiAgentSession:
         session = self.active_sessions.get(session_id)
         if not session:
             raise ValueError(f"Session {session_id} not found")
+        return session
 
-        # Use planner agent to decompose the problem
-        tasks = self._call_planner_agent(
-            session.problem_description, session.participating_agents
+    def _planning_request(self, session: MultiAgentSession) -> PlanningRequest:
+        return PlanningRequest(
+            session_id=session.session_id,
+            problem=session.problem_description,
+            agents=tuple(agent.value for agent in session.participating_agents),
         )
 
-        # Create task objects
-        task_objects = []
-        for i, task_desc in enumerate(tasks):
-            # Assign task to most appropriate agent
-            assigned_agent = self._assign_task_to_agent(
-                task_desc, session.participating_agents
-            )
-            task = Task(
-                task_id=f"{session_id}_task_{i}",
-                description=task_desc,
-                assigned_agent=assigned_agent,
-            )
-            task_objects.append(task)
-
-        session.tasks = task_objects
-        return task_objects
-
-    def _call_planner_agent(self, problem: str, agents: List[AgentRole]) -> List[str]:
-        """Call the planner agent to decompose the problem."""
-        # This would invoke the actual planner agent
-        # For now, return a simple decomposition
-        return [
-            f"Analyze {problem} from {agents[0].value} perspective",
-            f"Validate solution components",
-            f"Integrate and test final solution",
-        ]
-
-    def _assign_task_to_agent(
-        self, task_desc: str, available_agents: List[AgentRole]
-    ) -> AgentRole:
-        """Assign a task to the most appropriate agent."""
-        # Simple assignment logic - in practice, this would be more sophisticated
-        task_lower = task_desc.lower()
-
-        if "plan" in task_lower or "decompose" in task_lower:
-            return AgentRole.PLANNER
-        elif "test" in task_lower or "validate" in task_lower:
-            return AgentRole.TESTER
-        elif "debug" in task_lower or "fix" in task_lower:
-            return AgentRole.DEBUGGER
-        elif "deploy" in task_lower or "production" in task_lower:
-            return AgentRole.DEPLOYER
-        else:
-            return available_agents[0]  # Default to first agent
+    def _create_tasks(
+        self, plans: List[Tuple[MultiAgentSession, List[str]]]
+    ) -> Dict[str, List[Task]]:
+        """Turn planned descriptions into tasks for each session.
+
+        Sessions with the same participants share one assignment batch.
+        """
+        groups: Dict[Tuple[AgentRole, ...], List] = defaultdict(list)
+        for session, plan in plans:
+            groups[tuple(session.participating_agents)].append((session, plan))
+
+        created = {}
+        for agents, members in groups.items():
+            descriptions = [desc for _, plan in members for desc in plan]
+            assigned_agents = iter(self.assign_tasks(descriptions, list(agents)))
+            for session, plan in members:
+                session.tasks = [
+                    Task(
+                        task_id=new_id("task"),
+                        description=task_desc,
+                        assigned_agent=next(assigned_agents),
+                    )
+                    for task_desc in plan
+                ]
+                self._save_session(session)
+                created[session.session_id] = session.tasks
+        return created
+
+    def assign_tasks(
+        self, task_descs: List[str], available_agents: List[AgentRole]
+    ) -> List[AgentRole]:
+        """Assign each task to the best-matching available agent.
+
+        Ties go to the agent with the least queued and in-flight work.
+        """
+        loads: Dict[AgentRole, float] = {
+            role: pool.queue_depth + pool.in_flight
+            for role, pool in self._role_pools.items()
+        }
+        with self.tracer.span(
+            "assign_tasks",
+            attributes={
+                "assign.tasks": len(task_descs),
+                "assign.agents": [a.value for a in available_agents],
+            },
+        ):
+            return self.task_assigner.assign(task_descs, available_agents, loads)
+
+    def execute_session(
+        self, session_id: str, timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Execute a multi-agent problem-solving session.
+
+        Blocking wrapper around :meth:`execute_session_async`; call that one
+        directly from code that already runs an event loop.
+        """
+        return asyncio.run(self.execute_session_async(session_id, timeout))
 
-    def execute_session(self, session_id: str) -> Dict[str, Any]:
-        """Execute a multi-agent problem-solving session."""
+    async def execute_session_async(
+        self, session_id: str, timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Execute a session, running tasks as soon as their dependencies finish.
+
+        With a ``timeout`` (seconds), the session is interrupted at its
+        deadline like :meth:`cancel_session` would, and partial results are
+        returned.
+        """
         session = self.active_sessions.get(session_id)
         if not session:
             raise ValueError(f"Session {session_id} not found")
 
         logger.info(f"Starting execution of session {session_id}")
+        return await self._execute(session, timeout=timeout)
+
+    def resume_session(
+        self, session_id: str, timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Blocking wrapper around :meth:`resume_session_async`."""
+        return asyncio.run(self.resume_session_async(session_id, timeout))
+
+    async def resume_session_async(
+        self, session_id: str, timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Finish a session, re-running only tasks that did not complete.
+
+        The session is loaded from the session store when it is not active in
+        this process (e.g. after a crash); completed results are reused.
+        """
+        session = self.active_sessions.get(session_id)
+        if session is None and self.session_store:
+            record = self.session_store.load_session(session_id)
+            if record:
+                session = _session_from_record(record)
+                self.active_sessions[session_id] = session
+        if not session:
+            raise ValueError(f"Session {session_id} not found")
 
-        # Execute tasks (in practice, this would coordinate actual agent execution)
-        results = {}
         for task in session.tasks:
-            logger.info(
-                f"Executing task {task.task_id} with agent {task.assigned_agent.value}"
-            )
-            task.status = TaskStatus.IN_PROGRESS
+            if task.status != TaskStatus.COMPLETED:
+                task.status = TaskStatus.PENDING
+        reused = sum(t.status == TaskStatus.COMPLETED for t in session.tasks)
+        logger.info(
+            f"Resuming session {session_id}: {reused} of {len(session.tasks)} "
+            f"tasks already completed"
+        )
+        return await self._execute(session, skip_completed=True, timeout=timeout)
 
-            # Simulate agent execution
-            result = self._execute_agent_task(task)
-            task.results = result
-            task.status = TaskStatus.COMPLETED
-            task.completed_at = time.time()
+    def cancel_session(self, session_id: str) -> bool:
+        """Interrupt a running session; safe to call from any thread.
 
-            results[task.task_id] = result
+        In-flight tasks are cancelled and marked FAILED, tasks that never
+        started are marked BLOCKED, and the session's execute call returns
+        the results finished so far. Returns False if the session is not
+        running.
+        """
+        running = self._cancel_events.get(session_id)
+        if running is None:
+            return False
+        loop, event = running
+        logger.info(f"Cancelling session {session_id}")
+        loop.call_soon_threadsafe(event.set)
+        return True
+
+    def close_session(self, session_id: str) -> None:
+        """Forget a finished session and release its message history.
+
+        The session leaves message routing, and its message log (with any
+        spill file) is closed. A session store keeps its record, so it can
+        still be loaded or resumed. Raises ``ValueError`` while the session
+        is running.
+        """
+        if session_id in self._cancel_events:
+            raise ValueError(f"Session {session_id} is still running")
+        session = self.active_sessions.pop(session_id, None)
+        if session is None:
+            return
+        self.message_bus.unregister_session(session_id)
+        session.messages.close()
+        session_span = self._session_spans.pop(session_id, None)
+        if session_span is not None:
+            session_span.end()
 
-        # Build consensus
-        consensus = self._build_consensus(session, results)
+    async def _execute(
+        self,
+        session: MultiAgentSession,
+        skip_completed: bool = False,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        # Only running sessions take part in role-based message routing, so
+        # finished ones do not make later sessions' messages ambiguous.
+        self.message_bus.register_session(
+            session.session_id, session.participating_agents
+        )
+        session_span = self._session_spans.pop(session.session_id, None)
+        try:
+            with self.tracer.span(
+                "execute_session",
+                parent=session_span,
+                attributes={
+                    "session.id": session.session_id,
+                    "session.resumed": skip_completed,
+                },
+            ) as span:
+                result = await self._run_session(session, skip_completed, timeout)
+                span.set_attribute("session.results", len(result["results"]))
+                span.set_attribute("session.errors", len(result["errors"]))
+                if result["interrupted"]:
+                    span.set_attribute("session.interrupted", result["interrupted"])
+        finally:
+            self.message_bus.unregister_session(session.session_id)
+            if session_span is not None:
+                session_span.end()
+        return result
+
+    async def _run_session(
+        self,
+        session: MultiAgentSession,
+        skip_completed: bool,
+        timeout: Optional[float],
+    ) -> Dict[str, Any]:
+        engine = self._consensus_engine(session)
+        if self.result_cache:
+            self._cache_counts[session.session_id] = {"hits": 0, "misses": 0}
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout is not None else None
+        cancelled = asyncio.Event()
+        self._cancel_events[session.session_id] = (loop, cancelled)
+        try:
+            results = await self._run_task_graph(
+                session, skip_completed, engine, deadline, cancelled
+            )
+        finally:
+            del self._cancel_events[session.session_id]
+        interrupted = None
+        if cancelled.is_set():
+            interrupted = "cancelled"
+        elif deadline is not None and loop.time() >= deadline:
+            interrupted = "deadline"
+        with self.tracer.span(
+            "consensus", attributes={"session.id": session.session_id}
+        ) as span:
+            if engine.decision is None:
+                # Tasks that never produced a result count against consensus.
+                engine.fail_outstanding()
+            consensus = engine.summary(len(session.participating_agents))
+            span.set_attribute("consensus.reached", consensus["consensus_reached"])
+            span.set_attribute("consensus.decided_early", engine.decided_early)
+            span.set_attribute("consensus.reported", consensus["results_reported"])
+            span.set_attribute("consensus.failed", consensus["results_failed"])
+        if engine.decided_at is not None:
+            self._metrics.consensus_latency.observe(
+                engine.decided_at - engine.started_at
+            )
+        if interrupted:
+            outcome = interrupted
+        else:
+            outcome = "consensus" if consensus["consensus_reached"] else "no_consensus"
+        self._metrics.sessions_completed.labels(outcome).inc()
+        errors = {
+            task.task_id: task.results["error"]
+            for task in session.tasks
+            if task.status != TaskStatus.COMPLETED and "error" in task.results
+        }
         session.completed_at = time.time()
+        if self.session_store:
+            self.session_store.record_session(session)
+            self.session_store.flush()
 
         return {
-            "session_id": session_id,
+            "session_id": session.session_id,
             "results": results,
             "consensus": consensus,
+            "role_stats": self.role_stats(),
+            "hedging": self.hedger.stats() if self.hedger else None,
+            "cache": self._cache_counts.pop(session.session_id, None),
+            "interrupted": interrupted,
+            "errors": errors,
+            "breakers": self.breaker_stats() if self.breaker_policy else None,
             "completed_at": session.completed_at,
         }
 
-    def _execute_agent_task(self, task: Task) -> Dict[str, Any]:
-        """Execute a task with the assigned agent."""
-        # In practice, this would invoke the actual agent
-        # For now, simulate agent execution
-        time.sleep(0.1)  # Simulate processing time
+    async def _run_task_graph(
+        self,
+        session: MultiAgentSession,
+        skip_completed: bool = False,
+        consensus: Optional[ConsensusEngine] = None,
+        deadline: Optional[float] = None,
+        cancelled: Optional[asyncio.Event] = None,
+    ) -> Dict[str, Any]:
+        """Run the session's task DAG; independent tasks run concurrently.
+
+        Ready tasks are submitted to their role's pool, so a full ready
+        queue holds back further submissions (or rejects them). Under the
+        ``critical_path`` policy, tasks with the longest estimated remaining
+        path are submitted, and granted slots, first. If a task fails (after
+        its retries), it is marked FAILED with an ``error`` result and its
+        dependents BLOCKED; the rest of the graph keeps running. Tasks whose
+        role's circuit is open go to the role's fallback, or are marked
+        BLOCKED straight away. A full ``reject`` pool still raises, after
+        cancelling tasks in flight. With ``skip_completed``, tasks already
+        COMPLETED keep their results and only release their dependents.
+        Task transitions are persisted once per scheduling tick.
+
+        Each result is fed to ``consensus``; if its policy terminates early,
+        the graph stops once the outcome is decided: in-flight tasks are
+        cancelled, and they and all unstarted tasks are marked BLOCKED.
+        Only finished tasks appear in the returned results.
+
+        Timeouts count as failures. Once ``deadline``
+        (on the loop's clock) passes or ``cancelled`` is set, the graph is
+        interrupted: in-flight tasks are cancelled and marked FAILED, and
+        unstarted tasks are marked BLOCKED.
+
+        Each task runs in a ``run_task`` span whose parent is the span of the
+        dependency that finished last (other dependencies become links);
+        tasks without traced dependencies hang off the current span.
+        """
+        loop = asyncio.get_running_loop()
+        graph = TaskGraph(session.tasks)
+        results: Dict[str, Any] = {}
+        graph_span = current_span()
+        task_spans: Dict[str, Span] = {}
+        running: Dict[asyncio.Future, Task] = {}
+        # Ready tasks whose pool queue was full; submitted by the main loop.
+        deferred: List[str] = []
+        priorities: Dict[str, float] = {}
+        if self.scheduling_policy == CRITICAL_PATH:
+            priorities = graph.critical_path(self.estimate_duration)
+
+        def block_dependents(task: Task) -> None:
+            for task_id in graph.descendants(task.task_id):
+                graph.tasks[task_id].status = TaskStatus.BLOCKED
+                self._record_task(session, graph.tasks[task_id])
+
+        interrupted = False
+        cancel_waiter = asyncio.ensure_future(cancelled.wait()) if cancelled else None
+
+        def stopped() -> bool:
+            return interrupted or (consensus is not None and consensus.should_stop)
+
+        async def wait(futures: Iterable[asyncio.Future]) -> Set[asyncio.Future]:
+            # Wait for one of ``futures``, or until the graph is interrupted.
+            nonlocal interrupted
+            waiting = set(futures)
+            if cancel_waiter is not None:
+                waiting.add(cancel_waiter)
+            timeout = None if deadline is None else max(deadline - loop.time(), 0)
+            done, _ = await asyncio.wait(
+                waiting, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            if cancel_waiter in done or (
+                deadline is not None and loop.time() >= deadline
+            ):
+                interrupted = True
+            done.discard(cancel_waiter)
+            return done
+
+        def fail(task: Task, error: Exception) -> None:
+            # Only this task's branch of the graph is lost.
+            logger.warning(f"Task {task.task_id} failed: {error}")
+            block_dependents(task)
+            if consensus is not None:
+                consensus.observe_failure(task.task_id)
+
+        def span_parent(task: Task) -> Tuple[Optional[Span], List[Span]]:
+            # The dependency that finished last released the task.
+            spans = sorted(
+                (task_spans[d] for d in task.dependencies if d in task_spans),
+                key=lambda span: span.end_ns or 0,
+            )
+            if not spans:
+                return graph_span, []
+            return spans[-1], spans[:-1]
+
+        async def run(task: Task) -> Optional[Dict[str, Any]]:
+            parent, links = span_parent(task)
+            try:
+                with self.tracer.span(
+                    "run_task",
+                    parent=parent,
+                    links=links,
+                    attributes={
+                        "task.id": task.task_id,
+                        "task.role": task.assigned_agent.value,
+                    },
+                ) as span:
+                    result = await self._run_task(session, task, deadline)
+            except Exception as e:
+                fail(task, e)
+                return None
+            if isinstance(span, Span):
+                task_spans[task.task_id] = span
+            results[task.task_id] = result
+            if consensus is not None:
+                consensus.observe(task.task_id, result.get("confidence", 0))
+                if stopped():
+                    return result
+            # Hand newly ready dependents to their pools before this task's
+            # slot is freed, so they compete for it by priority.
+            enqueue(graph.complete(task.task_id))
+            return result
+
+        def enqueue(task_ids: List[str]) -> None:
+            if priorities:
+                task_ids = sorted(task_ids, key=priorities.__getitem__, reverse=True)
+            for task_id in task_ids:
+                task = graph.tasks[task_id]
+                try:
+                    self._route(task)
+                except CircuitOpenError as e:
+                    self._fail_task(session, task, e, TaskStatus.BLOCKED)
+                    fail(task, e)
+                    continue
+                pool = self.role_pool(task.assigned_agent)
+                try:
+                    future = pool.submit_nowait(
+                        functools.partial(run, task), priorities.get(task_id, 0.0)
+                    )
+                except RolePoolFullError:
+                    task.status = TaskStatus.FAILED
+                    self._record_task(session, task)
+                    block_dependents(task)
+                    raise
+                if future is None:
+                    deferred.append(task_id)
+                else:
+                    running[future] = task
+
+        if skip_completed:
+            for task_id in graph.order:
+                task = graph.tasks[task_id]
+                if task.status == TaskStatus.COMPLETED:
+                    results[task_id] = task.results
+                    graph.complete(task_id)
+                    if consensus is not None:
+                        consensus.observe(task_id, task.results.get("confidence", 0))
 
+        try:
+            if not stopped():
+                enqueue(
+                    [t for t in graph.ready() if t not in results]
+                    if skip_completed
+                    else graph.ready()
+                )
+            while (running or deferred) and not stopped():
+                while deferred and not stopped():
+                    # Blocks until the pool has room: backpressure.
+                    task = graph.tasks[deferred[0]]
+                    admission = asyncio.ensure_future(
+                        self.role_pool(task.assigned_agent).submit(
+                            functools.partial(run, task),
+                            priorities.get(task.task_id, 0.0),
+                        )
+                    )
+                    if admission not in await wait([admission]):
+                        admission.cancel()
+                        break
+                    deferred.pop(0)
+                    running[admission.result()] = task
+                if stopped():
+                    break
+                for future in await wait(running):
+                    task = running.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        # A rejected dependent fails after its parent completed.
+                        if task.status != TaskStatus.COMPLETED:
+                            block_dependents(task)
+                        raise error
+                self._flush_store()
+        finally:
+            if cancel_waiter is not None:
+                cancel_waiter.cancel()
+            # Tasks cut off mid-run by an interrupt count as failed.
+            cut_off = [
+                task
+                for task in running.values()
+                if interrupted and task.status == TaskStatus.IN_PROGRESS
+            ]
+            for future in running:
+                future.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+            for task in cut_off:
+                task.status = TaskStatus.FAILED
+                self._record_task(session, task)
+            self._flush_store()
+
+        if stopped():
+            for task in session.tasks:
+                if task.status not in (TaskStatus.COMPLETED, TaskStatus.FAILED):
+                    task.status = TaskStatus.BLOCKED
+                    self._record_task(session, task)
+            self._flush_store()
+
+        # Report results in session order rather than completion order.
         return {
-            "agent": task.assigned_agent.value,
-            "task": task.description,
-            "result": f"Completed {task.description}",
-            "confidence": 0.9,
-            "timestamp": time.time(),
+            t.task_id: results[t.task_id] for t in session.tasks if t.task_id in results
         }
 
-    def _build_consensus(
-        self, session: MultiAgentSession, results: Dict[str, Any]
+    def role_pool(self, role: AgentRole) -> RolePool:
+        """Pool bounding concurrent tasks for ``role`` (created on first use)."""
+        pool = self._role_pools.get(role)
+        if pool is None:
+            pool = RolePool(
+                role.value,
+                self.role_limits.get(role),
+                on_wait=self._metrics.queue_wait.labels(role.value).observe,
+            )
+            self._role_pools[role] = pool
+        return pool
+
+    def estimate_duration(self, task: Task) -> float:
+        """Expected run time of ``task`` (1.0 for roles with no estimate)."""
+        return self.role_estimates.get(task.assigned_agent, 1.0)
+
+    def _observe_duration(self, role: AgentRole, seconds: float) -> None:
+        # Exponentially weighted so estimates track recent behaviour.
+        previous = self.role_estimates.get(role)
+        if previous is None:
+            self.role_estimates[role] = seconds
+        else:
+            self.role_estimates[role] = 0.8 * previous + 0.2 * seconds
+
+    def role_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Queue depth, in-flight count and wait times per role."""
+        return {role.value: pool.stats() for role, pool in self._role_pools.items()}
+
+    async def _run_task(
+        self,
+        session: MultiAgentSession,
+        task: Task,
+        deadline: Optional[float] = None,
     ) -> Dict[str, Any]:
-        """Build consensus from agent results."""
-        # Simple consensus building - in practice, this would be more sophisticated
-        total_confidence = sum(
-            result.get("confidence", 0) for result in results.values()
+        """Run one task with its assigned agent and record the outcome."""
+        key = self._cache_key(session, task)
+        cached = self._cached_result(session, key)
+        if cached is not None:
+            logger.info(f"Reusing cached result for task {task.task_id}")
+            return self._complete_task(session, task, cached)
+
+        logger.info(
+            f"Executing task {task.task_id} with agent {task.assigned_agent.value}"
         )
-        avg_confidence = total_confidence / len(results) if results else 0
+        task.status = TaskStatus.IN_PROGRESS
+        self._record_task(session, task)
+        started = time.perf_counter()
+        latency = self._metrics.task_latency.labels(task.assigned_agent.value)
+        try:
+            result = await self._execute_with_retries(task, deadline)
+        except asyncio.CancelledError:
+            task.status = TaskStatus.PENDING
+            self._record_task(session, task)
+            raise
+        except CircuitOpenError as e:
+            self._fail_task(session, task, e, TaskStatus.BLOCKED)
+            raise
+        except Exception as e:
+            latency.observe(time.perf_counter() - started)
+            self._fail_task(session, task, e, TaskStatus.FAILED)
+            raise
+        elapsed = time.perf_counter() - started
+        latency.observe(elapsed)
+        self._observe_duration(task.assigned_agent, elapsed)
+        if key is not None and self.result_cache is not None:
+            self.result_cache.put(key, result)
+        return self._complete_task(session, task, result)
 
-        consensus_reached = avg_confidence >= session.consensus_threshold
+    def _fail_task(
+        self,
+        session: MultiAgentSession,
+        task: Task,
+        error: Exception,
+        status: TaskStatus,
+    ) -> None:
+        task.results = {"error": f"{type(error).__name__}: {error}"}
+        task.status = status
+        self._record_task(session, task)
 
-        return {
-            "consensus_reached": consensus_reached,
-            "average_confidence": avg_confidence,
-            "participant_count": len(session.participating_agents),
-            "recommendation": (
-                "Proceed with solution"
-                if consensus_reached
-                else "Require additional review"
-            ),
-        }
+    def _complete_task(
+        self, session: MultiAgentSession, task: Task, result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        task.results = result
+        task.status = TaskStatus.COMPLETED
+        task.completed_at = time.time()
+        self._record_task(session, task)
+        return result
 
-    def send_message(self, message: AgentMessage) -> None:
-        """Send a message between agents."""
-        session = self._find_session_for_agents(message.sender, message.recipient)
-        if session:
-            session.messages.append(message)
+    def _cache_key(self, session: MultiAgentSession, task: Task) -> Optional[str]:
+        if self.result_cache is None:
+            return None
+        return cache_key(task.assigned_agent.value, task.description, session.context)
+
+    def _cached_result(
+        self, session: MultiAgentSession, key: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        if key is None or self.result_cache is None:
+            return None
+        result = self.result_cache.get(key)
+        counts = self._cache_counts.get(session.session_id)
+        if counts is not None:
+            counts["hits" if result is not None else "misses"] += 1
+        return result
+
+    def _save_session(self, session: MultiAgentSession) -> None:
+        if self.session_store:
+            self.session_store.save_session(session)
+            self.session_store.flush()
+
+    def _record_task(self, session: MultiAgentSession, task: Task) -> None:
+        self._metrics.tasks.labels(task.assigned_agent.value, task.status.value).inc()
+        if self.session_store:
+            self.session_store.record_task(session.session_id, task)
+
+    def _flush_store(self) -> None:
+        if self.session_store:
+            self.session_store.flush()
+
+    async def _execute_agent_task_async(self, task: Task) -> Dict[str, Any]:
+        """Execute a task on the configured backend without blocking the loop."""
+        payload = TaskPayload.from_task(task, deadline=_task_deadline.get())
+        return await self.backend.submit(payload)
+
+    def breaker(self, role: AgentRole) -> Optional[CircuitBreaker]:
+        """Circuit breaker for ``role`` (None without a breaker policy)."""
+        if self.breaker_policy is None:
+            return None
+        breaker = self._breakers.get(role)
+        if breaker is None:
+            breaker = CircuitBreaker(role.value, self.breaker_policy)
+            self._breakers[role] = breaker
+        return breaker
+
+    def breaker_stats(self) -> Dict[str, Dict[str, Any]]:
+        """State and failure counts of each role's circuit breaker."""
+        return {role.value: b.stats() for role, b in self._breakers.items()}
+
+    def _route(self, task: Task) -> None:
+        """Move ``task`` off a role whose circuit rejects attempts.
+
+        That is an open circuit, or a half-open one whose trial slots are
+        all taken. Follows the fallback chain to the first role with a
+        usable circuit and reassigns the task to it; raises
+        :class:`CircuitOpenError` when there is none.
+        """
+        role = task.assigned_agent
+        tried = []
+        while (breaker := self.breaker(role)) is not None and breaker.rejecting:
+            tried.append(role.value)
+            fallback = self.fallback_roles.get(role)
+            if fallback is None or fallback.value in tried:
+                raise CircuitOpenError(f"Circuit open for {', '.join(tried)}")
+            role = fallback
+        if role != task.assigned_agent:
             logger.info(
-                f"Message {message.message_id} sent from {message.sender.value} to {message.recipient.value}"
+                f"Rerouting task {task.task_id} from "
+                f"{task.assigned_agent.value} to {role.value}"
             )
+            task.assigned_agent = role
+
+    async def _execute_with_retries(
+        self, task: Task, deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Execute a task, retrying failed attempts per the role's policy."""
+        policy = self.retry_policies.get(task.assigned_agent)
+        breaker = self.breaker(task.assigned_agent)
+        loop = asyncio.get_running_loop()
+        attempt = 1
+        while True:
+            if breaker is not None and not breaker.allow():
+                # The circuit went open or half-open since the task was
+                # routed; follow the fallback chain from here.
+                role = task.assigned_agent
+                self._route(task)
+                if task.assigned_agent == role:
+                    raise CircuitOpenError(f"Circuit open for {role.value}")
+                policy = self.retry_policies.get(task.assigned_agent)
+                breaker = self.breaker(task.assigned_agent)
+                continue
+            try:
+                result = await self._execute_with_timeout(task, deadline)
+            except asyncio.CancelledError:
+                if breaker is not None:
+                    breaker.release()
+                raise
+            except Exception as e:
+                if breaker is not None:
+                    breaker.record_failure()
+                if policy is None or not policy.should_retry(e, attempt):
+                    raise
+                delay = policy.backoff(attempt, self._rng)
+                if deadline is not None and loop.time() + delay >= deadline:
+                    raise
+                logger.warning(
+                    f"Task {task.task_id} attempt {attempt} failed ({e}); "
+                    f"retrying in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            if breaker is not None:
+                breaker.record_success()
+            return result
+
+    async def _execute_with_timeout(
+        self, task: Task, deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Execute a task within ``task_timeout`` and the session ``deadline``."""
+        timeout = self.task_timeout
+        if deadline is not None:
+            remaining = max(deadline - asyncio.get_running_loop().time(), 0.0)
+            timeout = remaining if timeout is None else min(timeout, remaining)
+        if timeout is None:
+            return await self._execute_with_hedging(task)
+        # Executor backends see the deadline, so queued work can be skipped.
+        _task_deadline.set(time.time() + timeout)
+        try:
+            async with asyncio.timeout(timeout) as scope:
+                return await self._execute_with_hedging(task)
+        except TimeoutError:
+            if not scope.expired():
+                raise
+            raise TaskTimeoutError(
+                f"Task {task.task_id} timed out after {timeout:.3g}s"
+            ) from None
+
+    async def _execute_with_hedging(self, task: Task) -> Dict[str, Any]:
+        """Execute a task, hedging it with a second attempt if it straggles."""
+        if self.hedger is None:
+            return await self._execute_agent_task_async(task)
+        result: Dict[str, Any] = await self.hedger.run(
+            task.assigned_agent, lambda: self._execute_agent_task_async(task)
+        )
+        return result
+
+    def _consensus_engine(self, session: MultiAgentSession) -> ConsensusEngine:
+        return ConsensusEngine(
+            session.consensus_threshold,
+            [(task.task_id, task.assigned_agent) for task in session.tasks],
+            self.consensus_policy,
+        )
+
+    def send_message(self, message: AgentMessage) -> None:
+        """Send a message between agents.
+
+        The message goes to ``message.session_id``; without one, it is routed
+        to the only session containing both roles (``ValueError`` if several
+        do). It is logged on the session and delivered to the recipient's
+        inbox.
+        """
+        if message.session_id is None:
+            session = self._find_session_for_agents(message.sender, message.recipient)
+            if not session:
+                logger.warning(
+                    f"No session includes {message.sender.value} and "
+                    f"{message.recipient.value}; message {message.message_id} dropped"
+                )
+                return
+            message.session_id = session.session_id
+        else:
+            session = self.active_sessions.get(message.session_id)
+            if not session:
+                raise ValueError(f"Session {message.session_id} not found")
+
+        self.message_bus.deliver(message)
+        session.messages.append(message)
+        self._metrics.messages_sent.labels(message.message_type.value).inc()
+        if self.session_store:
+            self.session_store.record_message(session.session_id, message)
+        logger.info(
+            f"Message {message.message_id} sent from {message.sender.value} to {message.recipient.value}"
+        )
+
+    async def receive_message(self, session_id: str, role: AgentRole) -> AgentMessage:
+        """Wait for the next message addressed to ``role`` in ``session_id``."""
+        return await self.message_bus.receive(session_id, role)
 
     def _find_session_for_agents(
         self, agent1: AgentRole, agent2: AgentRole
     ) -> Optional[MultiAgentSession]:
-        """Find a session that includes both agents."""
-        for session in self.active_sessions.values():
-            if (
-                agent1 in session.participating_agents
-                and agent2 in session.participating_agents
-            ):
-                return session
-        return None
+        """Find the session that includes both agents."""
+        session_id = self.message_bus.route(agent1, agent2)
+        return self.active_sessions.get(session_id) if session_id else None
+
+
+def _session_from_record(record: Dict[str, Any]) -> MultiAgentSession:
+    """Rebuild a session from a :class:`SessionStore` record."""
+    return MultiAgentSession(
+        session_id=record["session_id"],
+        problem_description=record["problem_description"],
+        participating_agents=[AgentRole(a) for a in record["participating_agents"]],
+        tasks=[
+            Task(
+                task_id=t["task_id"],
+                description=t["description"],
+                assigned_agent=AgentRole(t["assigned_agent"]),
+                status=TaskStatus(t["status"]),
+                dependencies=t["dependencies"],
+                results=t["results"],
+                created_at=t["created_at"],
+                completed_at=t["completed_at"],
+            )
+            for t in record["tasks"]
+        ],
+        messages=MessageLog(
+            AgentMessage,
+            [
+                AgentMessage(
+                    sender=AgentRole(m["sender"]),
+                    recipient=AgentRole(m["recipient"]),
+                    message_type=MessageType(m["message_type"]),
+                    content=m["content"],
+                    timestamp=m["timestamp"],
+                    message_id=m["message_id"],
+                    session_id=record["session_id"],
+                )
+                for m in record["messages"]
+            ],
+        ),
+        consensus_threshold=record["consensus_threshold"],
+        created_at=record["created_at"],
+        completed_at=record["completed_at"],
+        context=record.get("context", {}),
+    )
 
 
 def main():
@@ -321,7 +1193,7 @@ def main():
         default=Path.cwd(),
         help="Workspace root directory",
     )
-    parser.add_argument("--problem", "-p", required=True, help="Problem description")
+    parser.add_argument("--problem", "-p", help="Problem description")
     parser.add_argument(
         "--agents",
         "-a",
@@ -337,30 +1209,401 @@ def main():
         default=0.8,
         help="Consensus threshold (0.0-1.0)",
     )
+    parser.add_argument(
+        "--role-weight",
+        action="append",
+        default=[],
+        metavar="ROLE=WEIGHT",
+        help="Weight of a role's results in consensus (default 1.0); repeatable",
+    )
+    parser.add_argument(
+        "--quorum",
+        type=float,
+        default=0.0,
+        help="Share of total weight that must report for consensus (0.0-1.0)",
+    )
+    parser.add_argument(
+        "--early-consensus",
+        action="store_true",
+        help="Cancel outstanding tasks once consensus is decided either way",
+    )
+    parser.add_argument(
+        "--hedge-percentile",
+        type=float,
+        default=None,
+        help="Hedge tasks running past this per-role latency percentile (e.g. 95)",
+    )
+    parser.add_argument(
+        "--hedge-budget",
+        type=float,
+        default=0.1,
+        help="Maximum hedged attempts per task when hedging (default: 0.1)",
+    )
+    parser.add_argument(
+        "--context",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="Session context, e.g. revision=abc123; part of the cache key",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=None,
+        help="Reuse task results for this many seconds (enables the cache)",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=1024,
+        help="Results kept in memory when caching (default: 1024)",
+    )
+    parser.add_argument(
+        "--cache-disk",
+        action="store_true",
+        help="Also keep cached results on disk so later runs can reuse them",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="Session deadline in seconds; unfinished tasks are cancelled",
+    )
+    parser.add_argument(
+        "--task-timeout",
+        type=float,
+        default=None,
+        help="Seconds a single task may run before it is failed",
+    )
+    parser.add_argument(
+        "--retry",
+        action="append",
+        default=[],
+        metavar="ROLE=ATTEMPTS[:BASE_DELAY[:MAX_DELAY]]",
+        help="Retry a role's failed tasks with jittered backoff; repeatable",
+    )
+    parser.add_argument(
+        "--breaker-threshold",
+        type=int,
+        default=None,
+        help="Open a role's circuit after this many consecutive failures",
+    )
+    parser.add_argument(
+        "--breaker-reset",
+        type=float,
+        default=30.0,
+        help="Seconds an open circuit waits before a trial attempt (default: 30)",
+    )
+    parser.add_argument(
+        "--fallback",
+        action="append",
+        default=[],
+        metavar="ROLE=FALLBACK_ROLE",
+        help="Role that takes over a role's tasks while its circuit is open",
+    )
+    parser.add_argument(
+        "--role-limit",
+        action="append",
+        default=[],
+        metavar="ROLE=CONCURRENCY[:QUEUE[:block|reject]]",
+        help="Cap concurrent tasks (and queued tasks) for a role; repeatable",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default=INLINE,
+        help="Where agent task work runs; use process for CPU-bound tasks",
+    )
+    parser.add_argument(
+        "--worker-command",
+        action="append",
+        default=[],
+        metavar="ROLE=COMMAND",
+        help="Worker command line for a role on the subprocess backend "
+        "(default: the bundled echo worker); repeatable",
+    )
+    parser.add_argument(
+        "--max-tasks-per-worker",
+        type=int,
+        default=100,
+        help="Recycle subprocess workers after this many tasks (default: 100)",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help="Worker threads/processes for the thread and process backends",
+    )
+    parser.add_argument(
+        "--scheduling-policy",
+        choices=POLICIES,
+        default=CRITICAL_PATH,
+        help="Order in which ready tasks start (default: critical_path)",
+    )
+    parser.add_argument(
+        "--session-db",
+        type=Path,
+        default=None,
+        help="Persist sessions to this SQLite database so they can be resumed",
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="SESSION_ID",
+        default=None,
+        help="Resume a stored session, re-running only unfinished tasks",
+    )
+    parser.add_argument(
+        "--memprofile",
+        type=Path,
+        default=None,
+        help="Write per-phase tracemalloc allocation sites and growth to this JSON file",
+    )
+
+    parser.add_argument(
+        "--sample-profile",
+        type=Path,
+        default=None,
+        help="Sample stacks during the run and write collapsed stacks to this file",
+    )
+    parser.add_argument(
+        "--sample-rate",
+        type=float,
+        default=100.0,
+        help="Sampling rate in Hz for --sample-profile (default: 100)",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        type=Path,
+        default=None,
+        help="Write OpenMetrics coordinator metrics to this file periodically",
+    )
+    parser.add_argument(
+        "--metrics-interval",
+        type=float,
+        default=15.0,
+        help="Seconds between --metrics-file writes (default: 15)",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Serve OpenMetrics coordinator metrics on this localhost port",
+    )
+    parser.add_argument(
+        "--trace-file",
+        type=Path,
+        default=None,
+        help="Append session trace spans to this file as OTLP/JSON lines",
+    )
+    parser.add_argument(
+        "--trace-sample-ratio",
+        type=float,
+        default=1.0,
+        help="Share of sessions traced with --trace-file (default: 1.0)",
+    )
 
     args = parser.parse_args()
+    if args.resume and not args.session_db:
+        parser.error("--resume requires --session-db")
+    if not args.resume and not args.problem:
+        parser.error("--problem is required unless resuming a session")
+
+    profiler = MemoryProfiler() if args.memprofile else None
+    sampler = SamplingProfiler(args.sample_rate) if args.sample_profile else None
+
+    def phase(name: str) -> ContextManager[None]:
+        return profiler.phase(name) if profiler else nullcontext()
 
     # Convert agent strings to AgentRole enums
     agents = [AgentRole(agent) for agent in args.agents]
 
-    # Create coordinator
-    coordinator = AgentCoordinator(args.workspace)
+    role_limits = {}
+    for spec in args.role_limit:
+        role, _, limit = spec.partition("=")
+        try:
+            role_limits[AgentRole(role)] = RoleLimit.parse(limit)
+        except ValueError as e:
+            parser.error(f"--role-limit {spec}: {e}")
+
+    role_weights = {}
+    for spec in args.role_weight:
+        role, _, weight = spec.partition("=")
+        try:
+            role_weights[AgentRole(role)] = float(weight)
+        except ValueError as e:
+            parser.error(f"--role-weight {spec}: {e}")
+    try:
+        consensus_policy = ConsensusPolicy(
+            role_weights, args.quorum, args.early_consensus
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    hedge_policy = None
+    if args.hedge_percentile is not None:
+        try:
+            hedge_policy = HedgePolicy(
+                percentile=args.hedge_percentile, max_ratio=args.hedge_budget
+            )
+        except ValueError as e:
+            parser.error(str(e))
+    retry_policies = {}
+    for spec in args.retry:
+        role, _, policy = spec.partition("=")
+        try:
+            retry_policies[AgentRole(role)] = RetryPolicy.parse(policy)
+        except ValueError as e:
+            parser.error(f"--retry {spec}: {e}")
+    fallback_roles = {}
+    for spec in args.fallback:
+        role, _, fallback = spec.partition("=")
+        try:
+            fallback_roles[AgentRole(role)] = AgentRole(fallback)
+        except ValueError as e:
+            parser.error(f"--fallback {spec}: {e}")
+    breaker_policy = None
+    if args.breaker_threshold is not None:
+        try:
+            breaker_policy = BreakerPolicy(args.breaker_threshold, args.breaker_reset)
+        except ValueError as e:
+            parser.error(str(e))
+    backend = args.backend
+    if backend == SUBPROCESS:
+        commands: Dict[str, Sequence[str]] = {}
+        for spec in args.worker_command:
+            role, _, command = spec.partition("=")
+            if role not in {r.value for r in AgentRole} or not command:
+                parser.error(f"--worker-command {spec}: expected ROLE=COMMAND")
+            commands[role] = shlex.split(command)
+        try:
+            backend = WorkerPoolBackend(
+                commands,
+                max_workers=args.max_workers,
+                max_tasks_per_worker=args.max_tasks_per_worker,
+            )
+        except ValueError as e:
+            parser.error(str(e))
+    elif args.worker_command:
+        parser.error("--worker-command requires --backend subprocess")
+    result_cache = None
+    if args.cache_ttl is not None:
+        try:
+            result_cache = ResultCache(
+                max_entries=args.cache_size, ttl=args.cache_ttl, disk=args.cache_disk
+            )
+        except ValueError as e:
+            parser.error(str(e))
+    context = dict(spec.partition("=")[::2] for spec in args.context)
+    metrics = MetricsRegistry()
+    exporters: List[Union[FileExporter, HttpExporter]] = []
+    if args.metrics_file:
+        try:
+            exporters.append(
+                FileExporter(metrics, args.metrics_file, args.metrics_interval)
+            )
+        except ValueError as e:
+            parser.error(str(e))
+    if args.metrics_port is not None:
+        exporters.append(HttpExporter(metrics, args.metrics_port))
+    tracer = None
+    if args.trace_file:
+        try:
+            tracer = Tracer(
+                OTLPJsonFileExporter(args.trace_file), args.trace_sample_ratio
+            )
+        except ValueError as e:
+            parser.error(str(e))
+
+    if profiler:
+        profiler.start()
+    if sampler:
+        sampler.start()
+    try:
+        for exporter in exporters:
+            try:
+                exporter.start()
+            except OSError as e:
+                parser.error(f"--metrics-port {args.metrics_port}: {e}")
 
-    # Create and execute session
-    session_id = coordinator.create_session(args.problem, agents)
-    tasks = coordinator.decompose_problem(session_id)
+        # Create coordinator
+        with phase("load_agent_capabilities"):
+            coordinator = AgentCoordinator(
+                args.workspace,
+                role_limits=role_limits,
+                backend=backend,
+                max_workers=args.max_workers,
+                scheduling_policy=args.scheduling_policy,
+                consensus_policy=consensus_policy,
+                hedge_policy=hedge_policy,
+                result_cache=result_cache,
+                task_timeout=args.task_timeout,
+                retry_policies=retry_policies,
+                breaker_policy=breaker_policy,
+                fallback_roles=fallback_roles,
+                metrics=metrics,
+                tracer=tracer,
+                session_store=(
+                    SQLiteSessionStore(args.session_db) if args.session_db else None
+                ),
+            )
 
-    print(f"Created session {session_id} with {len(tasks)} tasks:")
-    for task in tasks:
-        print(f"  - {task.description} (assigned to {task.assigned_agent.value})")
+        # Closed on every path, so a failed session does not leak the
+        # backend, worker pools or session store.
+        with coordinator:
+            if args.resume:
+                with phase("resume_session"):
+                    result = coordinator.resume_session(args.resume, args.timeout)
+                print(f"Resumed session {args.resume}")
+            else:
+                # Create and execute session
+                with phase("create_session"):
+                    session_id = coordinator.create_session(
+                        args.problem, agents, args.consensus_threshold, context
+                    )
+                with phase("decompose_problem"):
+                    tasks = coordinator.decompose_problem(session_id)
 
-    # Execute the session
-    result = coordinator.execute_session(session_id)
+                print(f"Created session {session_id} with {len(tasks)} tasks:")
+                for task in tasks:
+                    print(
+                        f"  - {task.description} "
+                        f"(assigned to {task.assigned_agent.value})"
+                    )
 
-    print(
-        f"\nSession completed. Consensus reached: {result['consensus']['consensus_reached']}"
-    )
-    print(f"Average confidence: {result['consensus']['average_confidence']:.2f}")
+                # Execute the session
+                with phase("execute_session"):
+                    result = coordinator.execute_session(session_id, args.timeout)
+
+        for task_id, error in result["errors"].items():
+            print(f"Task {task_id} did not complete: {error}")
+        if result["interrupted"]:
+            print(
+                f"\nSession interrupted ({result['interrupted']}); partial results only"
+            )
+        print(
+            f"\nSession completed. Consensus reached: {result['consensus']['consensus_reached']}"
+        )
+        print(f"Average confidence: {result['consensus']['average_confidence']:.2f}")
+    finally:
+        # Also on errors and interrupts, so no exporter thread, server or
+        # timer is left behind and partial profiles are still written.
+        for exporter in exporters:
+            exporter.stop()
+        if args.metrics_file:
+            print(f"Metrics written to {args.metrics_file}")
+        if tracer:
+            tracer.shutdown()
+            print(f"Trace written to {args.trace_file}")
+
+        if profiler:
+            profiler.write(args.memprofile)
+            profiler.stop()
+            print(f"\nMemory profile written to {args.memprofile}")
+            print(profiler.format_summary())
+
+        if sampler:
+            sampler.stop()
+            sampler.write(args.sample_profile)
+            print(f"{sampler.samples} stack samples written to {args.sample_profile}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Generation Plans
+
+Describes what a boilerplate run would write: every output with its rendered
+hash, classified against the files already in the workspace.
+"""
+
+import difflib
+import hashlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+CREATE = "create"
+UPDATE = "update"
+UNCHANGED = "unchanged"
+
+
+@dataclass
+class PlannedOutput:
+    """One file a generation run would write."""
+
+    path: str  # Relative to the output directory
+    content: bytes
+    mode: Optional[int] = None
+    action: str = CREATE
+    diff: str = ""
+
+    @property
+    def sha256(self) -> str:
+        return hashlib.sha256(self.content).hexdigest()
+
+
+@dataclass
+class GenerationPlan:
+    """The full set of outputs for a run, compared with the workspace."""
+
+    output_dir: Path
+    outputs: List[PlannedOutput] = field(default_factory=list)
+    elapsed: float = 0.0
+    render_stats: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def build(
+        cls,
+        output_dir: Path,
+        outputs: Dict[str, PlannedOutput],
+        elapsed: float = 0.0,
+        render_stats: Optional[Dict[str, int]] = None,
+    ) -> "GenerationPlan":
+        """Classify planned outputs as create, update or unchanged."""
+        planned = []
+        for rel_path in sorted(outputs):
+            output = outputs[rel_path]
+            target = output_dir / rel_path
+            if target.is_file():
+                current = target.read_bytes()
+                mode_changed = (
+                    output.mode is not None
+                    and target.stat().st_mode & 0o777 != output.mode
+                )
+                if current == output.content and not mode_changed:
+                    output.action = UNCHANGED
+                else:
+                    output.action = UPDATE
+                    output.diff = _unified_diff(rel_path, current, output.content)
+            else:
+                output.action = CREATE
+            planned.append(output)
+        return cls(output_dir, planned, elapsed, render_stats or {})
+
+    def counts(self) -> Dict[str, int]:
+        """Number of outputs per action."""
+        counts = {CREATE: 0, UPDATE: 0, UNCHANGED: 0}
+        for output in self.outputs:
+            counts[output.action] += 1
+        return counts
+
+    def format(self, show_diffs: bool = True) -> str:
+        """Human-readable plan summary with unified diffs for updates."""
+        symbols = {CREATE: "+", UPDATE: "~", UNCHANGED: "="}
+        lines = [f"📋 Plan for {self.output_dir}"]
+        for output in self.outputs:
+            lines.append(
+                f"  {symbols[output.action]} {output.path} ({output.sha256[:12]})"
+            )
+        if show_diffs:
+            for output in self.outputs:
+                if output.diff:
+                    lines.append("")
+                    lines.append(output.diff.rstrip("\n"))
+
+        counts = self.counts()
+        lines.append("")
+        lines.append(
+            f"{counts[CREATE]} to create, {counts[UPDATE]} to update, "
+            f"{counts[UNCHANGED]} unchanged"
+        )
+        hits = self.render_stats.get("hits", 0)
+        misses = self.render_stats.get("misses", 0)
+        lines.append(
+            f"⏱️  Planned {len(self.outputs)} outputs in {self.elapsed * 1000:.1f} ms "
+            f"({misses} renders, {hits} cached)"
+        )
+        return "\n".join(lines)
+
+
+def _unified_diff(rel_path: str, current: bytes, planned: bytes) -> str:
+    before = current.decode("utf-8", errors="replace").splitlines(keepends=True)
+    after = planned.decode("utf-8", errors="replace").splitlines(keepends=True)
+    return "".join(
+        difflib.unified_diff(before, after, f"a/{rel_path}", f"b/{rel_path}")
+    )
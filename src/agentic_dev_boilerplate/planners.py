@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Planner Backends
+
+How :class:`AgentCoordinator` turns problem descriptions into task
+descriptions. A planner receives a batch of :class:`PlanningRequest` objects
+and returns one list of task descriptions per request, in order, so bursts
+of problems can share planner invocations (e.g. one model call or HTTP
+request per ``batch_size`` problems) instead of paying per-call overhead for
+each of them.
+
+- :class:`TemplatePlanner`: the built-in three-step decomposition (default).
+- :class:`CallablePlanner`: wraps any ``fn(requests) -> plans`` callable.
+
+Custom planners subclass :class:`PlannerBackend` and implement ``plan``; a
+planner that is natively asynchronous can override ``plan_async`` instead.
+"""
+
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Callable, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Problems per planner invocation unless a planner says otherwise.
+DEFAULT_BATCH_SIZE = 32
+
+PlanFn = Callable[[Sequence["PlanningRequest"]], List[List[str]]]
+
+
+@dataclass(frozen=True)
+class PlanningRequest:
+    """A problem to decompose and the roles available to solve it."""
+
+    session_id: str
+    problem: str
+    agents: Tuple[str, ...]
+
+
+class PlannerBackend(ABC):
+    """Batch interface for problem decomposition."""
+
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.batch_size = batch_size
+        self.calls = 0
+        self.problems = 0
+
+    @abstractmethod
+    def plan(self, requests: Sequence[PlanningRequest]) -> List[List[str]]:
+        """Task descriptions for each request (blocking)."""
+
+    async def plan_async(self, requests: Sequence[PlanningRequest]) -> List[List[str]]:
+        """Plan a batch without blocking the event loop.
+
+        Runs :meth:`plan` in a worker thread, so several batches can be in
+        flight at once.
+        """
+        return await asyncio.to_thread(self.plan, requests)
+
+    def _checked(
+        self, requests: Sequence[PlanningRequest], plans: List[List[str]]
+    ) -> List[List[str]]:
+        if len(plans) != len(requests):
+            raise ValueError(
+                f"Planner returned {len(plans)} plans for {len(requests)} problems"
+            )
+        self.calls += 1
+        self.problems += len(requests)
+        return plans
+
+
+class TemplatePlanner(PlannerBackend):
+    """Fixed analyse/validate/integrate decomposition.
+
+    ``call_seconds`` and ``problem_seconds`` simulate the fixed and
+    per-problem cost of a real planner invocation.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        call_seconds: float = 0.0,
+        problem_seconds: float = 0.0,
+    ):
+        super().__init__(batch_size)
+        self.call_seconds = call_seconds
+        self.problem_seconds = problem_seconds
+
+    def decompose(self, request: PlanningRequest) -> List[str]:
+        return [
+            f"Analyze {request.problem} from {request.agents[0]} perspective",
+            "Validate solution components",
+            "Integrate and test final solution",
+        ]
+
+    def plan(self, requests: Sequence[PlanningRequest]) -> List[List[str]]:
+        delay = self.call_seconds + self.problem_seconds * len(requests)
+        if delay:
+            time.sleep(delay)
+        return self._checked(requests, [self.decompose(r) for r in requests])
+
+
+class CallablePlanner(PlannerBackend):
+    """Planner backed by a ``fn(requests) -> plans`` callable."""
+
+    def __init__(self, fn: PlanFn, batch_size: int = DEFAULT_BATCH_SIZE):
+        super().__init__(batch_size)
+        self.fn = fn
+
+    def plan(self, requests: Sequence[PlanningRequest]) -> List[List[str]]:
+        return self._checked(requests, [list(plan) for plan in self.fn(requests)])
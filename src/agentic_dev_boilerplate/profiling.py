@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Profiling Helpers
+
+Phase-oriented memory profiling and a low-overhead sampling profiler for the
+generator and the multi-agent solver. Both use only the standard library
+(``tracemalloc`` and ``sys._current_frames``).
+"""
+
+import json
+import logging
+import signal
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Allocations made by the profiler itself would otherwise top every report.
+_SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+
+class MemoryProfiler:
+    """
+    Takes a ``tracemalloc`` snapshot at every phase boundary.
+
+    Each phase records the top allocation sites live at its end, the growth
+    since the previous phase, and the peak traced memory reached while the
+    phase ran.
+    """
+
+    def __init__(self, top_n: int = 10, frames: int = 1):
+        self.top_n = top_n
+        self.frames = frames
+        self.phases: List[Dict[str, Any]] = []
+        self._last_snapshot: Optional[tracemalloc.Snapshot] = None
+        self._started_tracing = False
+
+    def start(self) -> None:
+        """Start tracing (if needed) and take the baseline snapshot."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+        self._last_snapshot = self._snapshot()
+
+    def stop(self) -> None:
+        """Stop tracing if this profiler started it."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Profile the enclosed block as one named phase."""
+        if self._last_snapshot is None:
+            self.start()
+        tracemalloc.reset_peak()
+        start_current, _ = tracemalloc.get_traced_memory()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            current, peak = tracemalloc.get_traced_memory()
+            snapshot = self._snapshot()
+            assert self._last_snapshot is not None
+            growth = snapshot.compare_to(self._last_snapshot, "lineno")
+            self.phases.append(
+                {
+                    "phase": name,
+                    "elapsed_seconds": elapsed,
+                    "start_bytes": start_current,
+                    "end_bytes": current,
+                    "peak_bytes": peak,
+                    "growth_bytes": sum(stat.size_diff for stat in growth),
+                    "top_allocations": [
+                        _site(stat.traceback, size_bytes=stat.size, count=stat.count)
+                        for stat in snapshot.statistics("lineno")[: self.top_n]
+                    ],
+                    "top_growth": [
+                        _site(
+                            stat.traceback,
+                            size_diff_bytes=stat.size_diff,
+                            count_diff=stat.count_diff,
+                        )
+                        for stat in growth[: self.top_n]
+                        if stat.size_diff
+                    ],
+                }
+            )
+            self._last_snapshot = snapshot
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Peak, end-of-phase usage and growth per phase."""
+        return [
+            {
+                "phase": phase["phase"],
+                "peak_bytes": phase["peak_bytes"],
+                "end_bytes": phase["end_bytes"],
+                "growth_bytes": phase["growth_bytes"],
+                "elapsed_seconds": phase["elapsed_seconds"],
+            }
+            for phase in self.phases
+        ]
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "peak_bytes": max((p["peak_bytes"] for p in self.phases), default=0),
+            "summary": self.summary(),
+            "phases": self.phases,
+        }
+
+    def write(self, path: Path) -> Path:
+        """Write the JSON report and return its path."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
+        logger.info(f"Wrote memory profile to {path}")
+        return path
+
+    def format_summary(self) -> str:
+        """Plain-text table of peak usage per phase."""
+        width = max([len(p["phase"]) for p in self.phases] + [5])
+        lines = [
+            f"{'phase':<{width}}  {'peak':>10}  {'end':>10}  {'growth':>10}  "
+            f"{'time':>8}"
+        ]
+        for row in self.summary():
+            lines.append(
+                f"{row['phase']:<{width}}  {_format_bytes(row['peak_bytes']):>10}  "
+                f"{_format_bytes(row['end_bytes']):>10}  "
+                f"{_format_bytes(row['growth_bytes'], signed=True):>10}  "
+                f"{row['elapsed_seconds'] * 1000:>6.1f}ms"
+            )
+        return "\n".join(lines)
+
+
+class SamplingProfiler:
+    """
+    Low-overhead stack sampler emitting collapsed ("folded") stacks.
+
+    Nothing is installed in the profiled code, so timings are not skewed the
+    way a deterministic (``cProfile``) profiler skews them. Two samplers are
+    available:
+
+    - ``signal``: an interval timer (``setitimer``) interrupts the main thread
+      ``rate_hz`` times per second and the handler records every thread's
+      stack. Sampling happens on the thread that already holds the GIL, so it
+      costs only the stack walk. Wall-clock time is used, so sleeping and
+      waiting on I/O show up too. Requires POSIX and the main thread. The
+      handler takes no locks (it may interrupt code holding them), so thread
+      names are looked up on start, stop and when the report is built; a
+      thread that came and went in between is reported by its ident.
+    - ``thread``: a daemon thread wakes ``rate_hz`` times per second and reads
+      ``sys._current_frames()``. Works anywhere, but every tick is a GIL
+      handoff, which costs noticeably more per sample.
+
+    ``auto`` picks ``signal`` when it is available.
+
+    The output is one ``frame;frame;frame count`` line per distinct stack,
+    root first, as consumed by ``flamegraph.pl``, speedscope and inferno.
+    """
+
+    def __init__(
+        self, rate_hz: float = 100.0, mode: str = "auto", max_depth: int = 256
+    ):
+        if rate_hz <= 0:
+            raise ValueError("rate_hz must be positive")
+        if mode not in ("auto", "signal", "thread"):
+            raise ValueError(f"Unknown sampling mode: {mode}")
+        self.interval = 1.0 / rate_hz
+        self.mode = mode
+        self.max_depth = max_depth
+        self.samples = 0
+        self._raw: Counter = Counter()
+        self._thread_names: Dict[int, str] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._previous_handler: Any = None
+        self._main_id: Optional[int] = None
+        self._running = False
+
+    def start(self) -> None:
+        if self._running:
+            return
+        mode = self.mode
+        if mode == "auto":
+            mode = "signal" if _signal_sampling_available() else "thread"
+        if mode == "signal":
+            if not _signal_sampling_available():
+                raise RuntimeError("Signal sampling needs setitimer on the main thread")
+            self._main_id = threading.get_ident()
+            self._refresh_thread_names()
+            self._previous_handler = signal.signal(signal.SIGALRM, self._on_signal)
+            signal.setitimer(signal.ITIMER_REAL, self.interval, self.interval)
+        else:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="sampling-profiler", daemon=True
+            )
+            self._thread.start()
+        self.mode = mode
+        self._running = True
+
+    def stop(self) -> None:
+        if not self._running:
+            return
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        else:
+            signal.setitimer(signal.ITIMER_REAL, 0, 0)
+            signal.signal(signal.SIGALRM, self._previous_handler or signal.SIG_DFL)
+        self._refresh_thread_names()
+        self._running = False
+
+    def __enter__(self) -> "SamplingProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _on_signal(self, signum: int, frame: Optional[FrameType]) -> None:
+        main_id = self._main_id
+        for thread_id, thread_frame in sys._current_frames().items():
+            # The handler's own frames sit on top of the main thread's stack;
+            # the interrupted frame is the one passed in.
+            self._record(thread_id, frame if thread_id == main_id else thread_frame)
+        self.samples += 1
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        next_tick = time.perf_counter()
+        while True:
+            next_tick += self.interval
+            delay = next_tick - time.perf_counter()
+            if delay < 0:
+                # Fell behind (e.g. a long GIL hold); skip missed ticks
+                # instead of sampling in a burst.
+                next_tick = time.perf_counter()
+                delay = 0
+            if self._stop.wait(delay):
+                return
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own_id:
+                    if thread_id not in self._thread_names:
+                        self._refresh_thread_names()
+                    self._record(thread_id, frame)
+            self.samples += 1
+
+    def _record(self, thread_id: int, frame: Optional[FrameType]) -> None:
+        # Stacks are counted as tuples of code objects; labels are resolved
+        # once, at output time, to keep each tick cheap. This runs inside the
+        # signal handler, so it must not take locks (threading.enumerate()
+        # does): it only walks frames and bumps a counter.
+        codes: List[CodeType] = []
+        append = codes.append
+        depth = self.max_depth
+        while frame is not None and depth:
+            append(frame.f_code)
+            frame = frame.f_back
+            depth -= 1
+        self._raw[(thread_id, tuple(codes))] += 1
+
+    def _refresh_thread_names(self) -> None:
+        for thread in threading.enumerate():
+            if thread.ident is not None:
+                self._thread_names[thread.ident] = thread.name
+
+    @property
+    def stacks(self) -> Counter:
+        """Counts per collapsed stack string (root first)."""
+        if self._running:
+            self._refresh_thread_names()
+        labels: Dict[CodeType, str] = {}
+        stacks: Counter = Counter()
+        for (thread_id, codes), count in list(self._raw.items()):
+            frames = [f"thread:{self._thread_names.get(thread_id, thread_id)}"]
+            for code in reversed(codes):
+                label = labels.get(code)
+                if label is None:
+                    label = labels[code] = _frame_label(code)
+                frames.append(label)
+            stacks[";".join(frames)] += count
+        return stacks
+
+    def collapsed(self) -> List[str]:
+        """Collapsed stack lines, most frequent first."""
+        return [f"{stack} {count}" for stack, count in self.stacks.most_common()]
+
+    def write(self, path: Path) -> Path:
+        """Write collapsed stacks and return the path."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            for line in self.collapsed():
+                f.write(line + "\n")
+        logger.info(f"Wrote {self.samples} stack samples to {path}")
+        return path
+
+
+def _signal_sampling_available() -> bool:
+    return (
+        hasattr(signal, "setitimer")
+        and threading.current_thread() is threading.main_thread()
+    )
+
+
+def _frame_label(code: CodeType) -> str:
+    # ';' separates frames; the count follows the last space of a line.
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{name} ({code.co_filename}:{code.co_firstlineno})".replace(";", ":")
+
+
+def _site(traceback: tracemalloc.Traceback, **values: int) -> Dict[str, Any]:
+    frame = traceback[0]
+    return {"file": frame.filename, "line": frame.lineno, **values}
+
+
+def _format_bytes(size: int, signed: bool = False) -> str:
+    sign = "+" if signed and size > 0 else ""
+    if abs(size) < 1024:
+        return f"{sign}{size}B"
+    value = float(size)
+    for unit in ("KiB", "MiB", "GiB"):
+        value /= 1024
+        if abs(value) < 1024 or unit == "GiB":
+            break
+    return f"{sign}{value:.1f}{unit}"
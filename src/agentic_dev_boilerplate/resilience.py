@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Retries and Circuit Breakers
+
+Failure handling for agent task execution. A :class:`RetryPolicy` re-runs
+a failed attempt after a jittered exponential backoff ("full jitter": a
+uniform delay between zero and the capped exponential step), so retries of
+many tasks hitting the same flaky backend spread out instead of arriving
+in waves.
+
+A :class:`CircuitBreaker` guards one role's backend. After
+``failure_threshold`` consecutive failures it opens and rejects attempts
+outright; once ``reset_timeout`` has passed it lets ``half_open_max`` trial
+attempts through, closing again on a success and re-opening on a failure.
+"""
+
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when an attempt is rejected by an open circuit breaker."""
+
+
+@dataclass
+class RetryPolicy:
+    """How often, and after what delay, a failed attempt is retried."""
+
+    # Total attempts, including the first.
+    max_attempts: int = 3
+    base_delay: float = 0.1
+    max_delay: float = 5.0
+    multiplier: float = 2.0
+    # Exception types worth retrying.
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,)
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if self.base_delay < 0 or self.max_delay < self.base_delay:
+            raise ValueError("delays must satisfy 0 <= base_delay <= max_delay")
+        if self.multiplier < 1:
+            raise ValueError("multiplier must be at least 1")
+
+    @classmethod
+    def parse(cls, spec: str) -> "RetryPolicy":
+        """Parse ``ATTEMPTS[:BASE_DELAY[:MAX_DELAY]]``, e.g. ``4:0.2:10``."""
+        parts = spec.split(":")
+        if len(parts) > 3 or not parts[0]:
+            raise ValueError(f"Invalid retry policy: {spec}")
+        delays = [float(part) for part in parts[1:]]
+        base_delay = delays[0] if delays else cls.base_delay
+        max_delay = delays[1] if len(delays) > 1 else cls.max_delay
+        return cls(int(parts[0]), base_delay, max_delay)
+
+    def should_retry(self, error: BaseException, attempt: int) -> bool:
+        """Whether to try again after ``attempt`` (1-based) failed with ``error``."""
+        return attempt < self.max_attempts and isinstance(error, self.retry_on)
+
+    def backoff(self, attempt: int, rng: Any = random) -> float:
+        """Jittered delay before the attempt following ``attempt``."""
+        ceiling = min(
+            self.max_delay, self.base_delay * self.multiplier ** (attempt - 1)
+        )
+        delay: float = rng.uniform(0.0, ceiling)
+        return delay
+
+
+@dataclass
+class BreakerPolicy:
+    """When a role's circuit opens and how it recovers."""
+
+    # Consecutive failures that open the circuit.
+    failure_threshold: int = 5
+    # Seconds the circuit stays open before trial attempts are let through.
+    reset_timeout: float = 30.0
+    # Trial attempts allowed at once while half open.
+    half_open_max: int = 1
+
+    def __post_init__(self) -> None:
+        if self.failure_threshold < 1 or self.half_open_max < 1:
+            raise ValueError("failure_threshold and half_open_max must be >= 1")
+        if self.reset_timeout < 0:
+            raise ValueError("reset_timeout must not be negative")
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker over consecutive failures."""
+
+    def __init__(
+        self,
+        name: str,
+        policy: Optional[BreakerPolicy] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.policy = policy or BreakerPolicy()
+        self._clock = clock
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._trials = 0
+        self.consecutive_failures = 0
+        self.failures = 0
+        self.successes = 0
+        self.rejected = 0
+        self.trips = 0
+
+    @property
+    def state(self) -> str:
+        if (
+            self._state == OPEN
+            and self._clock() - self._opened_at >= self.policy.reset_timeout
+        ):
+            self._state = HALF_OPEN
+            self._trials = 0
+        return self._state
+
+    @property
+    def is_open(self) -> bool:
+        """True while attempts are rejected without a trial."""
+        return self.state == OPEN
+
+    @property
+    def rejecting(self) -> bool:
+        """True while :meth:`allow` would refuse: open, or half-open with
+        every trial slot taken."""
+        state = self.state
+        return state == OPEN or (
+            state == HALF_OPEN and self._trials >= self.policy.half_open_max
+        )
+
+    def allow(self) -> bool:
+        """Admit an attempt; every admitted attempt must be settled with
+        :meth:`record_success`, :meth:`record_failure` or :meth:`release`."""
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and self._trials < self.policy.half_open_max:
+            self._trials += 1
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        self.successes += 1
+        self.consecutive_failures = 0
+        if self._state == HALF_OPEN:
+            logger.info(f"Circuit for {self.name} closed")
+            self._state = CLOSED
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self.consecutive_failures += 1
+        if self._state == HALF_OPEN or (
+            self._state == CLOSED
+            and self.consecutive_failures >= self.policy.failure_threshold
+        ):
+            self._trip()
+
+    def release(self) -> None:
+        """Settle an admitted attempt that ended without an outcome."""
+        if self._state == HALF_OPEN and self._trials:
+            self._trials -= 1
+
+    def _trip(self) -> None:
+        logger.warning(
+            f"Circuit for {self.name} opened after "
+            f"{self.consecutive_failures} consecutive failures"
+        )
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self.trips += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "successes": self.successes,
+            "rejected": self.rejected,
+            "trips": self.trips,
+        }
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Result Cache
+
+Memoizes agent task results across sessions. Entries are keyed by the
+assigned role, the normalised task description and a fingerprint of the
+session's context (for example the code revision being worked on), so the
+same task for the same inputs runs once until its entry expires.
+
+There are two tiers. An in-memory LRU holds up to ``max_entries`` results;
+an optional on-disk tier (one JSON file per entry, under the project's
+``TmpManager`` directory by default) survives restarts and is bounded by
+``max_disk_bytes``, evicting least recently written entries first. Both
+tiers honour the same TTL. Only successful results are cached.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from .tmp_manager import get_tmp_manager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL_SECONDS = 3600.0
+DEFAULT_MAX_DISK_BYTES = 64 * 1024 * 1024
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_description(description: str) -> str:
+    """Case- and whitespace-insensitive form of a task description."""
+    return _WHITESPACE.sub(" ", description).strip().rstrip(".").casefold()
+
+
+def context_fingerprint(context: Optional[Mapping[str, Any]]) -> str:
+    """Stable digest of a JSON-serializable context mapping."""
+    encoded = json.dumps(context or {}, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()[:16]
+
+
+def cache_key(role: str, description: str, context: Optional[Mapping] = None) -> str:
+    """Cache key for a task run by ``role`` in ``context``."""
+    material = "\0".join(
+        (role, normalize_description(description), context_fingerprint(context))
+    )
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+class ResultCache:
+    """Two-tier (memory LRU, optional disk) TTL cache of task results."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        disk: bool = False,
+        disk_dir: Optional[Path] = None,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+        clock: Callable[[], float] = time.time,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_disk_bytes = max_disk_bytes
+        self._clock = clock
+        self._memory: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        if disk and disk_dir is None:
+            tmp_manager = get_tmp_manager("agentic-dev-boilerplate")
+            disk_dir = tmp_manager.get_task_dir("result-cache")
+        self.disk_dir = Path(disk_dir) if disk_dir is not None else None
+        # Size of each entry on disk, oldest write first.
+        self._disk: "OrderedDict[str, int]" = OrderedDict()
+        self.disk_bytes = 0
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            self._scan_disk()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _scan_disk(self) -> None:
+        entries = []
+        with os.scandir(self.disk_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".json") and entry.is_file():
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.name[:-5], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._disk[key] = size
+            self.disk_bytes += size
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached result for ``key``, or None if absent or expired."""
+        now = self._clock()
+        entry = self._memory.get(key)
+        if entry is not None:
+            if entry[0] > now:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return dict(entry[1])
+            del self._memory[key]
+        if key in self._disk:
+            entry = self._read_disk(key)
+            if entry is not None and entry[0] > now:
+                self._remember(key, entry)
+                self.hits += 1
+                return dict(entry[1])
+            self._drop_disk(key)
+        self.misses += 1
+        return None
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """Cache a successful ``result`` for ``key`` for ``ttl`` seconds."""
+        entry = (self._clock() + self.ttl, dict(result))
+        self._remember(key, entry)
+        if self.disk_dir is not None:
+            self._write_disk(key, entry)
+
+    def _remember(self, key: str, entry: Tuple[float, Dict[str, Any]]) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def _path(self, key: str) -> Path:
+        # Only reached for caches with a disk tier.
+        assert self.disk_dir is not None
+        return self.disk_dir / f"{key}.json"
+
+    def _read_disk(self, key: str) -> Optional[Tuple[float, Dict[str, Any]]]:
+        try:
+            data = json.loads(self._path(key).read_text())
+            return data["expires_at"], data["result"]
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Discarding unreadable cache entry {key}: {e}")
+            return None
+
+    def _write_disk(self, key: str, entry: Tuple[float, Dict[str, Any]]) -> None:
+        encoded = json.dumps(
+            {"expires_at": entry[0], "result": entry[1]}, default=str
+        ).encode()
+        if len(encoded) > self.max_disk_bytes:
+            return
+        path = self._path(key)
+        tmp = path.with_suffix(".tmp")
+        try:
+            tmp.write_bytes(encoded)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry {key}: {e}")
+            return
+        self.disk_bytes += len(encoded) - self._disk.pop(key, 0)
+        self._disk[key] = len(encoded)
+        while self.disk_bytes > self.max_disk_bytes:
+            self._drop_disk(next(iter(self._disk)))
+            self.evictions += 1
+
+    def _drop_disk(self, key: str) -> None:
+        self.disk_bytes -= self._disk.pop(key, 0)
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        self._memory.clear()
+        for key in list(self._disk):
+            self._drop_disk(key)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "memory_entries": len(self._memory),
+            "disk_entries": len(self._disk),
+            "disk_bytes": self.disk_bytes,
+        }
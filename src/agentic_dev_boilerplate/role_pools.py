@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Per-Role Worker Pools
+
+Caps how many tasks of one agent role run at once and bounds how many may
+wait for a slot. A submitter that finds the ready queue full either waits
+for room (``block``) or gets a :class:`RolePoolFullError` (``reject``).
+Queued work is granted slots highest priority first, FIFO among equals.
+
+Waiters are plain futures created on the running loop, so a pool outlives
+the event loop of any single ``asyncio.run`` call.
+"""
+
+import asyncio
+import functools
+import heapq
+import itertools
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    NoReturn,
+    Optional,
+    Tuple,
+)
+
+BLOCK = "block"
+REJECT = "reject"
+
+
+class RolePoolFullError(RuntimeError):
+    """Raised when a ``reject`` pool's ready queue is full."""
+
+
+@dataclass
+class RoleLimit:
+    """Concurrency and queue bounds for one role (``None`` means unbounded)."""
+
+    max_concurrency: Optional[int] = None
+    max_queue: Optional[int] = None
+    overflow: str = BLOCK
+
+    def __post_init__(self) -> None:
+        if self.overflow not in (BLOCK, REJECT):
+            raise ValueError(f"Unknown overflow policy: {self.overflow}")
+        for name in ("max_concurrency", "max_queue"):
+            value = getattr(self, name)
+            if value is not None and value < 1:
+                raise ValueError(f"{name} must be at least 1")
+
+    @classmethod
+    def parse(cls, spec: str) -> "RoleLimit":
+        """Parse ``CONCURRENCY[:QUEUE[:OVERFLOW]]``, e.g. ``4:16:reject``."""
+        parts = spec.split(":")
+        if len(parts) > 3:
+            raise ValueError(f"Invalid role limit: {spec}")
+        concurrency = int(parts[0]) if parts[0] else None
+        queue = int(parts[1]) if len(parts) > 1 and parts[1] else None
+        overflow = parts[2] if len(parts) > 2 else BLOCK
+        return cls(concurrency, queue, overflow)
+
+
+class RolePool:
+    """Bounded concurrency plus a bounded priority ready queue for one role."""
+
+    def __init__(
+        self,
+        name: str,
+        limit: Optional[RoleLimit] = None,
+        on_wait: Optional[Callable[[float], None]] = None,
+    ):
+        self.name = name
+        self.limit = limit or RoleLimit()
+        # Called with each task's seconds spent queued, e.g. for metrics.
+        self.on_wait = on_wait
+        self.in_flight = 0
+        # Heap of (-priority, sequence, slot); the sequence keeps FIFO order
+        # among equal priorities.
+        self._ready: List[Tuple[float, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._submitters: Deque[asyncio.Future] = deque()
+        self.submitted = 0
+        self.completed = 0
+        self.rejected = 0
+        self.peak_queue_depth = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._ready)
+
+    def _queue_full(self) -> bool:
+        return (
+            self.limit.max_queue is not None
+            and len(self._ready) >= self.limit.max_queue
+        )
+
+    def _has_capacity(self) -> bool:
+        return (
+            self.limit.max_concurrency is None
+            or self.in_flight < self.limit.max_concurrency
+        )
+
+    async def submit(
+        self, factory: Callable[[], Awaitable[Any]], priority: float = 0.0
+    ) -> asyncio.Future:
+        """Queue ``factory()`` to run when a slot frees up.
+
+        Returns once the work is admitted to the ready queue; the returned
+        future resolves to the coroutine's result. Higher ``priority`` work
+        is started first.
+        """
+        loop = asyncio.get_running_loop()
+        while self._queue_full():
+            if self.limit.overflow == REJECT:
+                self._reject()
+            waiter = loop.create_future()
+            self._submitters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._submitters:
+                    self._submitters.remove(waiter)
+        return self._enqueue(factory, priority)
+
+    def submit_nowait(
+        self, factory: Callable[[], Awaitable[Any]], priority: float = 0.0
+    ) -> Optional[asyncio.Future]:
+        """Like :meth:`submit`, but returns ``None`` instead of waiting for room.
+
+        ``reject`` pools still raise :class:`RolePoolFullError`.
+        """
+        if self._queue_full():
+            if self.limit.overflow == REJECT:
+                self._reject()
+            return None
+        return self._enqueue(factory, priority)
+
+    def _reject(self) -> NoReturn:
+        self.rejected += 1
+        raise RolePoolFullError(
+            f"Ready queue for {self.name} is full ({self.limit.max_queue} waiting)"
+        )
+
+    def _enqueue(
+        self, factory: Callable[[], Awaitable[Any]], priority: float
+    ) -> asyncio.Future:
+        self.submitted += 1
+        slot = asyncio.get_running_loop().create_future()
+        if not self._ready and self._has_capacity():
+            self.in_flight += 1
+            slot.set_result(None)
+        else:
+            heapq.heappush(self._ready, (-priority, next(self._sequence), slot))
+            self.peak_queue_depth = max(self.peak_queue_depth, len(self._ready))
+        run = asyncio.ensure_future(self._run(factory, slot, time.perf_counter()))
+        # A done callback rather than try/finally in _run: a task cancelled
+        # before its first step never enters _run's body.
+        run.add_done_callback(functools.partial(self._finish, slot))
+        return run
+
+    async def _run(
+        self,
+        factory: Callable[[], Awaitable[Any]],
+        slot: asyncio.Future,
+        enqueued_at: float,
+    ) -> Any:
+        await slot
+        waited = time.perf_counter() - enqueued_at
+        self._wait_total += waited
+        self._wait_max = max(self._wait_max, waited)
+        if self.on_wait is not None:
+            self.on_wait(waited)
+        try:
+            return await factory()
+        finally:
+            self.completed += 1
+
+    def _finish(self, slot: asyncio.Future, run: asyncio.Future) -> None:
+        if slot.done() and not slot.cancelled():
+            # Held a slot, whether or not the work got to start.
+            self._release()
+        else:
+            # Cancelled while still queued: give the place to a blocked
+            # submitter.
+            slot.cancel()
+            self._remove_queued(slot)
+            self._wake_submitter()
+
+    def _release(self) -> None:
+        self.in_flight -= 1
+        while self._ready:
+            _, _, slot = heapq.heappop(self._ready)
+            if not slot.done():
+                self.in_flight += 1
+                slot.set_result(None)
+                break
+        self._wake_submitter()
+
+    def _remove_queued(self, slot: asyncio.Future) -> None:
+        for index, entry in enumerate(self._ready):
+            if entry[2] is slot:
+                self._ready[index] = self._ready[-1]
+                self._ready.pop()
+                heapq.heapify(self._ready)
+                return
+
+    def _wake_submitter(self) -> None:
+        while self._submitters:
+            waiter = self._submitters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    def stats(self) -> Dict[str, Any]:
+        started = self.completed + self.in_flight
+        return {
+            "max_concurrency": self.limit.max_concurrency,
+            "max_queue": self.limit.max_queue,
+            "queue_depth": self.queue_depth,
+            "peak_queue_depth": self.peak_queue_depth,
+            "in_flight": self.in_flight,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "blocked_submitters": len(self._submitters),
+            "wait_avg_seconds": self._wait_total / started if started else 0.0,
+            "wait_max_seconds": self._wait_max,
+        }
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Task Scheduling
+
+Dependency graph over a session's tasks. Readiness is tracked with in-degree
+counters, so releasing the dependents of a finished task costs O(out-degree)
+and a full session is scheduled in O(V+E).
+
+Ready tasks are started in one of two orders:
+
+- ``fifo``: session order, then release order.
+- ``critical_path``: longest estimated remaining path first, so the chain
+  that bounds the session's makespan is never stuck behind short side work.
+"""
+
+from collections import deque
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List
+
+if TYPE_CHECKING:
+    from .multi_agent_solver import Task
+
+FIFO = "fifo"
+CRITICAL_PATH = "critical_path"
+POLICIES = (FIFO, CRITICAL_PATH)
+
+
+class TaskGraph:
+    """Dependency DAG built from ``Task.dependencies``."""
+
+    def __init__(self, tasks: Iterable["Task"]):
+        self.tasks: Dict[str, "Task"] = {}
+        for task in tasks:
+            if task.task_id in self.tasks:
+                raise ValueError(f"Duplicate task id: {task.task_id}")
+            self.tasks[task.task_id] = task
+
+        self.dependents: Dict[str, List[str]] = {task_id: [] for task_id in self.tasks}
+        self.indegree: Dict[str, int] = {task_id: 0 for task_id in self.tasks}
+        for task in self.tasks.values():
+            for dependency in set(task.dependencies):
+                if dependency not in self.tasks:
+                    raise ValueError(
+                        f"Task {task.task_id} depends on unknown task {dependency}"
+                    )
+                self.dependents[dependency].append(task.task_id)
+                self.indegree[task.task_id] += 1
+
+        self.order = self._topological_order()
+
+    def _topological_order(self) -> List[str]:
+        """Kahn's algorithm; raises if the dependencies contain a cycle."""
+        indegree = dict(self.indegree)
+        queue = deque(task_id for task_id, degree in indegree.items() if degree == 0)
+        order = []
+        while queue:
+            task_id = queue.popleft()
+            order.append(task_id)
+            for dependent in self.dependents[task_id]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    queue.append(dependent)
+        if len(order) != len(self.tasks):
+            stuck = sorted(task_id for task_id, degree in indegree.items() if degree)
+            raise ValueError(f"Task dependencies contain a cycle: {stuck}")
+        return order
+
+    def critical_path(self, estimate: Callable[["Task"], float]) -> Dict[str, float]:
+        """Longest estimated path from each task to the end of the graph.
+
+        A task's value is its own estimate plus the largest value among its
+        dependents, computed in one reverse-topological pass (O(V+E)).
+        """
+        remaining: Dict[str, float] = {}
+        for task_id in reversed(self.order):
+            tail = max((remaining[d] for d in self.dependents[task_id]), default=0.0)
+            remaining[task_id] = estimate(self.tasks[task_id]) + tail
+        return remaining
+
+    def ready(self) -> List[str]:
+        """Tasks with no unfinished dependencies, in session order."""
+        return [task_id for task_id, degree in self.indegree.items() if degree == 0]
+
+    def complete(self, task_id: str) -> List[str]:
+        """Mark a task finished and return the dependents it made ready."""
+        released = []
+        for dependent in self.dependents[task_id]:
+            self.indegree[dependent] -= 1
+            if self.indegree[dependent] == 0:
+                released.append(dependent)
+        return released
+
+    def descendants(self, task_id: str) -> List[str]:
+        """Every task that transitively depends on ``task_id``."""
+        seen = set()
+        stack = list(self.dependents[task_id])
+        while stack:
+            current = stack.pop()
+            if current not in seen:
+                seen.add(current)
+                stack.extend(self.dependents[current])
+        return [t for t in self.order if t in seen]
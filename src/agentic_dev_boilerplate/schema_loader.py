@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Project Schema Composition
+
+Resolves ``extends:`` and ``$ref`` links between project schema files with
+deep-merge semantics. Resolution is memoized per process in a DAG cache keyed
+by file hashes, so a base schema shared by many repositories is parsed and
+merged once per batch run instead of once per repository.
+"""
+
+import copy
+import hashlib
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+EXTENDS_KEY = "extends"
+REF_KEY = "$ref"
+
+
+class SchemaCycleError(ValueError):
+    """Raised when ``extends``/``$ref`` links between schema files form a cycle."""
+
+
+def deep_merge(base: Any, override: Any) -> Any:
+    """Merge ``override`` onto ``base`` without mutating either.
+
+    Mappings are merged key by key; any other value (lists included) in
+    ``override`` replaces the value in ``base``.
+    """
+    if not isinstance(base, dict) or not isinstance(override, dict):
+        return override
+    merged = dict(base)
+    for key, value in override.items():
+        merged[key] = deep_merge(base[key], value) if key in base else value
+    return merged
+
+
+class SchemaResolver:
+    """
+    Resolves schema files into fully composed documents.
+
+    Two caches back the resolver:
+
+    - parsed documents keyed by the SHA-256 of the file content, so YAML is
+      parsed once per distinct file;
+    - resolved documents keyed by a Merkle hash of the file and everything it
+      extends or references, so a base schema is merged once and any edit to
+      a dependency invalidates only the documents built on top of it.
+    """
+
+    def __init__(self) -> None:
+        self._digests: Dict[Tuple[Path, int, int], str] = {}
+        self._parsed: Dict[str, Any] = {}
+        self._resolved: Dict[str, Any] = {}
+        self.stats = {"parsed": 0, "merged": 0, "hits": 0}
+
+    def resolve(self, schema_path: os.PathLike) -> Dict[str, Any]:
+        """Return the composed schema for ``schema_path``.
+
+        The result is a private copy that callers may mutate freely.
+        """
+        _, document = self._resolve_file(Path(schema_path).resolve(), ())
+        if not isinstance(document, dict):
+            raise ValueError(f"Schema {schema_path} must be a mapping")
+        return copy.deepcopy(document)
+
+    def clear(self) -> None:
+        """Drop every cached digest, parsed and resolved document."""
+        self._digests.clear()
+        self._parsed.clear()
+        self._resolved.clear()
+
+    def _digest(self, path: Path) -> str:
+        """Hash a file, reusing the digest while its mtime and size are unchanged."""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Schema file not found: {path}") from None
+        stat_key = (path, stat.st_mtime_ns, stat.st_size)
+        digest = self._digests.get(stat_key)
+        if digest is None:
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            self._digests[stat_key] = digest
+        return digest
+
+    def _parse(self, path: Path, digest: str) -> Any:
+        if digest not in self._parsed:
+            with open(path, "r") as f:
+                self._parsed[digest] = yaml.safe_load(f)
+            self.stats["parsed"] += 1
+        return self._parsed[digest]
+
+    def _resolve_file(self, path: Path, stack: Tuple[Path, ...]) -> Tuple[str, Any]:
+        """Resolve one file, returning its DAG cache key and composed document."""
+        if path in stack:
+            chain = " -> ".join(str(p) for p in stack[stack.index(path) :] + (path,))
+            raise SchemaCycleError(f"Schema reference cycle: {chain}")
+
+        digest = self._digest(path)
+        raw = self._parse(path, digest)
+        stack = stack + (path,)
+
+        # Resolve dependencies first; their keys feed this node's key.
+        dependencies: Dict[Path, Tuple[str, Any]] = {}
+        for dep_path in self._dependencies(raw, path.parent):
+            if dep_path not in dependencies:
+                dependencies[dep_path] = self._resolve_file(dep_path, stack)
+
+        node_hash = hashlib.sha256(digest.encode())
+        for dep_key, _ in dependencies.values():
+            node_hash.update(dep_key.encode())
+        node_key = node_hash.hexdigest()
+
+        if node_key in self._resolved:
+            self.stats["hits"] += 1
+            return node_key, self._resolved[node_key]
+
+        document = self._compose(raw, path.parent, dependencies)
+        self._resolved[node_key] = document
+        self.stats["merged"] += 1
+        return node_key, document
+
+    def _dependencies(self, raw: Any, base_dir: Path) -> List[Path]:
+        """List the files a raw document extends or references, in merge order."""
+        paths = []
+        if isinstance(raw, dict):
+            for parent in self._extends_list(raw):
+                paths.append((base_dir / parent).resolve())
+        self._collect_refs(raw, base_dir, paths)
+        return paths
+
+    def _collect_refs(self, node: Any, base_dir: Path, paths: List[Path]) -> None:
+        if isinstance(node, dict):
+            ref = node.get(REF_KEY)
+            if isinstance(ref, str):
+                paths.append(self._ref_target(ref, base_dir)[0])
+            for key, value in node.items():
+                if key != REF_KEY:
+                    self._collect_refs(value, base_dir, paths)
+        elif isinstance(node, list):
+            for item in node:
+                self._collect_refs(item, base_dir, paths)
+
+    @staticmethod
+    def _extends_list(raw: Dict[str, Any]) -> List[str]:
+        parents = raw.get(EXTENDS_KEY) or []
+        if isinstance(parents, str):
+            parents = [parents]
+        if not isinstance(parents, list) or not all(
+            isinstance(p, str) for p in parents
+        ):
+            raise ValueError(f"'{EXTENDS_KEY}' must be a path or a list of paths")
+        return parents
+
+    @staticmethod
+    def _ref_target(ref: str, base_dir: Path) -> Tuple[Path, Optional[str]]:
+        """Split ``file.yaml#/json/pointer`` into a resolved path and pointer."""
+        file_part, _, pointer = ref.partition("#")
+        if not file_part:
+            raise ValueError(f"'{REF_KEY}' must name a schema file: {ref!r}")
+        return (base_dir / file_part).resolve(), pointer or None
+
+    def _compose(
+        self,
+        raw: Any,
+        base_dir: Path,
+        dependencies: Dict[Path, Tuple[str, Any]],
+    ) -> Any:
+        if not isinstance(raw, dict):
+            return self._substitute_refs(raw, base_dir, dependencies)
+
+        composed: Any = {}
+        for parent in self._extends_list(raw):
+            composed = deep_merge(
+                composed, dependencies[(base_dir / parent).resolve()][1]
+            )
+        own = {k: v for k, v in raw.items() if k != EXTENDS_KEY}
+        return deep_merge(composed, self._substitute_refs(own, base_dir, dependencies))
+
+    def _substitute_refs(
+        self,
+        node: Any,
+        base_dir: Path,
+        dependencies: Dict[Path, Tuple[str, Any]],
+    ) -> Any:
+        if isinstance(node, list):
+            return [self._substitute_refs(i, base_dir, dependencies) for i in node]
+        if not isinstance(node, dict):
+            return node
+
+        siblings = {
+            key: self._substitute_refs(value, base_dir, dependencies)
+            for key, value in node.items()
+            if key != REF_KEY
+        }
+        ref = node.get(REF_KEY)
+        if not isinstance(ref, str):
+            return siblings
+
+        target_path, pointer = self._ref_target(ref, base_dir)
+        target = _follow_pointer(dependencies[target_path][1], pointer, ref)
+        return deep_merge(target, siblings) if siblings else target
+
+
+def _follow_pointer(document: Any, pointer: Optional[str], ref: str) -> Any:
+    """Walk a JSON pointer (``/agents/0``) into a resolved document."""
+    if not pointer or pointer == "/":
+        return document
+    node = document
+    for token in pointer.lstrip("/").split("/"):
+        token = token.replace("~1", "/").replace("~0", "~")
+        try:
+            node = node[int(token)] if isinstance(node, list) else node[token]
+        except (KeyError, IndexError, ValueError, TypeError):
+            raise ValueError(f"Unresolvable {REF_KEY}: {ref!r}") from None
+    return node
+
+
+# Shared resolver so batch runs in one process reuse parsed base schemas.
+_default_resolver = SchemaResolver()
+
+
+def get_schema_resolver() -> SchemaResolver:
+    """Get the process-wide schema resolver."""
+    return _default_resolver
+
+
+def resolve_schema(schema_path: os.PathLike) -> Dict[str, Any]:
+    """Load a schema file with ``extends``/``$ref`` composition applied."""
+    return _default_resolver.resolve(schema_path)
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Session Store
+
+Durable storage for multi-agent sessions, so a crashed run can be resumed
+without redoing completed tasks. :class:`SessionStore` is the pluggable
+interface; :class:`SQLiteSessionStore` keeps sessions, task state and
+messages in a SQLite database in WAL mode.
+
+Writes are buffered and committed by :meth:`SessionStore.flush`, which the
+coordinator calls once per scheduling tick. Several transitions of the same
+task within one tick (e.g. started and finished) collapse into one row
+update, which keeps write amplification low on busy sessions.
+"""
+
+import json
+import logging
+import sqlite3
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Flush early once this many writes are buffered.
+DEFAULT_BATCH_SIZE = 512
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    problem_description TEXT NOT NULL,
+    participating_agents TEXT NOT NULL,
+    consensus_threshold REAL NOT NULL,
+    created_at REAL NOT NULL,
+    completed_at REAL,
+    context TEXT NOT NULL DEFAULT '{}'
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    session_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    description TEXT NOT NULL,
+    assigned_agent TEXT NOT NULL,
+    status TEXT NOT NULL,
+    dependencies TEXT NOT NULL,
+    results TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    completed_at REAL,
+    PRIMARY KEY (session_id, task_id)
+);
+CREATE TABLE IF NOT EXISTS messages (
+    session_id TEXT NOT NULL,
+    message_id TEXT NOT NULL,
+    sender TEXT NOT NULL,
+    recipient TEXT NOT NULL,
+    message_type TEXT NOT NULL,
+    content TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    PRIMARY KEY (session_id, message_id)
+);
+"""
+
+
+class SessionStore(ABC):
+    """Persistence interface for sessions, task transitions and messages."""
+
+    @abstractmethod
+    def save_session(self, session: Any) -> None:
+        """Write a session with all of its tasks and messages (buffered).
+
+        The session's tasks replace any stored for it before, so a new
+        decomposition does not leave stale tasks behind. Messages already
+        stored are not written again.
+        """
+
+    @abstractmethod
+    def record_session(self, session: Any) -> None:
+        """Record a change to session-level fields such as ``completed_at``."""
+
+    @abstractmethod
+    def record_task(self, session_id: str, task: Any) -> None:
+        """Record a task's assignment, status, results and completion time."""
+
+    @abstractmethod
+    def record_message(self, session_id: str, message: Any) -> None:
+        """Record a sent message (once per message ID)."""
+
+    @abstractmethod
+    def flush(self) -> None:
+        """Commit buffered writes."""
+
+    @abstractmethod
+    def load_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Plain-data record of a stored session, or ``None``."""
+
+    @abstractmethod
+    def session_ids(self) -> List[str]:
+        """IDs of all stored sessions, oldest first."""
+
+    def close(self) -> None:
+        pass
+
+
+class SQLiteSessionStore(SessionStore):
+    """SQLite (WAL) session store with per-tick batched commits."""
+
+    def __init__(self, path: Path, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # In WAL mode NORMAL survives process crashes; only an OS crash or
+        # power loss can drop the last commits.
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._sessions: Dict[str, Tuple] = {}
+        # Sessions whose stored tasks are replaced on the next flush.
+        self._replaced_tasks: Set[str] = set()
+        self._tasks: Dict[Tuple[str, str], Tuple] = {}
+        self._task_updates: Dict[Tuple[str, str], Tuple] = {}
+        self._messages: List[Tuple] = []
+        self.stats = {"commits": 0, "rows": 0, "coalesced": 0}
+
+    @property
+    def journal_mode(self) -> str:
+        return str(self._conn.execute("PRAGMA journal_mode").fetchone()[0])
+
+    @property
+    def pending(self) -> int:
+        return (
+            len(self._sessions)
+            + len(self._replaced_tasks)
+            + len(self._tasks)
+            + len(self._task_updates)
+            + len(self._messages)
+        )
+
+    def save_session(self, session: Any) -> None:
+        session_id = session.session_id
+        self._sessions[session_id] = _session_row(session)
+        # Drop buffered writes for the previous decomposition; its stored
+        # rows are deleted on flush.
+        self._replaced_tasks.add(session_id)
+        for pending in (self._tasks, self._task_updates):
+            for key in [key for key in pending if key[0] == session_id]:
+                del pending[key]
+        for position, task in enumerate(session.tasks):
+            key = (session_id, task.task_id)
+            self._tasks[key] = _task_row(session_id, position, task)
+        for message in session.messages:
+            self.record_message(session.session_id, message)
+        self._maybe_flush()
+
+    def record_session(self, session: Any) -> None:
+        self._sessions[session.session_id] = _session_row(session)
+        self._maybe_flush()
+
+    def record_task(self, session_id: str, task: Any) -> None:
+        key = (session_id, task.task_id)
+        if key in self._tasks:
+            # Not yet written: refresh the pending insert instead.
+            position = self._tasks[key][2]
+            self._tasks[key] = _task_row(session_id, position, task)
+            self.stats["coalesced"] += 1
+            return
+        if key in self._task_updates:
+            self.stats["coalesced"] += 1
+        self._task_updates[key] = (
+            task.assigned_agent.value,
+            task.status.value,
+            _dumps(task.results),
+            task.completed_at,
+            session_id,
+            task.task_id,
+        )
+        self._maybe_flush()
+
+    def record_message(self, session_id: str, message: Any) -> None:
+        self._messages.append(
+            (
+                session_id,
+                message.message_id,
+                message.sender.value,
+                message.recipient.value,
+                message.message_type.value,
+                _dumps(message.content),
+                message.timestamp,
+            )
+        )
+        self._maybe_flush()
+
+    def _maybe_flush(self) -> None:
+        if self.pending >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self.pending:
+            return
+        rows = self.pending
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?, ?, ?, ?)",
+                self._sessions.values(),
+            )
+            self._conn.executemany(
+                "DELETE FROM tasks WHERE session_id = ?",
+                [(session_id,) for session_id in self._replaced_tasks],
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                self._tasks.values(),
+            )
+            self._conn.executemany(
+                "UPDATE tasks SET assigned_agent = ?, status = ?, results = ?, "
+                "completed_at = ? "
+                "WHERE session_id = ? AND task_id = ?",
+                self._task_updates.values(),
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO messages VALUES (?, ?, ?, ?, ?, ?, ?)",
+                self._messages,
+            )
+        self._sessions.clear()
+        self._replaced_tasks.clear()
+        self._tasks.clear()
+        self._task_updates.clear()
+        self._messages.clear()
+        self.stats["commits"] += 1
+        self.stats["rows"] += rows
+
+    def load_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        self.flush()
+        row = self._conn.execute(
+            "SELECT * FROM sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        tasks = self._conn.execute(
+            "SELECT task_id, description, assigned_agent, status, dependencies, "
+            "results, created_at, completed_at FROM tasks "
+            "WHERE session_id = ? ORDER BY position",
+            (session_id,),
+        ).fetchall()
+        messages = self._conn.execute(
+            "SELECT message_id, sender, recipient, message_type, content, timestamp "
+            "FROM messages WHERE session_id = ? ORDER BY rowid",
+            (session_id,),
+        ).fetchall()
+        return {
+            "session_id": row[0],
+            "problem_description": row[1],
+            "participating_agents": json.loads(row[2]),
+            "consensus_threshold": row[3],
+            "created_at": row[4],
+            "completed_at": row[5],
+            "context": json.loads(row[6]),
+            "tasks": [
+                {
+                    "task_id": t[0],
+                    "description": t[1],
+                    "assigned_agent": t[2],
+                    "status": t[3],
+                    "dependencies": json.loads(t[4]),
+                    "results": json.loads(t[5]),
+                    "created_at": t[6],
+                    "completed_at": t[7],
+                }
+                for t in tasks
+            ],
+            "messages": [
+                {
+                    "message_id": m[0],
+                    "sender": m[1],
+                    "recipient": m[2],
+                    "message_type": m[3],
+                    "content": json.loads(m[4]),
+                    "timestamp": m[5],
+                }
+                for m in messages
+            ],
+        }
+
+    def session_ids(self) -> List[str]:
+        self.flush()
+        rows = self._conn.execute("SELECT session_id FROM sessions ORDER BY created_at")
+        return [row[0] for row in rows]
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, default=str)
+
+
+def _session_row(session: Any) -> Tuple:
+    return (
+        session.session_id,
+        session.problem_description,
+        json.dumps([agent.value for agent in session.participating_agents]),
+        session.consensus_threshold,
+        session.created_at,
+        session.completed_at,
+        _dumps(session.context),
+    )
+
+
+def _task_row(session_id: str, position: int, task: Any) -> Tuple:
+    return (
+        session_id,
+        task.task_id,
+        position,
+        task.description,
+        task.assigned_agent.value,
+        task.status.value,
+        json.dumps(list(task.dependencies)),
+        _dumps(task.results),
+        task.created_at,
+        task.completed_at,
+    )
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Template Registry
+
+Indexes a template pack once so the generator can look templates up by role or
+script name in O(1) instead of probing the Jinja loader and catching
+``TemplateNotFound``.
+
+Templates may declare metadata in a front-matter comment on their first line::
+
+    {#---
+    role: frontend-developer
+    output: .github/instructions/{role}.instructions.md
+    mode: "0644"
+    ---#}
+
+Files without front matter are classified by name: ``agent_<role>_instructions*``
+templates become agent instructions and ``script_<name>.j2`` templates become
+executable scripts under ``scripts/``.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+AGENT = "agent"
+SCRIPT = "script"
+WORKFLOW = "workflow"
+TEMPLATE = "template"
+
+FRONT_MATTER_START = "{#---"
+FRONT_MATTER_END = "---#}"
+# Front matter must sit at the top; only this much of each file is read.
+FRONT_MATTER_MAX_BYTES = 4096
+INDEX_VERSION = 2
+
+_AGENT_NAME = re.compile(r"^agent_(?P<role>.+?)_instructions\.md\.j2$")
+# Agent-named templates shared by every role rather than selecting one.
+_SHARED_AGENT_TEMPLATES = {"base"}
+_SCRIPT_NAME = re.compile(r"^script_(?P<name>.+)\.j2$")
+_WORKFLOW_NAME = re.compile(r"^workflow_(?P<name>.+)\.yml\.j2$")
+
+
+def normalize_role(role: str) -> str:
+    """Canonical role key: ``test_engineer`` and ``Test-Engineer`` match."""
+    return role.strip().lower().replace("_", "-")
+
+
+@dataclass
+class TemplateEntry:
+    """A template in a pack and where its output goes."""
+
+    name: str  # Loader-relative template name
+    kind: str = TEMPLATE
+    key: Optional[str] = None  # Normalized role for agents, file name for scripts
+    output: Optional[str] = None  # May contain a ``{role}`` placeholder
+    mode: Optional[int] = None
+
+    def output_path(self, **fields: str) -> Optional[str]:
+        return self.output.format(**fields) if self.output else None
+
+
+class TemplateRegistry:
+    """O(1) lookup of templates by kind and key for one template pack."""
+
+    def __init__(
+        self, templates_dir: Path, entries: List[TemplateEntry], signature: str
+    ):
+        self.templates_dir = templates_dir
+        self.signature = signature
+        self.entries = entries
+        self._by_key: Dict[Tuple[str, str], TemplateEntry] = {}
+        self._by_kind: Dict[str, List[TemplateEntry]] = {}
+        self._names = set()
+        for entry in entries:
+            self._names.add(entry.name)
+            self._by_kind.setdefault(entry.kind, []).append(entry)
+            if entry.key is not None:
+                self._by_key.setdefault((entry.kind, entry.key), entry)
+
+    def get(self, kind: str, key: str) -> Optional[TemplateEntry]:
+        """Look up a template; agent keys are matched as normalized roles."""
+        if kind == AGENT:
+            key = normalize_role(key)
+        return self._by_key.get((kind, key))
+
+    def of_kind(self, kind: str) -> List[TemplateEntry]:
+        return self._by_kind.get(kind, [])
+
+    def has(self, name: str) -> bool:
+        return name in self._names
+
+    @classmethod
+    def scan(
+        cls, templates_dir: Path, signature: Optional[str] = None
+    ) -> "TemplateRegistry":
+        """Build a registry by walking the pack and reading front matter."""
+        files = _template_files(templates_dir)
+        entries = [
+            _classify(name, _read_front_matter(templates_dir / name))
+            for name in sorted(files)
+        ]
+        return cls(templates_dir, entries, signature or _signature(files))
+
+    def to_index(self) -> Dict[str, Any]:
+        return {
+            "version": INDEX_VERSION,
+            "templates_dir": str(self.templates_dir),
+            "signature": self.signature,
+            "entries": [asdict(entry) for entry in self.entries],
+        }
+
+    @classmethod
+    def from_index(
+        cls, templates_dir: Path, index: Dict[str, Any]
+    ) -> "TemplateRegistry":
+        entries = [TemplateEntry(**entry) for entry in index["entries"]]
+        return cls(templates_dir, entries, index["signature"])
+
+
+def _template_files(templates_dir: Path) -> Dict[str, Tuple[int, int]]:
+    """Map loader-relative ``*.j2`` names to (mtime_ns, size)."""
+    files = {}
+    for root, _, names in os.walk(templates_dir):
+        for name in names:
+            if not name.endswith(".j2"):
+                continue
+            path = Path(root) / name
+            stat = path.stat()
+            rel = path.relative_to(templates_dir).as_posix()
+            files[rel] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+
+def _signature(files: Dict[str, Tuple[int, int]]) -> str:
+    digest = hashlib.sha256()
+    for name in sorted(files):
+        mtime, size = files[name]
+        digest.update(f"{name}\0{mtime}\0{size}\n".encode())
+    return digest.hexdigest()
+
+
+def _read_front_matter(path: Path) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        head = f.read(FRONT_MATTER_MAX_BYTES)
+    if not head.startswith(FRONT_MATTER_START):
+        return {}
+    end = head.find(FRONT_MATTER_END)
+    if end == -1:
+        logger.warning(f"Unterminated front matter in {path}")
+        return {}
+    try:
+        meta = yaml.safe_load(head[len(FRONT_MATTER_START) : end]) or {}
+    except yaml.YAMLError as e:
+        logger.warning(f"Invalid front matter in {path}: {e}")
+        return {}
+    return meta if isinstance(meta, dict) else {}
+
+
+def _classify(name: str, meta: Dict[str, Any]) -> TemplateEntry:
+    """Derive an entry from front matter, falling back to naming conventions."""
+    entry = TemplateEntry(name=name)
+    # Naming conventions only apply at the pack root; nested files (such as
+    # another pack inside the default one) need explicit front matter.
+    if "/" not in name:
+        agent = _AGENT_NAME.match(name)
+        if agent and normalize_role(agent.group("role")) in _SHARED_AGENT_TEMPLATES:
+            agent = None
+        script = _SCRIPT_NAME.match(name)
+        workflow = _WORKFLOW_NAME.match(name)
+        if agent:
+            entry.kind = AGENT
+            entry.key = normalize_role(agent.group("role"))
+            entry.output = ".github/instructions/{role}.instructions.md"
+        elif script:
+            entry.kind = SCRIPT
+            entry.key = script.group("name")
+            entry.output = f"scripts/{entry.key}"
+            entry.mode = 0o755
+        elif workflow:
+            entry.kind = WORKFLOW
+            entry.key = workflow.group("name").replace("_", "-")
+            entry.output = f".github/workflows/{entry.key}.yml"
+
+    if "role" in meta:
+        entry.kind = AGENT
+        entry.key = normalize_role(str(meta["role"]))
+        entry.output = entry.output or ".github/instructions/{role}.instructions.md"
+    if "kind" in meta:
+        entry.kind = str(meta["kind"])
+    if "key" in meta:
+        entry.key = str(meta["key"])
+    if "output" in meta:
+        entry.output = str(meta["output"])
+    if "mode" in meta:
+        mode = meta["mode"]
+        entry.mode = int(mode, 8) if isinstance(mode, str) else int(mode)
+    return entry
+
+
+# Registries already scanned in this process, keyed by pack directory.
+_registries: Dict[Path, TemplateRegistry] = {}
+
+
+def _index_path(templates_dir: Path) -> Path:
+    from .tmp_manager import get_tmp_manager
+
+    pack_hash = hashlib.sha256(str(templates_dir).encode()).hexdigest()[:16]
+    index_dir = get_tmp_manager("agentic-dev-boilerplate").get_task_dir(
+        "template-index"
+    )
+    return index_dir / f"{pack_hash}.json"
+
+
+def get_template_registry(
+    templates_dir: Path, index_path: Optional[Path] = None
+) -> TemplateRegistry:
+    """Get the registry for a pack, rescanning only when its files changed.
+
+    The registry is memoized per process and persisted as a JSON index so a
+    new process only pays for a stat walk when nothing changed.
+    """
+    templates_dir = Path(templates_dir).resolve()
+    if not templates_dir.is_dir():
+        return TemplateRegistry(templates_dir, [], "")
+
+    signature = _signature(_template_files(templates_dir))
+    cached = _registries.get(templates_dir)
+    if cached is not None and cached.signature == signature:
+        return cached
+
+    if index_path is None:
+        try:
+            index_path = _index_path(templates_dir)
+        except OSError as e:
+            logger.warning(f"Template index directory unavailable: {e}")
+
+    registry = None
+    if index_path is not None and index_path.exists():
+        try:
+            with open(index_path, "r") as f:
+                index = json.load(f)
+            if (
+                index.get("version") == INDEX_VERSION
+                and index.get("signature") == signature
+            ):
+                registry = TemplateRegistry.from_index(templates_dir, index)
+        except (OSError, ValueError, KeyError, TypeError):
+            registry = None
+
+    if registry is None:
+        registry = TemplateRegistry.scan(templates_dir, signature)
+        if index_path is not None:
+            try:
+                with open(index_path, "w") as f:
+                    json.dump(registry.to_index(), f)
+            except OSError as e:
+                logger.warning(f"Could not persist template index: {e}")
+
+    _registries[templates_dir] = registry
+    return registry
@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+Session Tracing
+
+Lightweight span tracing for coordinator sessions, exported as OTLP/JSON
+to a local file so timelines can be loaded into any OpenTelemetry-aware
+viewer without a collector or network exporter.
+
+A :class:`Tracer` creates :class:`Span` objects; the span being executed is
+tracked in a context variable, so nested spans (including those in asyncio
+tasks started inside a span) pick up their parent automatically, and an
+explicit ``parent`` can be given where the structure does not follow the
+call stack (e.g. tasks following their dependencies). Sampling is decided
+once per trace from the trace ID, so a trace is either kept whole or
+dropped whole.
+
+Finished spans are handed to an :class:`OTLPJsonFileExporter`, which
+batches them on a background thread and appends one OTLP
+``ExportTraceServiceRequest`` JSON object per line.
+"""
+
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from contextvars import ContextVar, Token
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Sequence, Type, Union
+
+logger = logging.getLogger(__name__)
+
+# OTLP status codes.
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+# OTLP span kind INTERNAL: all coordinator spans are in-process work.
+_KIND_INTERNAL = 1
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+_ids = random.Random(int.from_bytes(os.urandom(8), "big"))
+# Queued after the last span to stop the exporter thread.
+_SHUTDOWN = object()
+
+
+def current_span() -> Optional["Span"]:
+    """The span being executed in this context, if any."""
+    return _current_span.get()
+
+
+class Span:
+    """One timed operation; also a context manager that makes it current."""
+
+    __slots__ = (
+        "tracer",
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_span_id",
+        "sampled",
+        "attributes",
+        "links",
+        "start_ns",
+        "end_ns",
+        "status_code",
+        "status_message",
+        "_token",
+    )
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        trace_id: str,
+        parent_span_id: str,
+        sampled: bool,
+        attributes: Optional[Dict[str, Any]] = None,
+        links: Sequence["Span"] = (),
+    ):
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.parent_span_id = parent_span_id
+        self.sampled = sampled
+        self.end_ns: Optional[int] = None
+        self.status_code = STATUS_UNSET
+        self.status_message = ""
+        self._token: Optional[Token[Optional[Span]]] = None
+        if not sampled:
+            # Only carries the sampling decision to its children.
+            self.span_id = ""
+            self.attributes = {}
+            self.links = []
+            self.start_ns = 0
+            return
+        self.span_id = f"{_ids.getrandbits(64):016x}"
+        self.attributes = dict(attributes) if attributes else {}
+        self.links = [(s.trace_id, s.span_id) for s in links]
+        self.start_ns = time.time_ns()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if self.sampled:
+            self.attributes[key] = value
+
+    def set_error(self, error: BaseException) -> None:
+        self.status_code = STATUS_ERROR
+        self.status_message = f"{type(error).__name__}: {error}"
+
+    def end(self) -> None:
+        """Finish the span and hand it to the exporter (once)."""
+        if self.end_ns is not None:
+            return
+        if self.sampled:
+            self.end_ns = time.time_ns()
+            self.tracer._finish(self)
+        else:
+            self.end_ns = 0
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        if self._token is not None:
+            _current_span.reset(self._token)
+            self._token = None
+        if exc is not None:
+            self.set_error(exc)
+        self.end()
+
+    def to_otlp(self) -> Dict[str, Any]:
+        span: Dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": _KIND_INTERNAL,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": _otlp_attributes(self.attributes),
+            "status": {"code": self.status_code},
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        if self.links:
+            span["links"] = [
+                {"traceId": trace_id, "spanId": span_id}
+                for trace_id, span_id in self.links
+            ]
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+        return span
+
+
+class _NoopSpan:
+    """Stand-in returned by a disabled tracer; records nothing."""
+
+    sampled = False
+    end_ns = 0
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_error(self, error: BaseException) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+# What Tracer.span returns: a recording span or the shared no-op.
+AnySpan = Union[Span, _NoopSpan]
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        # OTLP/JSON encodes 64-bit integers as strings.
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [_otlp_value(v) for v in value]}}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": k, "value": _otlp_value(v)} for k, v in attributes.items()]
+
+
+class OTLPJsonFileExporter:
+    """Batches finished spans to an OTLP/JSON Lines file on a background thread.
+
+    Spans are queued without blocking the caller; when more than
+    ``max_queue`` are waiting, new ones are dropped (and counted in
+    :attr:`dropped`) rather than slowing sessions down.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        service_name: str = "agentic-dev-boilerplate",
+        max_batch: int = 512,
+        flush_interval: float = 1.0,
+        max_queue: int = 8192,
+    ):
+        if max_batch < 1 or max_queue < 1 or flush_interval <= 0:
+            raise ValueError("max_batch, max_queue and flush_interval must be > 0")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.service_name = service_name
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue" = queue.Queue(max_queue)
+        self.exported = 0
+        self.dropped = 0
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._loop, name="otlp-file-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def export(self, span: Span) -> None:
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def _loop(self) -> None:
+        batch: List[Span] = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                item = None
+            if isinstance(item, Span):
+                batch.append(item)
+                if len(batch) < self.max_batch and time.monotonic() < deadline:
+                    continue
+            # Batch full, interval elapsed, or a flush/shutdown request.
+            self._write(batch)
+            batch = []
+            deadline = time.monotonic() + self.flush_interval
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is _SHUTDOWN:
+                return
+
+    def _write(self, spans: List[Span]) -> None:
+        if not spans:
+            return
+        request = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": _otlp_attributes(
+                            {"service.name": self.service_name}
+                        )
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": __name__},
+                            "spans": [span.to_otlp() for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(request, separators=(",", ":")) + "\n")
+            self.exported += len(spans)
+        except OSError as e:
+            self.dropped += len(spans)
+            logger.warning(f"Could not write {len(spans)} spans to {self.path}: {e}")
+
+    def force_flush(self, timeout: Optional[float] = None) -> bool:
+        """Write all spans queued so far; False if that took over ``timeout``."""
+        if self._closed:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def shutdown(self) -> None:
+        """Flush queued spans and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_SHUTDOWN)
+        self._thread.join()
+
+
+class Tracer:
+    """Creates spans and hands the sampled ones to an exporter.
+
+    Without an exporter the tracer is disabled and every span is a shared
+    no-op. ``sample_ratio`` is the share of traces kept.
+    """
+
+    def __init__(
+        self,
+        exporter: Optional[OTLPJsonFileExporter] = None,
+        sample_ratio: float = 1.0,
+    ):
+        if not 0.0 <= sample_ratio <= 1.0:
+            raise ValueError("sample_ratio must be between 0.0 and 1.0")
+        self.exporter = exporter
+        self.sample_ratio = sample_ratio
+        # Trace IDs whose lower 64 bits fall below this bound are sampled.
+        self._bound = int(sample_ratio * (1 << 64))
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    def span(
+        self,
+        name: str,
+        parent: Optional[AnySpan] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+        links: Sequence[Span] = (),
+    ) -> AnySpan:
+        """Start a span; use it as a context manager or call ``end()``.
+
+        ``parent`` defaults to the current span; without one the span
+        starts a new trace. ``links`` point at further causal predecessors.
+        """
+        if self.exporter is None:
+            return NOOP_SPAN
+        if not isinstance(parent, Span):
+            parent = _current_span.get()
+        if parent is None:
+            trace_bits = _ids.getrandbits(128)
+            trace_id = f"{trace_bits:032x}"
+            sampled = (trace_bits & ((1 << 64) - 1)) < self._bound
+            return Span(self, name, trace_id, "", sampled, attributes, links)
+        return Span(
+            self,
+            name,
+            parent.trace_id,
+            parent.span_id,
+            parent.sampled,
+            attributes,
+            links,
+        )
+
+    def _finish(self, span: Span) -> None:
+        if self.exporter is not None:
+            self.exporter.export(span)
+
+    def force_flush(self, timeout: Optional[float] = None) -> bool:
+        return self.exporter.force_flush(timeout) if self.exporter else True
+
+    def shutdown(self) -> None:
+        if self.exporter:
+            self.exporter.shutdown()
@@ -0,0 +1,159 @@
+"""Tests for agent_workers module and the subprocess backend."""
+
+import asyncio
+import time
+
+import pytest
+
+from agentic_dev_boilerplate.agent_workers import (
+    ECHO_WORKER,
+    WorkerError,
+    WorkerPoolBackend,
+)
+from agentic_dev_boilerplate.backends import TaskPayload
+from agentic_dev_boilerplate.multi_agent_solver import (
+    AgentCoordinator,
+    AgentRole,
+    Task,
+    TaskStatus,
+)
+
+
+@pytest.fixture
+def backend():
+    backend = WorkerPoolBackend(max_workers=2, health_interval=None)
+    yield backend
+    backend.shutdown()
+
+
+def run(backend, *descriptions, role="tester"):
+    async def scenario():
+        futures = [
+            backend.submit(TaskPayload(str(i), description, role))
+            for i, description in enumerate(descriptions)
+        ]
+        return await asyncio.gather(*futures, return_exceptions=True)
+
+    return asyncio.run(scenario())
+
+
+def test_workers_are_reused_across_event_loops(backend):
+    first = run(backend, "a", "b", "c", "d")
+    second = run(backend, "e", "f")
+
+    pids = {r["worker_pid"] for r in first + second}
+    assert [r["task"] for r in first] == ["a", "b", "c", "d"]
+    assert len(pids) <= 2
+    assert backend.stats()["tester"]["spawned"] == len(pids)
+
+
+def test_pool_grows_with_backlog_up_to_max(backend):
+    run(backend, *"abcdefgh")
+
+    stats = backend.stats()["tester"]
+    assert stats["spawned"] == 2
+    assert stats["tasks"] == 8
+
+
+def test_worker_errors_fail_only_their_task(backend):
+    ok, failed = run(backend, "a", "fail please")
+
+    assert ok["task"] == "a"
+    assert isinstance(failed, WorkerError)
+    assert "refused" in str(failed)
+
+
+def test_crashed_worker_is_replaced(backend):
+    crashed, ok = run(backend, "crash", "after")
+
+    assert isinstance(crashed, WorkerError)
+    assert ok["task"] == "after"
+    assert run(backend, "again")[0]["task"] == "again"
+    assert backend.stats()["tester"]["crashed"] == 1
+
+
+def test_workers_recycled_after_max_tasks():
+    backend = WorkerPoolBackend(
+        max_workers=1, max_tasks_per_worker=2, health_interval=None
+    )
+    try:
+        results = [run(backend, "t")[0] for _ in range(5)]
+    finally:
+        backend.shutdown()
+
+    pids = [r["worker_pid"] for r in results]
+    assert pids[0] == pids[1] != pids[2] == pids[3] != pids[4]
+    assert backend.pools == {}
+
+
+def test_cancelled_task_kills_its_worker(backend):
+    async def scenario():
+        future = backend.submit(TaskPayload("0", "hang", "tester"))
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(future, 0.5)
+        return await backend.submit(TaskPayload("1", "next", "tester"))
+
+    assert asyncio.run(scenario())["task"] == "next"
+
+
+def test_health_check_replaces_dead_idle_workers(backend):
+    run(backend, "warm")
+    pool = backend.pool("tester")
+    (worker,) = pool._idle
+    worker.kill()
+
+    pool.maintain(health_timeout=1)
+
+    stats = pool.stats()
+    assert stats["unhealthy"] == 1
+    assert stats["workers"] == 1  # min_workers restored
+    assert pool._idle[0].ping(1)
+
+
+def test_idle_workers_beyond_minimum_are_reaped():
+    backend = WorkerPoolBackend(max_workers=3, idle_timeout=0, health_interval=None)
+    try:
+        run(backend, *"abcdef")
+        pool = backend.pool("tester")
+        time.sleep(0.01)
+        pool.maintain(health_timeout=1)
+        assert pool.stats()["workers"] == 1
+    finally:
+        backend.shutdown()
+
+
+def test_missing_command_fails_tasks():
+    backend = WorkerPoolBackend(
+        {"tester": ["/nonexistent/agent"]}, health_interval=None
+    )
+    try:
+        (result,) = run(backend, "a")
+    finally:
+        backend.shutdown()
+
+    assert isinstance(result, WorkerError)
+
+
+def test_invalid_bounds_rejected():
+    with pytest.raises(ValueError):
+        WorkerPoolBackend(min_workers=3, max_workers=2)
+
+
+def test_coordinator_with_subprocess_backend(tmp_path):
+    backend = WorkerPoolBackend(
+        {"debugger": list(ECHO_WORKER)}, max_workers=2, health_interval=None
+    )
+    with AgentCoordinator(tmp_path, backend=backend, task_timeout=5) as coordinator:
+        session_id = coordinator.create_session(
+            "problem", [AgentRole.TESTER, AgentRole.DEBUGGER]
+        )
+        coordinator.active_sessions[session_id].tasks = [
+            Task(task_id="ok", description="run", assigned_agent=AgentRole.TESTER),
+            Task(task_id="bad", description="fail", assigned_agent=AgentRole.DEBUGGER),
+        ]
+        result = coordinator.execute_session(session_id)
+
+    assert result["results"]["ok"]["result"] == "Completed run"
+    assert "refused" in result["errors"]["bad"]
+    statuses = [t.status for t in coordinator.active_sessions[session_id].tasks]
+    assert statuses == [TaskStatus.COMPLETED, TaskStatus.FAILED]
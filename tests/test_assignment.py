@@ -0,0 +1,157 @@
+"""Tests for assignment module."""
+
+import pytest
+
+from agentic_dev_boilerplate import assignment
+from agentic_dev_boilerplate.assignment import TaskAssigner, stem, tokenize
+from agentic_dev_boilerplate.multi_agent_solver import AgentCoordinator, AgentRole
+
+
+@pytest.fixture(params=[False, True], ids=["python", "numpy"])
+def vectorized(request):
+    if request.param and assignment.np is None:
+        pytest.skip("numpy not installed")
+    return request.param
+
+
+@pytest.fixture
+def assigner(vectorized):
+    return TaskAssigner.for_roles(AgentRole, vectorized=vectorized)
+
+
+@pytest.mark.parametrize(
+    "word, expected",
+    [
+        ("testing", "test"),
+        ("tests", "test"),
+        ("validation", "valid"),
+        ("validate", "valid"),
+        ("planning", "plan"),
+        ("debugging", "debug"),
+        ("deployment", "deploy"),
+        ("process", "process"),
+    ],
+)
+def test_stem(word, expected):
+    assert stem(word) == expected
+
+
+def test_tokenize_splits_on_punctuation():
+    assert tokenize("Fix CI/CD pipeline_config!") == [
+        "fix",
+        "ci",
+        "cd",
+        "pipelin",
+        "config",
+    ]
+
+
+@pytest.mark.parametrize(
+    "description, role",
+    [
+        ("Plan the migration", AgentRole.PLANNER),
+        ("Validate solution components", AgentRole.TESTER),
+        ("Fix the crashing parser", AgentRole.DEBUGGER),
+        ("Deploy to production", AgentRole.DEPLOYER),
+        ("Design the storage architecture", AgentRole.SYSTEMS_ENGINEER),
+        ("Set up the CI pipeline", AgentRole.DEVOPS_SPECIALIST),
+        ("Coordinate the agents", AgentRole.ORCHESTRATOR),
+    ],
+)
+def test_best_role(assigner, description, role):
+    assert assigner.assign([description]) == [role]
+
+
+def test_only_available_roles_are_chosen(assigner):
+    available = [AgentRole.TESTER, AgentRole.DEBUGGER]
+
+    assert assigner.assign(["Deploy to production"], available)[0] in available
+
+
+def test_load_does_not_override_a_clear_match(assigner):
+    available = [AgentRole.TESTER, AgentRole.DEBUGGER]
+
+    assigned = assigner.assign(["Fix the parser"], available, {AgentRole.DEBUGGER: 9})
+
+    assert assigned == [AgentRole.DEBUGGER]
+
+
+def test_ties_go_to_least_loaded_role(assigner):
+    available = [AgentRole.PLANNER, AgentRole.TESTER, AgentRole.DEBUGGER]
+    loads = {AgentRole.PLANNER: 2, AgentRole.TESTER: 0, AgentRole.DEBUGGER: 1}
+
+    assigned = assigner.assign(["unrelated chore"] * 6, available, loads)
+
+    # Each tie is resolved against the load including earlier assignments.
+    assert assigned == [
+        AgentRole.TESTER,
+        AgentRole.TESTER,
+        AgentRole.DEBUGGER,
+        AgentRole.PLANNER,
+        AgentRole.TESTER,
+        AgentRole.DEBUGGER,
+    ]
+
+
+def test_clear_matches_count_towards_batch_load(assigner):
+    available = [AgentRole.PLANNER, AgentRole.TESTER]
+
+    assigned = assigner.assign(["Plan it", "Plan it", "unrelated"], available)
+
+    assert assigned == [AgentRole.PLANNER, AgentRole.PLANNER, AgentRole.TESTER]
+
+
+def test_paths_agree():
+    if assignment.np is None:
+        pytest.skip("numpy not installed")
+    descriptions = [
+        "Plan, test and deploy the release",
+        "",
+        "Fix\x00the flaky test",
+        "Design CI for the new architecture",
+    ] * 25
+    python = TaskAssigner.for_roles(AgentRole, vectorized=False)
+    numpy = TaskAssigner.for_roles(AgentRole, vectorized=True)
+
+    assert numpy.assign(descriptions) == python.assign(descriptions)
+    for expected, actual in zip(python.score(descriptions), numpy.score(descriptions)):
+        assert actual == pytest.approx(expected)
+
+
+def test_nul_in_description_keeps_rows_aligned(assigner):
+    scores = assigner.score(["Fix\x00the bug", "Plan"])
+
+    assert len(scores) == 2
+
+
+def test_invalid_candidates(assigner):
+    assert assigner.assign([], [AgentRole.TESTER]) == []
+    with pytest.raises(ValueError, match="No agents"):
+        assigner.assign(["Plan"], [])
+    with pytest.raises(ValueError, match="Unknown roles"):
+        TaskAssigner({"a": "alpha"}).assign(["alpha"], ["b"])
+
+
+def test_coordinator_assigns_batch_with_instruction_files(tmp_path):
+    instructions = tmp_path / ".github" / "instructions"
+    instructions.mkdir(parents=True)
+    (instructions / "systems-engineer.instructions.md").write_text(
+        "**Role**: Storage internals\n\n**Core Responsibilities**:\n"
+        "- Compaction tuning\n"
+    )
+    coordinator = AgentCoordinator(tmp_path)
+    session_id = coordinator.create_session(
+        "Tune compaction", [AgentRole.TESTER, AgentRole.SYSTEMS_ENGINEER]
+    )
+
+    assigned = coordinator.assign_tasks(
+        ["Tune compaction", "Test the storage layer"],
+        [AgentRole.TESTER, AgentRole.SYSTEMS_ENGINEER],
+    )
+    tasks = coordinator.decompose_problem(session_id)
+
+    assert assigned == [AgentRole.SYSTEMS_ENGINEER, AgentRole.TESTER]
+    assert {task.assigned_agent for task in tasks} <= {
+        AgentRole.TESTER,
+        AgentRole.SYSTEMS_ENGINEER,
+    }
@@ -0,0 +1,118 @@
+"""Tests for backends module."""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from agentic_dev_boilerplate.backends import (
+    ExecutorBackend,
+    TaskPayload,
+    create_backend,
+)
+from agentic_dev_boilerplate.multi_agent_solver import AgentCoordinator, AgentRole
+
+
+def worker_pid(payload):
+    """Module-level so it pickles into worker processes."""
+    return {"task": payload.task_id, "pid": os.getpid()}
+
+
+def fail_odd(payload):
+    if int(payload.task_id) % 2:
+        raise ValueError(f"bad payload {payload.task_id}")
+    return {"task": payload.task_id}
+
+
+def run_payloads(backend, count):
+    async def scenario():
+        futures = [
+            backend.submit(TaskPayload(str(i), "d", "tester")) for i in range(count)
+        ]
+        return await asyncio.gather(*futures, return_exceptions=True)
+
+    try:
+        return asyncio.run(scenario())
+    finally:
+        backend.shutdown()
+
+
+def test_process_backend_runs_in_workers():
+    """Payloads and the task function cross into worker processes."""
+    backend = create_backend("process", worker_pid, max_workers=2)
+
+    results = run_payloads(backend, 8)
+
+    assert [r["task"] for r in results] == [str(i) for i in range(8)]
+    assert os.getpid() not in {r["pid"] for r in results}
+
+
+def test_small_tasks_are_chunked():
+    """Many payloads from one tick travel in far fewer executor jobs."""
+    backend = ExecutorBackend("thread", worker_pid, max_workers=2)
+
+    results = run_payloads(backend, 200)
+
+    assert len(results) == 200
+    assert backend.chunks_submitted == 8  # chunks of 200 // (2 workers * 4)
+
+
+def test_failure_is_isolated_to_its_payload():
+    """A raising task fails its own future, not the rest of the chunk."""
+    backend = ExecutorBackend("thread", fail_odd, max_workers=1, chunk_size=4)
+
+    results = run_payloads(backend, 4)
+
+    assert results[0] == {"task": "0"}
+    assert isinstance(results[1], ValueError)
+    assert results[2] == {"task": "2"}
+
+
+def test_expired_payloads_are_not_started():
+    """Payloads whose deadline passed while queued fail without running."""
+    started = []
+
+    def record(payload):
+        started.append(payload.task_id)
+        return {"task": payload.task_id}
+
+    backend = ExecutorBackend("thread", record, max_workers=1)
+
+    async def scenario():
+        futures = [
+            backend.submit(TaskPayload("late", "d", "tester", deadline=time.time())),
+            backend.submit(TaskPayload("ok", "d", "tester", deadline=None)),
+        ]
+        return await asyncio.gather(*futures, return_exceptions=True)
+
+    try:
+        late, ok = asyncio.run(scenario())
+    finally:
+        backend.shutdown()
+
+    assert isinstance(late, TimeoutError)
+    assert ok == {"task": "ok"}
+    assert started == ["ok"]
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError, match="Unknown execution backend"):
+        create_backend("gpu")
+
+
+@pytest.mark.parametrize("backend", ["inline", "thread"])
+def test_coordinator_backends_run_tasks_concurrently(tmp_path, backend):
+    """Independent tasks overlap on every backend."""
+    with AgentCoordinator(tmp_path, backend=backend, max_workers=8) as coordinator:
+        session_id = coordinator.create_session("problem", [AgentRole.TESTER])
+        coordinator.decompose_problem(session_id)
+
+        start = time.perf_counter()
+        result = coordinator.execute_session(session_id)
+        elapsed = time.perf_counter() - start
+
+    assert len(result["results"]) == 3
+    assert elapsed < 0.25
+    if backend == "thread":
+        assert coordinator.backend._executor is None  # shut down on exit
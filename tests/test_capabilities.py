@@ -0,0 +1,137 @@
+"""Tests for capabilities module."""
+
+import json
+
+import pytest
+
+from agentic_dev_boilerplate import capabilities
+from agentic_dev_boilerplate.capabilities import (
+    extract_capabilities,
+    get_capability_index,
+)
+from agentic_dev_boilerplate.multi_agent_solver import AgentCoordinator, AgentRole
+
+
+def instructions(*responsibilities):
+    bullets = "\n".join(f"- {item}" for item in responsibilities)
+    return (
+        "# Role\n\n**Role**: Does the work\n\n"
+        f"**Core Responsibilities**:\n{bullets}\n\n## Other\n- not this\n"
+    )
+
+
+@pytest.fixture
+def instructions_dir(tmp_path):
+    """Instruction files named the way the generator writes them."""
+    directory = tmp_path / "workspace" / ".github" / "instructions"
+    directory.mkdir(parents=True)
+    (directory / "planner.instructions.md").write_text(instructions("Plan work"))
+    (directory / "systems-engineer.instructions.md").write_text(
+        instructions("Design systems", "Review architecture")
+    )
+    (directory / "README.md").write_text("not an instruction file")
+    return directory
+
+
+@pytest.fixture(autouse=True)
+def fresh_indexes():
+    capabilities._indexes.clear()
+    yield
+    capabilities._indexes.clear()
+
+
+def test_extract_capabilities_stops_at_next_section():
+    assert extract_capabilities(instructions("One", "Two")) == ["One", "Two"]
+    assert extract_capabilities("# No responsibilities\n") == []
+
+
+@pytest.mark.parametrize(
+    "role", ["systems_engineer", "systems-engineer", "Systems_Engineer"]
+)
+def test_roles_are_normalized(instructions_dir, tmp_path, role):
+    """Hyphenated file names serve underscore role values."""
+    index = get_capability_index(instructions_dir, tmp_path / "index.json")
+
+    assert index.get(role) == ["Design systems", "Review architecture"]
+    assert index.scope(role) == "Does the work"
+    assert index.roles() == ["planner", "systems-engineer"]
+
+
+def test_coordinator_loads_every_role(instructions_dir, tmp_path):
+    """Regression: the ``.instructions`` stem suffix kept every role unmatched."""
+    coordinator = AgentCoordinator(instructions_dir.parent.parent)
+
+    assert coordinator.agent_capabilities == {
+        AgentRole.PLANNER: ["Plan work"],
+        AgentRole.SYSTEMS_ENGINEER: ["Design systems", "Review architecture"],
+    }
+
+
+def test_unchanged_directory_is_not_reparsed(instructions_dir, tmp_path, monkeypatch):
+    index_path = tmp_path / "index.json"
+    first = get_capability_index(instructions_dir, index_path)
+
+    def fail(content):
+        raise AssertionError("instruction file parsed again")
+
+    monkeypatch.setattr(capabilities, "extract_capabilities", fail)
+
+    assert get_capability_index(instructions_dir, index_path) is first
+
+
+def test_index_persisted_and_reused(instructions_dir, tmp_path):
+    """A fresh process loads a matching persisted index instead of parsing."""
+    index_path = tmp_path / "index.json"
+    get_capability_index(instructions_dir, index_path)
+    index = json.loads(index_path.read_text())
+
+    # Tamper with the index: if it is reused, the tampered entry shows up.
+    index["files"]["planner.instructions.md"]["capabilities"] = ["from-index"]
+    index_path.write_text(json.dumps(index))
+    capabilities._indexes.clear()
+
+    reloaded = get_capability_index(instructions_dir, index_path)
+
+    assert reloaded.get("planner") == ["from-index"]
+
+
+def test_only_changed_files_are_reparsed(instructions_dir, tmp_path, monkeypatch):
+    index_path = tmp_path / "index.json"
+    get_capability_index(instructions_dir, index_path)
+    parsed = []
+    original = capabilities.extract_capabilities
+
+    def counting(content):
+        parsed.append(content)
+        return original(content)
+
+    monkeypatch.setattr(capabilities, "extract_capabilities", counting)
+    (instructions_dir / "planner.instructions.md").write_text(
+        instructions("Plan work", "Track progress")
+    )
+    (instructions_dir / "devops-specialist.instructions.md").write_text(
+        instructions("Ship it")
+    )
+
+    index = get_capability_index(instructions_dir, index_path)
+
+    assert len(parsed) == 2
+    assert index.get("planner") == ["Plan work", "Track progress"]
+    assert index.get("devops_specialist") == ["Ship it"]
+    persisted = json.loads(index_path.read_text())
+    assert set(persisted["files"]) == set(index.files)
+
+
+def test_removed_file_drops_role(instructions_dir, tmp_path):
+    index_path = tmp_path / "index.json"
+    get_capability_index(instructions_dir, index_path)
+
+    (instructions_dir / "planner.instructions.md").unlink()
+
+    assert get_capability_index(instructions_dir, index_path).get("planner") is None
+
+
+def test_missing_directory_gives_empty_index(tmp_path):
+    index = get_capability_index(tmp_path / "missing", tmp_path / "index.json")
+
+    assert index.roles() == []
@@ -0,0 +1,156 @@
+"""Tests for consensus module and early-terminating sessions."""
+
+import asyncio
+import time
+
+import pytest
+
+from agentic_dev_boilerplate.consensus import ConsensusEngine, ConsensusPolicy
+from agentic_dev_boilerplate.multi_agent_solver import (
+    AgentCoordinator,
+    AgentRole,
+    Task,
+    TaskStatus,
+)
+
+
+def engine(count, threshold=0.8, role="tester", **policy):
+    expected = [(f"t{i}", role) for i in range(count)]
+    return ConsensusEngine(threshold, expected, ConsensusPolicy(**policy))
+
+
+def test_reached_once_guaranteed():
+    consensus = engine(10)
+
+    for i in range(8):
+        assert consensus.observe(f"t{i}", 0.9) is None
+    assert consensus.observe("t8", 0.9) is True
+
+    assert consensus.decided_early
+    assert consensus.outstanding == 1
+    assert consensus.lower_bound == pytest.approx(0.81)
+
+
+def test_failure_once_unreachable():
+    consensus = engine(10)
+
+    assert consensus.observe("t0", 0.1) is None
+    assert consensus.observe("t1", 0.1) is None
+    assert consensus.observe("t2", 0.1) is False
+    assert consensus.upper_bound < 0.8
+
+
+def test_role_weights():
+    expected = [("plan", "planner"), ("t0", "tester"), ("t1", "tester")]
+    consensus = ConsensusEngine(
+        0.8, expected, ConsensusPolicy(weights={"planner": 3.0})
+    )
+
+    assert consensus.observe("plan", 1.0) is None
+    assert consensus.observe("t0", 1.0) is True
+
+
+def test_quorum_requires_reports():
+    consensus = engine(4, threshold=0.5, quorum=1.0)
+
+    for i in range(3):
+        consensus.observe(f"t{i}", 1.0)
+    assert consensus.decision is None
+    assert consensus.observe_failure("t3") is False
+
+
+def test_zero_weight_roles_are_advisory():
+    expected = [("t0", "tester"), ("d0", "debugger")]
+    consensus = ConsensusEngine(
+        0.8, expected, ConsensusPolicy(weights={"debugger": 0.0})
+    )
+
+    assert consensus.observe("t0", 0.9) is True
+
+
+def test_final_decision_matches_plain_average():
+    consensus = engine(3)
+    for i, confidence in enumerate([0.9, 0.7, 0.8]):
+        consensus.observe(f"t{i}", confidence)
+
+    summary = consensus.summary(participant_count=1)
+
+    assert summary["consensus_reached"]
+    assert summary["average_confidence"] == pytest.approx(0.8)
+    assert not summary["decided_early"]
+
+
+def test_duplicate_or_unknown_results_rejected():
+    consensus = engine(2)
+    consensus.observe("t0", 0.5)
+
+    with pytest.raises(KeyError):
+        consensus.observe("t0", 0.5)
+    with pytest.raises(KeyError):
+        consensus.observe("other", 0.5)
+
+
+@pytest.mark.parametrize("policy", [{"quorum": 1.5}, {"weights": {"tester": -1}}])
+def test_policy_validation(policy):
+    with pytest.raises(ValueError):
+        ConsensusPolicy(**policy)
+
+
+def straggler_session(coordinator, straggler_seconds):
+    session_id = coordinator.create_session("problem", [AgentRole.TESTER])
+    coordinator.active_sessions[session_id].tasks = [
+        Task(task_id=f"t{i}", description=f"t{i}", assigned_agent=AgentRole.TESTER)
+        for i in range(5)
+    ]
+
+    async def execute(task):
+        if task.task_id == "t4":
+            await asyncio.sleep(straggler_seconds)
+        return {"confidence": 1.0}
+
+    coordinator._execute_agent_task_async = execute
+    return session_id
+
+
+def test_early_consensus_cancels_stragglers(tmp_path):
+    coordinator = AgentCoordinator(
+        tmp_path, consensus_policy=ConsensusPolicy(early_termination=True)
+    )
+    session_id = straggler_session(coordinator, straggler_seconds=30)
+
+    start = time.perf_counter()
+    result = coordinator.execute_session(session_id)
+
+    assert time.perf_counter() - start < 5
+    assert result["consensus"]["consensus_reached"]
+    assert result["consensus"]["decided_early"]
+    assert sorted(result["results"]) == ["t0", "t1", "t2", "t3"]
+    statuses = {
+        t.task_id: t.status for t in coordinator.active_sessions[session_id].tasks
+    }
+    assert statuses["t4"] == TaskStatus.BLOCKED
+
+
+def test_without_early_termination_all_tasks_run(tmp_path):
+    coordinator = AgentCoordinator(tmp_path)
+    session_id = straggler_session(coordinator, straggler_seconds=0.05)
+
+    result = coordinator.execute_session(session_id)
+
+    assert len(result["results"]) == 5
+    assert result["consensus"]["decided_early"]
+    assert result["consensus"]["results_reported"] == 5
+
+
+def test_summary_counts_missing_results():
+    consensus = engine(5)
+
+    for i in range(3):
+        consensus.observe(f"t{i}", 1.0)
+    for i in range(3, 5):
+        consensus.observe_failure(f"t{i}")
+    summary = consensus.summary(participant_count=1)
+
+    assert not summary["consensus_reached"]
+    assert summary["results_reported"] == 3
+    assert summary["results_failed"] == 2
@@ -6,9 +6,10 @@ from unittest.mock import mock_open, patch
 
 import pytest
 import yaml
+from click.testing import CliRunner
 from jinja2 import Template
 
-from agentic_dev_boilerplate.generate_boilerplate import BoilerplateGenerator
+from agentic_dev_boilerplate.generate_boilerplate import BoilerplateGenerator, main
 
 
 @pytest.fixture
@@ -249,3 +250,94 @@ def test_file_writing_error_handling(sample_schema, output_dir):
             generator.create_directory_structure()
     finally:
         output_dir.chmod(0o755)  # Restore permissions for cleanup
+
+
+@pytest.fixture
+def plan_schema(tmp_path):
+    """Schema whose outputs all have templates in the default pack."""
+    repo_schema = Path(__file__).parent.parent / "project-schema.yaml"
+    schema = {
+        "extends": str(repo_schema),
+        "project": {"name": "plan_project"},
+        "agents": [{"role": "tester", "enabled": True}],
+        "workflows": {"fleet_standards": False},
+    }
+    schema_file = tmp_path / "plan_schema.yaml"
+    with open(schema_file, "w") as f:
+        yaml.dump(schema, f)
+    return schema_file
+
+
+def test_plan_writes_nothing(plan_schema, output_dir):
+    """Planning an empty workspace lists creates and leaves the disk untouched."""
+    generator = BoilerplateGenerator(str(plan_schema), str(output_dir))
+
+    plan = generator.plan()
+
+    paths = {output.path for output in plan.outputs}
+    assert ".github/workflows/ci-cd.yml" in paths
+    assert ".github/instructions/tester.instructions.md" in paths
+    assert plan.counts()["create"] == len(plan.outputs)
+    assert list(output_dir.iterdir()) == []
+
+
+def test_plan_after_generate_reports_updates(plan_schema, output_dir):
+    """Edited files show up as updates with a unified diff."""
+    generator = BoilerplateGenerator(str(plan_schema), str(output_dir))
+    generator.generate()
+    readme = output_dir / "README.md"
+    readme.write_text(readme.read_text() + "local edit\n")
+
+    plan = generator.plan()
+
+    counts = plan.counts()
+    assert counts["create"] == 0
+    assert counts["update"] == 1
+    updated = next(o for o in plan.outputs if o.action == "update")
+    assert updated.path == "README.md"
+    assert "-local edit" in updated.diff
+    assert "1 to update" in plan.format()
+
+
+def test_generate_after_plan_reuses_render_cache(plan_schema, output_dir):
+    """A real run after a plan renders nothing new."""
+    generator = BoilerplateGenerator(str(plan_schema), str(output_dir))
+    generator.plan()
+    misses = generator.render_stats["misses"]
+
+    generator.generate()
+
+    assert generator.render_stats["misses"] == misses
+    assert generator.render_stats["hits"] >= misses
+    assert (output_dir / "README.md").exists()
+
+
+def test_cli_run_after_plan_skips_rendering(
+    plan_schema, output_dir, tmp_path, monkeypatch
+):
+    """Renders from ``--plan`` persist, so the following real run reuses them."""
+    cache_dir = tmp_path / "render-cache"
+    monkeypatch.setattr(
+        BoilerplateGenerator,
+        "_default_render_cache_dir",
+        staticmethod(lambda: cache_dir),
+    )
+    args = ["--schema", str(plan_schema), "--output", str(output_dir)]
+    runner = CliRunner()
+
+    planned = runner.invoke(main, [*args, "--plan"])
+    assert planned.exit_code == 0, planned.output
+    assert any(cache_dir.iterdir())
+
+    renders = []
+    render = Template.render
+    monkeypatch.setattr(
+        Template,
+        "render",
+        lambda self, *a, **kw: renders.append(self.name) or render(self, *a, **kw),
+    )
+    generated = runner.invoke(main, args)
+
+    assert generated.exit_code == 0, generated.output
+    assert renders == []
+    assert (output_dir / "README.md").exists()
@@ -0,0 +1,146 @@
+"""Tests for hedging module and hedged task execution."""
+
+import asyncio
+
+import pytest
+
+from agentic_dev_boilerplate.hedging import HedgePolicy, Hedger
+from agentic_dev_boilerplate.multi_agent_solver import (
+    AgentCoordinator,
+    AgentRole,
+    Task,
+)
+
+
+def trained(samples=20, seconds=0.01, **policy):
+    hedger = Hedger(HedgePolicy(min_samples=samples, **policy))
+    for _ in range(samples):
+        hedger.observe("tester", seconds)
+    return hedger
+
+
+def attempts(*durations, fail=()):
+    """Attempt factory whose n-th call sleeps ``durations[n]`` seconds."""
+    calls = []
+
+    async def attempt():
+        index = len(calls)
+        calls.append(index)
+        await asyncio.sleep(durations[index])
+        if index in fail:
+            raise RuntimeError(f"attempt {index} failed")
+        return index
+
+    return attempt, calls
+
+
+def test_delay_is_learned_percentile():
+    hedger = Hedger(HedgePolicy(percentile=90, min_samples=10))
+    for i in range(1, 10):
+        hedger.observe("tester", i / 100)
+    assert hedger.delay("tester") is None
+
+    hedger.observe("tester", 0.10)
+
+    assert hedger.delay("tester") == pytest.approx(0.09)
+    assert hedger.delay("debugger") is None
+
+
+def test_straggler_is_hedged_and_hedge_wins():
+    hedger = trained(max_ratio=1.0)
+    attempt, calls = attempts(5.0, 0.01)
+
+    result = asyncio.run(hedger.run("tester", attempt))
+
+    assert result == 1
+    assert len(calls) == 2
+    assert hedger.stats()["hedges"] == 1
+    assert hedger.stats()["win_rate"] == 1.0
+    # The hedge's duration and the cancelled primary's lower bound.
+    samples = list(hedger._durations["tester"])[20:]
+    assert len(samples) == 2
+    assert max(samples) >= 0.02
+
+
+def test_primary_can_still_win():
+    hedger = trained(max_ratio=1.0)
+    attempt, calls = attempts(0.05, 5.0)
+
+    assert asyncio.run(hedger.run("tester", attempt)) == 0
+    assert hedger.stats()["hedge_wins"] == 0
+
+
+def test_failed_attempt_falls_back_to_the_other():
+    hedger = trained(max_ratio=1.0)
+    attempt, _ = attempts(0.05, 0.01, fail=(1,))
+
+    assert asyncio.run(hedger.run("tester", attempt)) == 0
+
+
+def test_fast_attempts_are_not_hedged():
+    hedger = trained(seconds=1.0, max_ratio=1.0)
+    attempt, calls = attempts(0.01)
+
+    asyncio.run(hedger.run("tester", attempt))
+
+    assert len(calls) == 1
+    assert hedger.stats()["hedge_rate"] == 0.0
+
+
+def test_budget_caps_hedges():
+    # Enough samples that the hedged attempts do not move the percentile.
+    hedger = trained(samples=200, max_ratio=0.5)
+
+    async def main():
+        results = []
+        for _ in range(4):
+            attempt, _ = attempts(0.05, 0.05)
+            results.append(await hedger.run("tester", attempt))
+        return results
+
+    asyncio.run(main())
+
+    stats = hedger.stats()
+    assert stats["hedges"] == 2
+    assert stats["budget_denied"] == 2
+    assert stats["hedge_rate"] == 0.5
+
+
+@pytest.mark.parametrize(
+    "policy", [{"percentile": 100}, {"min_samples": 0}, {"max_ratio": -1}]
+)
+def test_policy_validation(policy):
+    with pytest.raises(ValueError):
+        HedgePolicy(**policy)
+
+
+def test_coordinator_hedges_stragglers(tmp_path):
+    coordinator = AgentCoordinator(
+        tmp_path, hedge_policy=HedgePolicy(min_samples=5, max_ratio=0.5)
+    )
+    session_id = coordinator.create_session("problem", [AgentRole.TESTER])
+    session = coordinator.active_sessions[session_id]
+    session.tasks = [
+        Task(task_id=f"t{i}", description="t", assigned_agent=AgentRole.TESTER)
+        for i in range(10)
+    ]
+    attempts_by_task = {}
+
+    async def execute(task):
+        attempt = attempts_by_task[task.task_id] = (
+            attempts_by_task.get(task.task_id, 0) + 1
+        )
+        # The last task straggles on its first attempt only.
+        slow = task.task_id == "t9" and attempt == 1
+        await asyncio.sleep(10 if slow else 0.001)
+        return {"confidence": 0.9, "attempt": attempt}
+
+    coordinator._execute_agent_task_async = execute
+    for _ in range(5):
+        coordinator.hedger.observe(AgentRole.TESTER, 0.1)
+
+    result = coordinator.execute_session(session_id)
+
+    assert result["results"]["t9"]["attempt"] == 2
+    assert result["hedging"]["hedges"] == 1
+    assert result["hedging"]["hedge_wins"] == 1
@@ -0,0 +1,55 @@
+"""Tests for ids module."""
+
+import os
+import threading
+import time
+
+from agentic_dev_boilerplate.ids import new_id, parse_id
+
+
+def test_ids_unique_and_sorted_in_tight_loop():
+    """IDs minted within the same millisecond stay unique and ordered."""
+    ids = [new_id("msg") for _ in range(100_000)]
+
+    assert len(set(ids)) == len(ids)
+    assert ids == sorted(ids)
+    assert all(i.startswith("msg_") for i in ids[:10])
+
+
+def test_ids_unique_across_threads():
+    results = [[] for _ in range(8)]
+
+    def mint(bucket):
+        bucket.extend(new_id() for _ in range(20_000))
+
+    threads = [threading.Thread(target=mint, args=(b,)) for b in results]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    minted = [i for bucket in results for i in bucket]
+    assert len(set(minted)) == len(minted)
+
+
+def test_parse_round_trip():
+    before = time.time()
+    timestamp, node, counter = parse_id(new_id("session"))
+
+    assert before - 0.001 <= timestamp <= time.time()
+    assert len(node) == 5
+    assert counter >= 0
+
+
+def test_forked_child_uses_new_node():
+    """A forked child must not repeat the parent's node id."""
+    read, write = os.pipe()
+    parent_node = parse_id(new_id())[1]
+    pid = os.fork()
+    if pid == 0:
+        os.write(write, parse_id(new_id())[1].encode())
+        os._exit(0)
+    os.waitpid(pid, 0)
+    child_node = os.read(read, 16).decode()
+
+    assert child_node != parent_node
@@ -0,0 +1,152 @@
+"""Tests for loadtest module."""
+
+import asyncio
+import random
+import statistics
+
+import pytest
+
+from agentic_dev_boilerplate.backends import TaskPayload
+from agentic_dev_boilerplate.loadtest import (
+    BIMODAL,
+    CHAIN,
+    DIAMOND,
+    INDEPENDENT,
+    LAYERED,
+    SHAPES,
+    LatencyDistribution,
+    LoadTestConfig,
+    SyntheticBackend,
+    SyntheticFailure,
+    build_tasks,
+    percentile,
+    run_load_test,
+)
+from agentic_dev_boilerplate.multi_agent_solver import AgentRole
+from agentic_dev_boilerplate.scheduler import TaskGraph
+
+ROLES = [AgentRole.TESTER, AgentRole.DEBUGGER]
+
+
+@pytest.mark.parametrize(
+    "spec,expected",
+    [
+        ("constant:0.5", ("constant", 0.5, 0.5)),
+        ("lognormal:0.01", ("lognormal", 0.01, 0.5)),
+        ("lognormal:0.01:1", ("lognormal", 0.01, 1.0)),
+        ("bimodal:0.01:0.2:10", ("bimodal", 0.01, 0.5)),
+    ],
+)
+def test_parse_latency_distribution(spec, expected):
+    latency = LatencyDistribution.parse(spec)
+    assert (latency.kind, latency.median, latency.sigma) == expected
+
+
+@pytest.mark.parametrize(
+    "spec", ["", "lognormal", "uniform:1", "constant:1:2", "bimodal:0.1:2"]
+)
+def test_parse_rejects_invalid_distributions(spec):
+    with pytest.raises(ValueError):
+        LatencyDistribution.parse(spec)
+
+
+def test_lognormal_median_and_bimodal_slow_mode():
+    rng = random.Random(0)
+    lognormal = LatencyDistribution(median=0.01, sigma=0.5)
+    samples = [lognormal.sample(rng) for _ in range(5000)]
+    assert statistics.median(samples) == pytest.approx(0.01, rel=0.1)
+
+    bimodal = LatencyDistribution(BIMODAL, 0.01, 0.1, 0.2, 100.0)
+    samples = [bimodal.sample(rng) for _ in range(5000)]
+    slow = sum(s > 0.1 for s in samples) / len(samples)
+    assert slow == pytest.approx(0.2, abs=0.03)
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+@pytest.mark.parametrize("size", [1, 2, 9, 20])
+def test_build_tasks_produces_valid_dags(shape, size):
+    tasks = build_tasks(shape, size, ROLES, random.Random(0))
+
+    assert len(TaskGraph(tasks).order) == size
+    assert [t.assigned_agent for t in tasks[:2]] == ROLES[: min(size, 2)]
+
+
+def test_build_tasks_shapes():
+    rng = random.Random(0)
+    assert all(not t.dependencies for t in build_tasks(INDEPENDENT, 5, ROLES, rng))
+    chain = build_tasks(CHAIN, 4, ROLES, rng)
+    assert [t.dependencies for t in chain] == [[], ["t0"], ["t1"], ["t2"]]
+    diamond = build_tasks(DIAMOND, 5, ROLES, rng)
+    assert diamond[-1].dependencies == ["t1", "t2", "t3"]
+    layered = build_tasks(LAYERED, 9, ROLES, rng)
+    assert all(set(t.dependencies) <= {"t3", "t4", "t5"} for t in layered[6:])
+
+
+def test_synthetic_backend_fails_at_the_configured_rate():
+    backend = SyntheticBackend(
+        LatencyDistribution.parse("constant:0"), failure_rate=0.3, seed=1
+    )
+
+    async def scenario():
+        futures = [
+            backend.submit(TaskPayload(str(i), "work", "tester")) for i in range(1000)
+        ]
+        return await asyncio.gather(*futures, return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    failures = [r for r in results if isinstance(r, SyntheticFailure)]
+    assert len(failures) == backend.failed
+    assert backend.failed / backend.submitted == pytest.approx(0.3, abs=0.05)
+
+
+def test_percentile_is_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert [percentile(values, p) for p in (50, 95, 99, 100)] == [50, 95, 99, 100]
+    assert percentile([], 50) == 0.0
+
+
+def test_run_load_test_reports_throughput_and_latency(tmp_path):
+    report = run_load_test(
+        LoadTestConfig(
+            sessions=30,
+            concurrency=8,
+            tasks_per_session=5,
+            shape=DIAMOND,
+            latency=LatencyDistribution.parse("constant:0.001"),
+            agents=ROLES,
+            trace_memory=True,
+        ),
+        workspace=tmp_path,
+    )
+
+    assert report.tasks == 150
+    assert report.failed_tasks == 0
+    assert report.sessions_per_second > 0
+    assert 0 < report.latency_p50 <= report.latency_p95 <= report.latency_p99
+    assert report.latency_p99 <= report.latency_max
+    assert report.peak_traced_mb > 0
+
+
+def test_run_load_test_counts_failures(tmp_path):
+    report = run_load_test(
+        LoadTestConfig(
+            sessions=10,
+            concurrency=4,
+            tasks_per_session=3,
+            shape=INDEPENDENT,
+            latency=LatencyDistribution.parse("constant:0"),
+            failure_rate=1.0,
+            agents=ROLES,
+        ),
+        workspace=tmp_path,
+    )
+
+    assert report.failed_tasks == 30
+    assert report.sessions_with_errors == 10
+
+
+def test_invalid_config_rejected():
+    with pytest.raises(ValueError):
+        LoadTestConfig(shape="star")
+    with pytest.raises(ValueError):
+        LoadTestConfig(failure_rate=2.0)
@@ -0,0 +1,113 @@
+"""Tests for message_bus module."""
+
+import asyncio
+
+import pytest
+
+from agentic_dev_boilerplate.message_bus import MessageBus
+from agentic_dev_boilerplate.multi_agent_solver import (
+    AgentCoordinator,
+    AgentMessage,
+    AgentRole,
+    MessageType,
+)
+
+PLANNER, TESTER, DEBUGGER = AgentRole.PLANNER, AgentRole.TESTER, AgentRole.DEBUGGER
+
+
+def message(sender=PLANNER, recipient=TESTER, session_id=None, **content):
+    return AgentMessage(
+        sender, recipient, MessageType.TASK_ASSIGNMENT, content, session_id=session_id
+    )
+
+
+@pytest.fixture
+def bus():
+    bus = MessageBus()
+    bus.register_session("s1", [PLANNER, TESTER])
+    bus.register_session("s2", [PLANNER, TESTER, DEBUGGER])
+    return bus
+
+
+def test_inboxes_are_per_session_and_recipient(bus):
+    """Messages land only in their own (session, recipient) queue."""
+    for session_id, role in (("s1", TESTER), ("s2", TESTER), ("s2", DEBUGGER)):
+        bus.inbox(session_id, role)
+    bus.deliver(message(session_id="s1", n=1))
+    bus.deliver(message(session_id="s2", n=2))
+    bus.deliver(message(TESTER, DEBUGGER, session_id="s2", n=3))
+
+    assert bus.pending("s1", TESTER) == 1
+    assert bus.pending("s2", TESTER) == 1
+    assert bus.pending("s2", DEBUGGER) == 1
+    assert bus.pending("s1", PLANNER) == 0
+
+
+def test_messages_are_not_queued_without_a_receiver(bus):
+    """Until a role opens its inbox, the session's log is the only copy."""
+    bus.deliver(message(session_id="s1", n=1))
+    assert bus.pending("s1", TESTER) == 0
+
+    bus.inbox("s1", TESTER)
+    bus.deliver(message(session_id="s1", n=2))
+    assert bus.pending("s1", TESTER) == 1
+
+
+def test_route_by_roles(bus):
+    """Implicit routing needs exactly one session with both roles."""
+    assert bus.route(TESTER, DEBUGGER) == "s2"
+    assert bus.route(DEBUGGER, AgentRole.DEPLOYER) is None
+    with pytest.raises(ValueError, match="matches 2 sessions"):
+        bus.route(PLANNER, TESTER)
+
+    bus.unregister_session("s2")
+
+    assert bus.route(PLANNER, TESTER) == "s1"
+
+
+def test_non_participant_rejected(bus):
+    with pytest.raises(ValueError, match="not a participant"):
+        bus.deliver(message(PLANNER, DEBUGGER, session_id="s1"))
+
+
+def test_coordinator_delivers_to_awaiting_agent(tmp_path):
+    """An agent awaiting its inbox wakes up when a message is sent."""
+    coordinator = AgentCoordinator(tmp_path)
+    session_id = coordinator.create_session("problem", [PLANNER, TESTER])
+
+    async def scenario():
+        receiver = asyncio.ensure_future(
+            coordinator.receive_message(session_id, TESTER)
+        )
+        await asyncio.sleep(0)
+        coordinator.send_message(message(step="write tests"))
+        return await asyncio.wait_for(receiver, 1)
+
+    received = asyncio.run(scenario())
+
+    assert received.content == {"step": "write tests"}
+    assert received.session_id == session_id
+    assert coordinator.active_sessions[session_id].messages == [received]
+
+
+def test_coordinator_rejects_unknown_session(tmp_path):
+    coordinator = AgentCoordinator(tmp_path)
+
+    with pytest.raises(ValueError, match="not found"):
+        coordinator.send_message(message(session_id="session_missing"))
+
+
+def test_finished_sessions_leave_role_routing(tmp_path):
+    """Sessions with the same roles run one after another route by role."""
+    coordinator = AgentCoordinator(tmp_path)
+    first = coordinator.create_session("first", [PLANNER, TESTER])
+    coordinator.execute_session(first)
+    second = coordinator.create_session("second", [PLANNER, TESTER])
+
+    assert coordinator._find_session_for_agents(PLANNER, TESTER).session_id == second
+    coordinator.send_message(message(step="second"))
+    coordinator.execute_session(second)
+    coordinator.send_message(message(step="after"))
+
+    assert len(coordinator.active_sessions[first].messages) == 0
+    assert len(coordinator.active_sessions[second].messages) == 1
@@ -0,0 +1,93 @@
+"""Tests for message_log module."""
+
+import pytest
+
+from agentic_dev_boilerplate import message_log
+from agentic_dev_boilerplate.message_log import MessageLog
+from agentic_dev_boilerplate.multi_agent_solver import (
+    AgentCoordinator,
+    AgentMessage,
+    AgentRole,
+    MessageType,
+    MultiAgentSession,
+    Task,
+)
+
+
+def make_messages(count):
+    return [
+        AgentMessage(
+            AgentRole.PLANNER if i % 2 else AgentRole.TESTER,
+            AgentRole.DEBUGGER,
+            MessageType.STATUS_UPDATE,
+            {"step": i, "notes": ["a", "b"]},
+            session_id="session_1",
+        )
+        for i in range(count)
+    ]
+
+
+def test_round_trip_preserves_messages():
+    """Entries read back equal the appended messages."""
+    messages = make_messages(10)
+    log = MessageLog(AgentMessage, messages)
+
+    assert len(log) == 10
+    assert log == messages
+    assert log[-1] == messages[-1]
+    assert log[2:4] == messages[2:4]
+    with pytest.raises(IndexError):
+        log[10]
+
+
+def test_large_history_spills_to_disk(monkeypatch, tmp_path):
+    """Past the threshold, payloads leave memory for a temporary file."""
+    monkeypatch.setattr(message_log, "SPILL_THRESHOLD", 1024)
+    messages = make_messages(200)
+    log = MessageLog(AgentMessage, spill_dir=tmp_path)
+
+    log.extend(messages[:5])
+    assert not log.spilled
+    log.extend(messages[5:])
+
+    assert log.spilled
+    assert log.nbytes() == 200 * 23  # 3 codes + timestamp + offset + length
+    assert log[0] == messages[0]
+    assert list(log) == messages
+
+
+def test_closing_a_session_closes_its_spill_file(monkeypatch, tmp_path):
+    """Spilled history is released with the session, not with the process."""
+    monkeypatch.setattr(message_log, "SPILL_THRESHOLD", 1024)
+    coordinator = AgentCoordinator(tmp_path)
+    session_id = coordinator.create_session(
+        "p", [AgentRole.PLANNER, AgentRole.TESTER, AgentRole.DEBUGGER]
+    )
+    coordinator.execute_session(session_id)
+    log = coordinator.active_sessions[session_id].messages
+    for message in make_messages(200):
+        message.session_id = session_id
+        coordinator.send_message(message)
+    spill_file = log._file
+    assert log.spilled
+
+    coordinator.close_session(session_id)
+
+    assert spill_file.closed
+    assert session_id not in coordinator.active_sessions
+    with pytest.raises(ValueError, match="closed"):
+        log[0]
+
+
+def test_session_messages_are_a_log():
+    """Sessions keep history in a MessageLog, also when given a list."""
+    session = MultiAgentSession("s", "p", [AgentRole.TESTER], messages=make_messages(3))
+
+    assert isinstance(session.messages, MessageLog)
+    assert len(session.messages) == 3
+
+
+@pytest.mark.parametrize("cls", [AgentMessage, Task, MultiAgentSession])
+def test_records_are_slotted(cls):
+    assert "__slots__" in cls.__dict__
+    assert "__dict__" not in dir(cls)
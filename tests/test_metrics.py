@@ -0,0 +1,197 @@
+"""Tests for metrics module and coordinator instrumentation."""
+
+import sys
+import threading
+import urllib.request
+
+import pytest
+
+from agentic_dev_boilerplate.metrics import (
+    CONTENT_TYPE,
+    FileExporter,
+    HttpExporter,
+    MetricsRegistry,
+)
+from agentic_dev_boilerplate.multi_agent_solver import (
+    AgentCoordinator,
+    AgentMessage,
+    AgentRole,
+    MessageType,
+    Task,
+    main,
+)
+
+
+def samples(text):
+    """Map of sample name (with labels) to value, skipping metadata lines."""
+    return dict(
+        line.rsplit(" ", 1) for line in text.splitlines() if not line.startswith("#")
+    )
+
+
+def test_counter_exposition():
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs", "Jobs run", ["kind"])
+    counter.labels("a").inc()
+    counter.labels("a").inc(2)
+    counter.labels('quote"d').inc()
+
+    text = registry.render()
+
+    assert text.startswith("# TYPE jobs counter\n# HELP jobs Jobs run\n")
+    assert text.endswith("# EOF\n")
+    assert samples(text) == {
+        'jobs_total{kind="a"}': "3",
+        'jobs_total{kind="quote\\"d"}': "1",
+    }
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    histogram = registry.histogram(
+        "wait_seconds", "Wait", buckets=[0.1, 1.0], unit="seconds"
+    )
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+
+    text = registry.render()
+
+    assert "# UNIT wait_seconds seconds" in text
+    assert samples(text) == {
+        'wait_seconds_bucket{le="0.1"}': "2",
+        'wait_seconds_bucket{le="1.0"}': "3",
+        'wait_seconds_bucket{le="+Inf"}': "4",
+        "wait_seconds_count": "4",
+        "wait_seconds_sum": "3.65",
+    }
+
+
+def test_registration_is_idempotent_but_checked():
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs", "Jobs run", ["kind"])
+
+    assert registry.counter("jobs", "Jobs run", ["kind"]) is counter
+    with pytest.raises(ValueError):
+        registry.histogram("jobs", "Jobs run", ["kind"])
+    with pytest.raises(ValueError):
+        counter.labels("a", "b")
+    with pytest.raises(ValueError):
+        counter.labels("a").inc(-1)
+
+
+def test_concurrent_increments_are_not_lost():
+    counter = MetricsRegistry().counter("hits", "Hits")
+
+    def hammer():
+        for _ in range(10000):
+            counter.inc()
+
+    threads = [threading.Thread(target=hammer) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counter.value() == 40000
+
+
+def test_file_exporter_writes_final_snapshot(tmp_path):
+    registry = MetricsRegistry()
+    counter = registry.counter("hits", "Hits")
+    path = tmp_path / "out" / "metrics.prom"
+    exporter = FileExporter(registry, path, interval=60).start()
+
+    counter.inc()
+    exporter.stop()
+
+    assert samples(path.read_text()) == {"hits_total": "1"}
+    assert list(path.parent.iterdir()) == [path]
+
+
+def test_http_exporter_serves_metrics():
+    registry = MetricsRegistry()
+    registry.counter("hits", "Hits").inc()
+    exporter = HttpExporter(registry).start()
+    try:
+        with urllib.request.urlopen(exporter.url, timeout=5) as response:
+            body = response.read().decode()
+            content_type = response.headers["Content-Type"]
+    finally:
+        exporter.stop()
+
+    assert content_type == CONTENT_TYPE
+    assert samples(body) == {"hits_total": "1"}
+
+
+def test_cli_reports_metrics_port_in_use(tmp_path, monkeypatch, capsys):
+    """A busy port is a usage error, and exporters already started stop."""
+    busy = HttpExporter(MetricsRegistry()).start()
+    metrics_file = tmp_path / "metrics.prom"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "multi_agent_solver",
+            f"--workspace={tmp_path}",
+            "--problem=p",
+            f"--metrics-file={metrics_file}",
+            f"--metrics-port={busy.port}",
+        ],
+    )
+    try:
+        with pytest.raises(SystemExit) as exit_info:
+            main()
+    finally:
+        busy.stop()
+
+    assert exit_info.value.code == 2
+    assert f"--metrics-port {busy.port}" in capsys.readouterr().err
+    assert metrics_file.read_text().endswith("# EOF\n")
+
+
+def test_coordinator_records_sessions_tasks_and_messages(tmp_path):
+    coordinator = AgentCoordinator(tmp_path)
+    session_id = coordinator.create_session(
+        "problem", [AgentRole.TESTER, AgentRole.DEBUGGER]
+    )
+    coordinator.active_sessions[session_id].tasks = [
+        Task(task_id="a", description="a", assigned_agent=AgentRole.TESTER),
+        Task(task_id="b", description="b", assigned_agent=AgentRole.DEBUGGER),
+    ]
+    coordinator.send_message(
+        AgentMessage(
+            sender=AgentRole.TESTER,
+            recipient=AgentRole.DEBUGGER,
+            message_type=MessageType.STATUS_UPDATE,
+            content={},
+            session_id=session_id,
+        )
+    )
+
+    async def flaky(task):
+        if task.task_id == "b":
+            raise RuntimeError("boom")
+        return {"confidence": 0.9}
+
+    coordinator._execute_agent_task_async = flaky
+    coordinator.execute_session(session_id)
+
+    result = samples(coordinator.metrics.render())
+    assert result["agentic_sessions_created_total"] == "1"
+    assert result['agentic_sessions_completed_total{outcome="no_consensus"}'] == "1"
+    assert result['agentic_tasks_total{role="tester",status="completed"}'] == "1"
+    assert result['agentic_tasks_total{role="debugger",status="failed"}'] == "1"
+    assert result['agentic_task_latency_seconds_count{role="debugger"}'] == "1"
+    assert result['agentic_queue_wait_seconds_count{role="tester"}'] == "1"
+    assert result["agentic_consensus_latency_seconds_count"] == "1"
+    assert result['agentic_messages_sent_total{type="status_update"}'] == "1"
+
+
+def test_coordinators_can_share_a_registry(tmp_path):
+    registry = MetricsRegistry()
+    for _ in range(2):
+        AgentCoordinator(tmp_path, metrics=registry).create_session(
+            "problem", [AgentRole.TESTER]
+        )
+
+    assert registry.get("agentic_sessions_created").value() == 2
@@ -0,0 +1,302 @@
+"""Tests for multi_agent_solver module."""
+
+import asyncio
+import time
+
+import pytest
+
+from agentic_dev_boilerplate.multi_agent_solver import (
+    AgentCoordinator,
+    AgentRole,
+    Task,
+    TaskStatus,
+)
+from agentic_dev_boilerplate.role_pools import RoleLimit
+from agentic_dev_boilerplate.scheduler import TaskGraph
+
+
+@pytest.fixture
+def coordinator(tmp_path):
+    """Coordinator over an empty workspace."""
+    return AgentCoordinator(tmp_path)
+
+
+def make_session(coordinator, edges, agent=AgentRole.TESTER):
+    """Session whose tasks are given as ``{task_id: [dependencies]}``."""
+    session_id = coordinator.create_session("problem", [agent])
+    coordinator.active_sessions[session_id].tasks = [
+        Task(
+            task_id=task_id,
+            description=task_id,
+            assigned_agent=agent,
+            dependencies=deps,
+        )
+        for task_id, deps in edges.items()
+    ]
+    return session_id
+
+
+def fan_out(width):
+    edges = {"root": []}
+    edges.update({f"leaf_{i}": ["root"] for i in range(width)})
+    edges["sink"] = [f"leaf_{i}" for i in range(width)]
+    return edges
+
+
+def test_fan_out_runs_on_critical_path(coordinator):
+    """100 independent tasks take about as long as one, not 100 of them."""
+    session_id = make_session(coordinator, fan_out(100))
+
+    start = time.perf_counter()
+    result = asyncio.run(coordinator.execute_session_async(session_id))
+    elapsed = time.perf_counter() - start
+
+    # Critical path is root -> leaf -> sink (3 x 0.1s); sequential is 10.2s.
+    assert elapsed < 1.0
+    assert len(result["results"]) == 102
+    assert list(result["results"])[0] == "root"
+    assert result["consensus"]["consensus_reached"]
+
+
+def test_dependencies_finish_before_dependents(coordinator):
+    """A task starts only after every dependency has completed."""
+    session_id = make_session(coordinator, {"a": [], "b": ["a"], "c": ["a", "b"]})
+
+    result = coordinator.execute_session(session_id)
+
+    done = {tid: r["timestamp"] for tid, r in result["results"].items()}
+    assert done["a"] < done["b"] < done["c"]
+    tasks = coordinator.active_sessions[session_id].tasks
+    assert all(task.status == TaskStatus.COMPLETED for task in tasks)
+
+
+def test_failed_task_blocks_dependents(coordinator, monkeypatch):
+    """A failure marks the task FAILED and its dependents BLOCKED."""
+    session_id = make_session(coordinator, {"a": [], "b": ["a"], "c": ["b"]})
+
+    async def explode(task):
+        raise RuntimeError("agent crashed")
+
+    monkeypatch.setattr(coordinator, "_execute_agent_task_async", explode)
+
+    result = coordinator.execute_session(session_id)
+
+    assert result["errors"] == {"a": "RuntimeError: agent crashed"}
+    assert result["results"] == {}
+    statuses = [t.status for t in coordinator.active_sessions[session_id].tasks]
+    assert statuses == [TaskStatus.FAILED, TaskStatus.BLOCKED, TaskStatus.BLOCKED]
+
+
+@pytest.mark.parametrize(
+    "edges,message",
+    [
+        ({"a": ["missing"]}, "unknown task"),
+        ({"a": ["b"], "b": ["a"]}, "cycle"),
+    ],
+)
+def test_invalid_graphs_rejected(edges, message):
+    tasks = [
+        Task(task_id=t, description=t, assigned_agent=AgentRole.TESTER, dependencies=d)
+        for t, d in edges.items()
+    ]
+    with pytest.raises(ValueError, match=message):
+        TaskGraph(tasks)
+
+
+def test_role_limits_cap_one_role_only(tmp_path):
+    """A capped role queues while other roles keep flowing."""
+    coordinator = AgentCoordinator(
+        tmp_path, role_limits={AgentRole.TESTER: RoleLimit(max_concurrency=2)}
+    )
+    session_id = coordinator.create_session("problem", [AgentRole.TESTER])
+    coordinator.active_sessions[session_id].tasks = [
+        Task(task_id=f"test_{i}", description="t", assigned_agent=AgentRole.TESTER)
+        for i in range(6)
+    ] + [
+        Task(task_id=f"plan_{i}", description="p", assigned_agent=AgentRole.PLANNER)
+        for i in range(6)
+    ]
+
+    start = time.perf_counter()
+    result = coordinator.execute_session(session_id)
+    elapsed = time.perf_counter() - start
+
+    # Six tester tasks, two at a time: three 0.1s waves.
+    assert 0.3 <= elapsed < 0.6
+    tester = result["role_stats"]["tester"]
+    assert tester["peak_queue_depth"] == 4
+    assert tester["completed"] == 6
+    assert result["role_stats"]["planner"]["peak_queue_depth"] == 0
+
+
+def test_critical_path_lengths():
+    """Each task's value is its estimate plus its longest dependent chain."""
+    tasks = [
+        Task(task_id=t, description=t, assigned_agent=role, dependencies=d)
+        for t, role, d in [
+            ("a", AgentRole.PLANNER, []),
+            ("b", AgentRole.TESTER, ["a"]),
+            ("c", AgentRole.PLANNER, ["a"]),
+            ("d", AgentRole.TESTER, ["b", "c"]),
+        ]
+    ]
+    estimates = {AgentRole.PLANNER: 1.0, AgentRole.TESTER: 3.0}
+
+    lengths = TaskGraph(tasks).critical_path(lambda t: estimates[t.assigned_agent])
+
+    assert lengths == {"a": 7.0, "b": 6.0, "c": 4.0, "d": 3.0}
+
+
+@pytest.mark.parametrize(
+    "policy,expected",
+    [
+        ("fifo", ["short_0", "short_1", "short_2", "chain_0", "chain_1", "chain_2"]),
+        (
+            "critical_path",
+            ["chain_0", "chain_1", "chain_2", "short_0", "short_1", "short_2"],
+        ),
+    ],
+)
+def test_scheduling_policy_orders_contended_tasks(
+    tmp_path, monkeypatch, policy, expected
+):
+    """With one tester slot, critical path runs the long chain first."""
+    coordinator = AgentCoordinator(
+        tmp_path,
+        role_limits={AgentRole.TESTER: RoleLimit(max_concurrency=1)},
+        scheduling_policy=policy,
+    )
+    edges = {f"short_{i}": [] for i in range(3)}
+    edges.update({"chain_0": [], "chain_1": ["chain_0"], "chain_2": ["chain_1"]})
+    session_id = make_session(coordinator, edges)
+    # A planner step after the chain makes every chain task outrank the shorts.
+    coordinator.active_sessions[session_id].tasks.append(
+        Task("report", "report", AgentRole.PLANNER, dependencies=["chain_2"])
+    )
+    started = []
+
+    async def record(task):
+        if task.assigned_agent == AgentRole.TESTER:
+            started.append(task.task_id)
+        await asyncio.sleep(0)
+        return {"confidence": 1.0}
+
+    monkeypatch.setattr(coordinator, "_execute_agent_task_async", record)
+
+    coordinator.execute_session(session_id)
+
+    assert started == expected
+
+
+def test_role_estimates_learn_from_durations(coordinator):
+    """Observed task durations refine the per-role estimate."""
+    session_id = make_session(coordinator, {"a": [], "b": ["a"]})
+
+    coordinator.execute_session(session_id)
+
+    estimate = coordinator.role_estimates[AgentRole.TESTER]
+    assert 0.09 < estimate < 0.2
+
+
+def test_sessions_created_together_do_not_collide(coordinator):
+    """Sessions created in the same millisecond get distinct, ordered ids."""
+    session_ids = [
+        coordinator.create_session("problem", [AgentRole.TESTER]) for _ in range(50)
+    ]
+
+    assert len(coordinator.active_sessions) == 50
+    assert session_ids == sorted(session_ids)
+
+
+def hang_on(coordinator, monkeypatch, hung):
+    """Make tasks in ``hung`` never finish; the rest finish immediately."""
+
+    async def execute(task):
+        if task.task_id in hung:
+            await asyncio.Event().wait()
+        return {"confidence": 1.0}
+
+    monkeypatch.setattr(coordinator, "_execute_agent_task_async", execute)
+
+
+def statuses(coordinator, session_id):
+    return {t.task_id: t.status for t in coordinator.active_sessions[session_id].tasks}
+
+
+def test_task_timeout_fails_only_its_branch(tmp_path, monkeypatch):
+    coordinator = AgentCoordinator(tmp_path, task_timeout=0.1)
+    session_id = make_session(coordinator, {"a": [], "b": ["a"], "c": []})
+    hang_on(coordinator, monkeypatch, {"a"})
+
+    result = coordinator.execute_session(session_id)
+
+    assert list(result["results"]) == ["c"]
+    assert result["interrupted"] is None
+    assert statuses(coordinator, session_id) == {
+        "a": TaskStatus.FAILED,
+        "b": TaskStatus.BLOCKED,
+        "c": TaskStatus.COMPLETED,
+    }
+    # One of three results failed: consensus is out of reach.
+    assert not result["consensus"]["consensus_reached"]
+
+
+def test_session_deadline_returns_partial_results(coordinator, monkeypatch):
+    session_id = make_session(coordinator, {"a": [], "b": [], "c": ["a"]})
+    hang_on(coordinator, monkeypatch, {"a"})
+
+    start = time.perf_counter()
+    result = coordinator.execute_session(session_id, timeout=0.2)
+
+    assert time.perf_counter() - start < 2
+    assert result["interrupted"] == "deadline"
+    assert list(result["results"]) == ["b"]
+    assert statuses(coordinator, session_id) == {
+        "a": TaskStatus.FAILED,
+        "b": TaskStatus.COMPLETED,
+        "c": TaskStatus.BLOCKED,
+    }
+    assert result["consensus"]["average_confidence"] == 1.0
+
+
+def test_cancel_session_interrupts_promptly(coordinator, monkeypatch):
+    session_id = make_session(coordinator, {"a": [], "b": ["a"], "c": []})
+    hang_on(coordinator, monkeypatch, {"a"})
+
+    async def main():
+        execution = asyncio.ensure_future(coordinator.execute_session_async(session_id))
+        await asyncio.sleep(0.05)
+        assert coordinator.cancel_session(session_id)
+        return await asyncio.wait_for(execution, timeout=2)
+
+    result = asyncio.run(main())
+
+    assert result["interrupted"] == "cancelled"
+    assert list(result["results"]) == ["c"]
+    assert statuses(coordinator, session_id)["a"] == TaskStatus.FAILED
+    assert statuses(coordinator, session_id)["b"] == TaskStatus.BLOCKED
+    assert not coordinator.cancel_session(session_id)
+
+
+def test_cancel_session_unblocks_backpressured_submission(tmp_path, monkeypatch):
+    coordinator = AgentCoordinator(
+        tmp_path, role_limits={AgentRole.TESTER: RoleLimit(1, 1)}
+    )
+    session_id = make_session(coordinator, {f"t{i}": [] for i in range(4)})
+    hang_on(coordinator, monkeypatch, {"t0"})
+
+    async def main():
+        execution = asyncio.ensure_future(coordinator.execute_session_async(session_id))
+        await asyncio.sleep(0.05)
+        coordinator.cancel_session(session_id)
+        return await asyncio.wait_for(execution, timeout=2)
+
+    result = asyncio.run(main())
+
+    assert result["results"] == {}
+    assert statuses(coordinator, session_id) == {
+        "t0": TaskStatus.FAILED,
+        "t1": TaskStatus.BLOCKED,
+        "t2": TaskStatus.BLOCKED,
+        "t3": TaskStatus.BLOCKED,
+    }
@@ -0,0 +1,126 @@
+"""Tests for planners module and batched decomposition."""
+
+import threading
+import time
+
+import pytest
+
+from agentic_dev_boilerplate.multi_agent_solver import AgentCoordinator, AgentRole
+from agentic_dev_boilerplate.planners import (
+    CallablePlanner,
+    PlannerBackend,
+    PlanningRequest,
+    TemplatePlanner,
+)
+
+AGENTS = [AgentRole.PLANNER, AgentRole.TESTER]
+
+
+def make_sessions(coordinator, count, agents=AGENTS):
+    return [coordinator.create_session(f"problem {i}", agents) for i in range(count)]
+
+
+def test_template_planner_batches():
+    planner = TemplatePlanner(batch_size=2)
+    requests = [PlanningRequest(f"s{i}", f"p{i}", ("tester",)) for i in range(3)]
+
+    plans = planner.plan(requests)
+
+    assert len(plans) == 3
+    assert plans[2][0] == "Analyze p2 from tester perspective"
+    assert (planner.calls, planner.problems) == (1, 3)
+
+
+def test_planner_must_return_one_plan_per_problem():
+    planner = CallablePlanner(lambda requests: [["only one"]])
+    requests = [PlanningRequest(f"s{i}", "p", ("tester",)) for i in range(2)]
+
+    with pytest.raises(ValueError, match="1 plans for 2 problems"):
+        planner.plan(requests)
+
+
+def test_planner_backend_requires_plan():
+    with pytest.raises(TypeError):
+        PlannerBackend()
+
+
+def test_batch_size_must_be_positive():
+    with pytest.raises(ValueError):
+        TemplatePlanner(batch_size=0)
+
+
+def test_decompose_many_batches_planner_calls(tmp_path):
+    planner = TemplatePlanner(batch_size=32)
+    coordinator = AgentCoordinator(tmp_path, planner=planner)
+    session_ids = make_sessions(coordinator, 70)
+
+    tasks = coordinator.decompose_many(session_ids + session_ids[:5])
+
+    assert list(tasks) == session_ids
+    assert planner.calls == 3
+    assert planner.problems == 70
+    for session_id in session_ids:
+        session = coordinator.active_sessions[session_id]
+        assert session.tasks == tasks[session_id]
+        assert len(session.tasks) == 3
+        assert {task.assigned_agent for task in session.tasks} <= set(AGENTS)
+
+
+def test_decompose_many_respects_each_sessions_agents(tmp_path):
+    coordinator = AgentCoordinator(tmp_path)
+    planners = make_sessions(coordinator, 2, [AgentRole.PLANNER])
+    debuggers = make_sessions(coordinator, 2, [AgentRole.DEBUGGER])
+
+    tasks = coordinator.decompose_many(planners + debuggers)
+
+    for session_id in planners:
+        assert {t.assigned_agent for t in tasks[session_id]} == {AgentRole.PLANNER}
+    for session_id in debuggers:
+        assert {t.assigned_agent for t in tasks[session_id]} == {AgentRole.DEBUGGER}
+
+
+def test_decompose_many_overlaps_planner_calls(tmp_path):
+    lock = threading.Lock()
+    active, peak = [0], [0]
+
+    def slow_plan(requests):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        return [["Test it"] for _ in requests]
+
+    coordinator = AgentCoordinator(
+        tmp_path, planner=CallablePlanner(slow_plan, batch_size=2)
+    )
+    session_ids = make_sessions(coordinator, 12)
+
+    coordinator.decompose_many(session_ids, max_concurrent_batches=3)
+
+    assert 1 < peak[0] <= 3
+
+
+def test_decompose_many_unknown_session(tmp_path):
+    planner = TemplatePlanner()
+    coordinator = AgentCoordinator(tmp_path, planner=planner)
+
+    with pytest.raises(ValueError, match="not found"):
+        coordinator.decompose_many(make_sessions(coordinator, 1) + ["missing"])
+    assert planner.calls == 0
+
+
+def test_decompose_problem_uses_planner(tmp_path):
+    planner = CallablePlanner(lambda requests: [["Fix the bug", "Test the fix"]])
+    coordinator = AgentCoordinator(tmp_path, planner=planner)
+    session_id = coordinator.create_session(
+        "Broken build", [AgentRole.DEBUGGER, AgentRole.TESTER]
+    )
+
+    tasks = coordinator.decompose_problem(session_id)
+
+    assert [task.assigned_agent for task in tasks] == [
+        AgentRole.DEBUGGER,
+        AgentRole.TESTER,
+    ]
@@ -0,0 +1,119 @@
+"""Tests for profiling module."""
+
+import json
+import signal
+import threading
+import time
+import tracemalloc
+
+import pytest
+
+from agentic_dev_boilerplate.profiling import MemoryProfiler, SamplingProfiler
+
+
+@pytest.fixture
+def memory_profiler():
+    """Profiler that always stops tracing after the test."""
+    profiler = MemoryProfiler(top_n=5)
+    profiler.start()
+    yield profiler
+    profiler.stop()
+
+
+def test_phases_record_peak_and_growth(memory_profiler):
+    """Each phase records its peak, growth and top allocation sites."""
+    retained = []
+    with memory_profiler.phase("allocate"):
+        retained.append(bytearray(2_000_000))
+    with memory_profiler.phase("transient"):
+        bytearray(4_000_000)
+
+    allocate, transient = memory_profiler.phases
+    assert allocate["phase"] == "allocate"
+    assert allocate["growth_bytes"] >= 2_000_000
+    assert allocate["top_growth"][0]["size_diff_bytes"] >= 2_000_000
+    assert allocate["top_allocations"][0]["file"] == __file__
+    # The transient buffer is gone by the end of the phase but sets the peak.
+    assert transient["peak_bytes"] - transient["start_bytes"] >= 4_000_000
+    assert transient["growth_bytes"] < 1_000_000
+
+
+def test_report_written_as_json(memory_profiler, tmp_path):
+    """The JSON report carries a per-phase summary and the overall peak."""
+    with memory_profiler.phase("decompose_problem"):
+        [str(i) for i in range(1000)]
+
+    path = memory_profiler.write(tmp_path / "profile" / "mem.json")
+
+    report = json.loads(path.read_text())
+    assert report["summary"][0]["phase"] == "decompose_problem"
+    assert report["peak_bytes"] == report["phases"][0]["peak_bytes"]
+    assert "decompose_problem" in memory_profiler.format_summary()
+
+
+def test_stop_leaves_external_tracing_running():
+    """A profiler does not stop tracing it did not start."""
+    tracemalloc.start()
+    try:
+        profiler = MemoryProfiler()
+        profiler.start()
+        profiler.stop()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def _busy_leaf(seconds):
+    end = time.perf_counter() + seconds
+    x = 0
+    while time.perf_counter() < end:
+        x += 1
+    return x
+
+
+@pytest.mark.parametrize("mode", ["signal", "thread"])
+def test_sampler_emits_collapsed_stacks(mode, tmp_path):
+    """Busy frames appear root-first in ``frame;frame count`` lines."""
+    with SamplingProfiler(rate_hz=200, mode=mode) as sampler:
+        _busy_leaf(0.3)
+
+    assert sampler.samples > 10
+    lines = sampler.collapsed()
+    stack, count = lines[0].rsplit(" ", 1)
+    assert int(count) > 0
+    assert stack.startswith("thread:MainThread;")
+    assert any("_busy_leaf" in line for line in lines)
+
+    path = sampler.write(tmp_path / "out.folded")
+    assert path.read_text().splitlines() == lines
+
+
+def test_signal_sampler_restores_handler():
+    """Stopping the signal sampler disarms the timer and restores SIGALRM."""
+    previous = signal.getsignal(signal.SIGALRM)
+    sampler = SamplingProfiler(rate_hz=100, mode="signal")
+    sampler.start()
+    sampler.stop()
+
+    assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+    assert signal.getsignal(signal.SIGALRM) == previous
+
+
+def test_signal_handler_does_not_enumerate_threads(monkeypatch):
+    """The handler takes no locks; thread names are resolved on stop."""
+    sampler = SamplingProfiler(rate_hz=200, mode="signal")
+    sampler.start()
+    worker = threading.Thread(target=_busy_leaf, args=(0.6,), name="busy-worker")
+    with monkeypatch.context() as patch:
+        patch.setattr(threading, "enumerate", pytest.fail)
+        worker.start()
+        _busy_leaf(0.3)
+    sampler.stop()
+    worker.join()
+
+    assert any(line.startswith("thread:busy-worker;") for line in sampler.collapsed())
+
+
+def test_sampler_rejects_bad_rate():
+    with pytest.raises(ValueError):
+        SamplingProfiler(rate_hz=0)
@@ -0,0 +1,217 @@
+"""Tests for resilience module and retried/rerouted task execution."""
+
+import asyncio
+import random
+
+import pytest
+
+from agentic_dev_boilerplate.multi_agent_solver import (
+    AgentCoordinator,
+    AgentRole,
+    Task,
+    TaskStatus,
+)
+from agentic_dev_boilerplate.resilience import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    BreakerPolicy,
+    CircuitBreaker,
+    RetryPolicy,
+)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_backoff_is_jittered_and_capped():
+    policy = RetryPolicy(max_attempts=10, base_delay=0.1, max_delay=1.0)
+    rng = random.Random(0)
+
+    delays = [policy.backoff(attempt, rng) for attempt in range(1, 10)]
+
+    assert all(0 <= d <= min(1.0, 0.1 * 2 ** (a - 1)) for a, d in enumerate(delays, 1))
+    assert len(set(delays)) == len(delays)
+
+
+def test_should_retry_respects_attempts_and_types():
+    policy = RetryPolicy(max_attempts=2, retry_on=(ConnectionError,))
+
+    assert policy.should_retry(ConnectionError(), 1)
+    assert not policy.should_retry(ConnectionError(), 2)
+    assert not policy.should_retry(ValueError(), 1)
+
+
+@pytest.mark.parametrize(
+    "spec,expected",
+    [("4", (4, 0.1, 5.0)), ("2:0.5", (2, 0.5, 5.0)), ("3:0.2:10", (3, 0.2, 10.0))],
+)
+def test_parse_retry_policy(spec, expected):
+    policy = RetryPolicy.parse(spec)
+    assert (policy.max_attempts, policy.base_delay, policy.max_delay) == expected
+
+
+@pytest.mark.parametrize("spec", ["", "1:2:3:4", "0", "2:10"])
+def test_parse_rejects_invalid_specs(spec):
+    with pytest.raises(ValueError):
+        RetryPolicy.parse(spec)
+
+
+def test_breaker_opens_half_opens_and_closes():
+    clock = Clock()
+    breaker = CircuitBreaker("tester", BreakerPolicy(3, reset_timeout=10), clock)
+
+    for _ in range(3):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+
+    clock.now = 10
+    assert breaker.state == HALF_OPEN
+    assert not breaker.rejecting
+    assert breaker.allow()
+    assert breaker.rejecting
+    assert not breaker.allow()  # one trial at a time
+    breaker.record_success()
+
+    assert breaker.state == CLOSED
+    assert breaker.stats()["trips"] == 1
+
+
+def test_failed_trial_reopens():
+    clock = Clock()
+    breaker = CircuitBreaker("tester", BreakerPolicy(1, reset_timeout=5), clock)
+    breaker.record_failure()
+    clock.now = 5
+    assert breaker.allow()
+
+    breaker.record_failure()
+
+    assert breaker.state == OPEN
+    assert breaker.stats()["trips"] == 2
+
+
+def test_success_resets_consecutive_failures():
+    breaker = CircuitBreaker("tester", BreakerPolicy(2))
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CLOSED
+
+
+def session(coordinator, count, agent=AgentRole.TESTER):
+    session_id = coordinator.create_session("problem", [agent])
+    coordinator.active_sessions[session_id].tasks = [
+        Task(task_id=f"t{i}", description=f"t{i}", assigned_agent=agent)
+        for i in range(count)
+    ]
+    return session_id
+
+
+def test_transient_failures_are_retried(tmp_path):
+    coordinator = AgentCoordinator(
+        tmp_path,
+        retry_policies={AgentRole.TESTER: RetryPolicy(3, base_delay=0.01)},
+    )
+    session_id = session(coordinator, 2)
+    attempts = []
+
+    async def flaky(task):
+        attempts.append(task.task_id)
+        if attempts.count(task.task_id) < 3:
+            raise ConnectionError("backend unavailable")
+        return {"confidence": 0.9}
+
+    coordinator._execute_agent_task_async = flaky
+
+    result = coordinator.execute_session(session_id)
+
+    assert len(result["results"]) == 2
+    assert result["errors"] == {}
+    assert len(attempts) == 6
+
+
+def test_open_breaker_reroutes_to_fallback(tmp_path):
+    coordinator = AgentCoordinator(
+        tmp_path,
+        breaker_policy=BreakerPolicy(failure_threshold=2, reset_timeout=60),
+        fallback_roles={AgentRole.TESTER: AgentRole.DEBUGGER},
+    )
+    calls = []
+
+    async def tester_down(task):
+        calls.append(task.assigned_agent)
+        if task.assigned_agent == AgentRole.TESTER:
+            raise ConnectionError("tester backend down")
+        return {"confidence": 0.9}
+
+    coordinator._execute_agent_task_async = tester_down
+    for _ in range(2):
+        coordinator.execute_session(session(coordinator, 1))
+    assert coordinator.breaker(AgentRole.TESTER).state == OPEN
+
+    result = coordinator.execute_session(session(coordinator, 3))
+
+    assert len(result["results"]) == 3
+    assert calls[2:] == [AgentRole.DEBUGGER] * 3
+    assert result["breakers"]["tester"]["state"] == OPEN
+
+
+def test_half_open_breaker_without_trial_slots_reroutes(tmp_path):
+    coordinator = AgentCoordinator(
+        tmp_path, fallback_roles={AgentRole.TESTER: AgentRole.DEBUGGER}
+    )
+    clock = Clock()
+    breaker = CircuitBreaker("tester", BreakerPolicy(1, reset_timeout=5), clock)
+    breaker.record_failure()
+    clock.now = 5
+    coordinator.breaker_policy = breaker.policy
+    coordinator._breakers[AgentRole.TESTER] = breaker
+    calls = []
+
+    async def slow_trial(task):
+        calls.append(task.assigned_agent)
+        if task.assigned_agent == AgentRole.TESTER:
+            await asyncio.sleep(0.05)
+        return {"confidence": 0.9}
+
+    coordinator._execute_agent_task_async = slow_trial
+    session_id = session(coordinator, 3)
+
+    result = coordinator.execute_session(session_id)
+
+    assert result["errors"] == {}
+    assert len(result["results"]) == 3
+    assert calls.count(AgentRole.TESTER) == 1
+    assert calls.count(AgentRole.DEBUGGER) == 2
+    assert breaker.state == CLOSED
+
+
+def test_open_breaker_without_fallback_blocks_immediately(tmp_path):
+    coordinator = AgentCoordinator(
+        tmp_path, breaker_policy=BreakerPolicy(failure_threshold=1)
+    )
+    calls = []
+
+    async def down(task):
+        calls.append(task.task_id)
+        raise ConnectionError("backend down")
+
+    coordinator._execute_agent_task_async = down
+    coordinator.execute_session(session(coordinator, 1))
+
+    session_id = session(coordinator, 3)
+    result = coordinator.execute_session(session_id)
+
+    assert calls == ["t0"]
+    tasks = coordinator.active_sessions[session_id].tasks
+    assert all(task.status == TaskStatus.BLOCKED for task in tasks)
+    assert "Circuit open for tester" in result["errors"]["t0"]
+    assert not result["consensus"]["consensus_reached"]
@@ -0,0 +1,134 @@
+"""Tests for result_cache module and cached task execution."""
+
+import pytest
+
+from agentic_dev_boilerplate.multi_agent_solver import AgentCoordinator, AgentRole, Task
+from agentic_dev_boilerplate.result_cache import ResultCache, cache_key
+from agentic_dev_boilerplate.session_store import SQLiteSessionStore
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+def test_key_normalises_description():
+    assert cache_key("tester", "Validate  solution components.") == cache_key(
+        "tester", "validate solution components"
+    )
+    assert cache_key("tester", "x") != cache_key("debugger", "x")
+    assert cache_key("tester", "x", {"revision": "a"}) != cache_key(
+        "tester", "x", {"revision": "b"}
+    )
+
+
+def test_memory_tier_is_lru(clock):
+    cache = ResultCache(max_entries=2, clock=clock)
+    cache.put("a", {"v": 1})
+    cache.put("b", {"v": 2})
+    cache.get("a")
+    cache.put("c", {"v": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"v": 1}
+    assert cache.stats()["evictions"] == 1
+
+
+def test_entries_expire(clock):
+    cache = ResultCache(ttl=10, clock=clock)
+    cache.put("a", {"v": 1})
+
+    clock.now += 9
+    assert cache.get("a") == {"v": 1}
+    clock.now += 2
+    assert cache.get("a") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_disk_tier_survives_restart(tmp_path, clock):
+    ResultCache(disk_dir=tmp_path, clock=clock).put("a", {"v": 1})
+
+    reopened = ResultCache(disk_dir=tmp_path, clock=clock)
+
+    assert reopened.get("a") == {"v": 1}
+    clock.now += 2 * reopened.ttl
+    assert ResultCache(disk_dir=tmp_path, clock=clock).get("a") is None
+    assert not list(tmp_path.iterdir())
+
+
+def test_disk_tier_is_size_bounded(tmp_path, clock):
+    cache = ResultCache(disk_dir=tmp_path, max_disk_bytes=200, clock=clock)
+    for i in range(5):
+        cache.put(f"k{i}", {"payload": "x" * 50})
+
+    assert cache.disk_bytes <= 200
+    assert len(list(tmp_path.glob("*.json"))) == cache.stats()["disk_entries"] < 5
+
+
+@pytest.mark.parametrize("options", [{"max_entries": 0}, {"ttl": 0}])
+def test_validation(options):
+    with pytest.raises(ValueError):
+        ResultCache(**options)
+
+
+def run_session(coordinator, context, calls):
+    session_id = coordinator.create_session(
+        "problem", [AgentRole.TESTER], context=context
+    )
+    coordinator.active_sessions[session_id].tasks = [
+        Task(
+            task_id="t0",
+            description="Validate solution components",
+            assigned_agent=AgentRole.TESTER,
+        ),
+        Task(
+            task_id="t1", description="Run the tests", assigned_agent=AgentRole.TESTER
+        ),
+    ]
+
+    async def execute(task):
+        calls.append(task.task_id)
+        return {"confidence": 0.9}
+
+    coordinator._execute_agent_task_async = execute
+    return coordinator.execute_session(session_id)
+
+
+def test_coordinator_reuses_results_across_sessions(tmp_path):
+    coordinator = AgentCoordinator(tmp_path, result_cache=ResultCache())
+    calls = []
+
+    first = run_session(coordinator, {"revision": "abc"}, calls)
+    second = run_session(coordinator, {"revision": "abc"}, calls)
+    third = run_session(coordinator, {"revision": "def"}, calls)
+
+    assert first["cache"] == {"hits": 0, "misses": 2}
+    assert second["cache"] == {"hits": 2, "misses": 0}
+    assert third["cache"] == {"hits": 0, "misses": 2}
+    assert len(calls) == 4
+    assert second["consensus"]["consensus_reached"]
+
+
+def test_cache_disabled_by_default(tmp_path):
+    result = run_session(AgentCoordinator(tmp_path), {}, [])
+
+    assert result["cache"] is None
+
+
+def test_session_context_is_persisted(tmp_path):
+    store = SQLiteSessionStore(tmp_path / "sessions.db")
+    coordinator = AgentCoordinator(tmp_path, session_store=store)
+    session_id = coordinator.create_session(
+        "problem", [AgentRole.TESTER], context={"revision": "abc"}
+    )
+
+    assert store.load_session(session_id)["context"] == {"revision": "abc"}
+    store.close()
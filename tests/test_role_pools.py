@@ -0,0 +1,142 @@
+"""Tests for role_pools module."""
+
+import asyncio
+
+import pytest
+
+from agentic_dev_boilerplate.role_pools import RoleLimit, RolePool, RolePoolFullError
+
+
+async def track(state, delay=0.02):
+    state["running"] += 1
+    state["peak"] = max(state["peak"], state["running"])
+    await asyncio.sleep(delay)
+    state["running"] -= 1
+
+
+def test_concurrency_is_capped():
+    """No more than ``max_concurrency`` tasks run at once."""
+    pool = RolePool("tester", RoleLimit(max_concurrency=4))
+    state = {"running": 0, "peak": 0}
+
+    async def scenario():
+        futures = [await pool.submit(lambda: track(state)) for _ in range(20)]
+        await asyncio.gather(*futures)
+
+    asyncio.run(scenario())
+
+    assert state["peak"] == 4
+    stats = pool.stats()
+    assert stats["completed"] == 20
+    assert stats["peak_queue_depth"] == 16
+    assert stats["wait_max_seconds"] > 0
+
+
+def test_full_queue_blocks_submitter():
+    """With ``block``, submit waits until a queued task gets a slot."""
+    pool = RolePool("tester", RoleLimit(max_concurrency=1, max_queue=1))
+    state = {"running": 0, "peak": 0}
+
+    async def scenario():
+        first = await pool.submit(lambda: track(state, 0.05))
+        second = await pool.submit(lambda: track(state, 0.05))
+        third = asyncio.ensure_future(pool.submit(lambda: track(state, 0.05)))
+        await asyncio.sleep(0.01)
+        assert not third.done()
+        assert pool.stats()["blocked_submitters"] == 1
+        await asyncio.gather(first, second, await third)
+
+    asyncio.run(scenario())
+
+    assert pool.stats()["completed"] == 3
+
+
+def test_full_queue_rejects_submitter():
+    """With ``reject``, submit raises instead of waiting."""
+    pool = RolePool(
+        "tester", RoleLimit(max_concurrency=1, max_queue=1, overflow="reject")
+    )
+    state = {"running": 0, "peak": 0}
+
+    async def scenario():
+        first = await pool.submit(lambda: track(state))
+        second = await pool.submit(lambda: track(state))
+        with pytest.raises(RolePoolFullError):
+            await pool.submit(lambda: track(state))
+        await asyncio.gather(first, second)
+
+    asyncio.run(scenario())
+
+    assert pool.stats()["rejected"] == 1
+
+
+def test_cancelled_queued_task_frees_its_place():
+    """Cancelling queued work removes it from the queue and keeps slots intact."""
+    pool = RolePool("tester", RoleLimit(max_concurrency=1))
+    state = {"running": 0, "peak": 0}
+
+    async def scenario():
+        first = await pool.submit(lambda: track(state))
+        queued = await pool.submit(lambda: track(state))
+        await asyncio.sleep(0)
+        queued.cancel()
+        await first
+        assert pool.queue_depth == 0
+        assert pool.in_flight == 0
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("queued", [False, True])
+def test_task_cancelled_before_it_starts_frees_its_slot(queued):
+    """Cancelling before the first step neither leaks a slot nor a queue entry."""
+    pool = RolePool("tester", RoleLimit(max_concurrency=1))
+    state = {"running": 0, "peak": 0}
+
+    async def scenario():
+        running = await pool.submit(lambda: track(state)) if queued else None
+        cancelled = await pool.submit(lambda: track(state))
+        cancelled.cancel()
+        await asyncio.wait_for(await pool.submit(lambda: track(state)), 1)
+        if running is not None:
+            await running
+        assert pool.queue_depth == 0
+        assert pool.in_flight == 0
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize(
+    "spec,expected",
+    [
+        ("4", RoleLimit(4)),
+        ("4:16", RoleLimit(4, 16)),
+        ("2:8:reject", RoleLimit(2, 8, "reject")),
+        (":8", RoleLimit(None, 8)),
+    ],
+)
+def test_parse_role_limit(spec, expected):
+    assert RoleLimit.parse(spec) == expected
+
+
+def test_queued_work_granted_by_priority():
+    """Higher-priority queued work gets the next free slot."""
+    pool = RolePool("tester", RoleLimit(max_concurrency=1))
+    order = []
+
+    async def record(name):
+        order.append(name)
+        await asyncio.sleep(0)
+
+    async def scenario():
+        futures = [
+            await pool.submit(lambda: record("first"), priority=0),
+            await pool.submit(lambda: record("low"), priority=1),
+            await pool.submit(lambda: record("high"), priority=5),
+            await pool.submit(lambda: record("low-2"), priority=1),
+        ]
+        await asyncio.gather(*futures)
+
+    asyncio.run(scenario())
+
+    assert order == ["first", "high", "low", "low-2"]
@@ -0,0 +1,148 @@
+"""Tests for schema_loader module."""
+
+import pytest
+import yaml
+
+from agentic_dev_boilerplate.schema_loader import (
+    SchemaCycleError,
+    SchemaResolver,
+    deep_merge,
+)
+
+
+def write_yaml(path, data):
+    path.write_text(yaml.dump(data))
+    return path
+
+
+@pytest.fixture
+def resolver():
+    """Fresh resolver so cache statistics are isolated per test."""
+    return SchemaResolver()
+
+
+@pytest.fixture
+def base_schema(tmp_path):
+    """Shared base schema with agents, git and ci_cd blocks."""
+    return write_yaml(
+        tmp_path / "base.yaml",
+        {
+            "agents": [{"role": "planner", "enabled": True}],
+            "git": {"default_branch": "main", "commit_signing": True},
+            "ci_cd": {"provider": "github_actions"},
+            "workflows": {"ci_cd": True, "pr_automation": True},
+        },
+    )
+
+
+def test_deep_merge_overrides_nested_keys():
+    """Nested mappings merge; scalars and lists are replaced."""
+    base = {"git": {"default_branch": "main", "signing": True}, "tags": ["a"]}
+    override = {"git": {"default_branch": "trunk"}, "tags": ["b"]}
+
+    merged = deep_merge(base, override)
+
+    assert merged == {
+        "git": {"default_branch": "trunk", "signing": True},
+        "tags": ["b"],
+    }
+    assert base["git"]["default_branch"] == "main"  # inputs untouched
+
+
+def test_extends_deep_merges_base(tmp_path, base_schema, resolver):
+    """A child schema inherits base blocks and overrides individual keys."""
+    child = write_yaml(
+        tmp_path / "child.yaml",
+        {
+            "extends": "base.yaml",
+            "project": {"name": "child"},
+            "workflows": {"pr_automation": False},
+        },
+    )
+
+    schema = resolver.resolve(child)
+
+    assert "extends" not in schema
+    assert schema["project"]["name"] == "child"
+    assert schema["git"]["default_branch"] == "main"
+    assert schema["workflows"] == {"ci_cd": True, "pr_automation": False}
+
+
+def test_ref_with_json_pointer_and_siblings(tmp_path, base_schema, resolver):
+    """``$ref`` pulls a subtree; sibling keys are merged over it."""
+    child = write_yaml(
+        tmp_path / "child.yaml",
+        {
+            "git": {"$ref": "base.yaml#/git", "default_branch": "develop"},
+            "agents": {"$ref": "base.yaml#/agents"},
+        },
+    )
+
+    schema = resolver.resolve(child)
+
+    assert schema["git"] == {"default_branch": "develop", "commit_signing": True}
+    assert schema["agents"] == [{"role": "planner", "enabled": True}]
+
+
+def test_shared_base_parsed_and_merged_once(tmp_path, base_schema, resolver):
+    """Batch resolution of many children reuses the cached base."""
+    children = [
+        write_yaml(
+            tmp_path / f"repo{i}.yaml",
+            {"extends": "base.yaml", "project": {"name": f"repo{i}"}},
+        )
+        for i in range(5)
+    ]
+
+    for child in children:
+        resolver.resolve(child)
+
+    # One parse/merge for the base plus one per child.
+    assert resolver.stats["parsed"] == 6
+    assert resolver.stats["merged"] == 6
+    assert resolver.stats["hits"] == 4
+
+
+def test_base_edit_invalidates_children(tmp_path, base_schema, resolver):
+    """Changing a base file yields fresh results for documents extending it."""
+    child = write_yaml(tmp_path / "child.yaml", {"extends": "base.yaml"})
+    assert resolver.resolve(child)["git"]["default_branch"] == "main"
+
+    data = yaml.safe_load(base_schema.read_text())
+    data["git"]["default_branch"] = "trunk"
+    write_yaml(base_schema, data)
+
+    assert resolver.resolve(child)["git"]["default_branch"] == "trunk"
+
+
+def test_resolved_schema_is_private_copy(tmp_path, base_schema, resolver):
+    """Mutating a returned schema does not leak into the cache."""
+    child = write_yaml(tmp_path / "child.yaml", {"extends": "base.yaml"})
+
+    resolver.resolve(child)["git"]["default_branch"] = "mutated"
+
+    assert resolver.resolve(child)["git"]["default_branch"] == "main"
+
+
+@pytest.mark.parametrize(
+    "a_data,b_data",
+    [
+        ({"extends": "b.yaml"}, {"extends": "a.yaml"}),
+        ({"git": {"$ref": "b.yaml#/git"}}, {"extends": "a.yaml", "git": {}}),
+    ],
+)
+def test_cycles_are_reported(tmp_path, resolver, a_data, b_data):
+    """Cycles through extends or $ref raise SchemaCycleError."""
+    a = write_yaml(tmp_path / "a.yaml", a_data)
+    write_yaml(tmp_path / "b.yaml", b_data)
+
+    with pytest.raises(SchemaCycleError, match="cycle"):
+        resolver.resolve(a)
+
+
+def test_unresolvable_pointer(tmp_path, base_schema, resolver):
+    """A JSON pointer to a missing key raises ValueError."""
+    child = write_yaml(tmp_path / "child.yaml", {"git": {"$ref": "base.yaml#/nope"}})
+
+    with pytest.raises(ValueError, match="Unresolvable"):
+        resolver.resolve(child)
@@ -0,0 +1,190 @@
+"""Tests for session_store module."""
+
+import pytest
+
+from agentic_dev_boilerplate.multi_agent_solver import (
+    AgentCoordinator,
+    AgentMessage,
+    AgentRole,
+    MessageType,
+    Task,
+    TaskStatus,
+)
+from agentic_dev_boilerplate.session_store import SessionStore, SQLiteSessionStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteSessionStore(tmp_path / "sessions.db")
+    yield store
+    store.close()
+
+
+def chain_session(coordinator, length=4):
+    """Session whose tasks form a chain t0 -> t1 -> ... ."""
+    session_id = coordinator.create_session(
+        "problem", [AgentRole.TESTER, AgentRole.PLANNER]
+    )
+    session = coordinator.active_sessions[session_id]
+    session.tasks = [
+        Task(
+            task_id=f"t{i}",
+            description=f"step {i}",
+            assigned_agent=AgentRole.TESTER,
+            dependencies=[f"t{i - 1}"] if i else [],
+        )
+        for i in range(length)
+    ]
+    coordinator._save_session(session)
+    return session_id
+
+
+def test_database_uses_wal(store):
+    assert store.journal_mode == "wal"
+
+
+def test_session_round_trip(tmp_path, store):
+    """Sessions, tasks and messages survive a reopen of the database."""
+    coordinator = AgentCoordinator(tmp_path, session_store=store)
+    session_id = chain_session(coordinator, 2)
+    coordinator.send_message(
+        AgentMessage(
+            AgentRole.TESTER,
+            AgentRole.PLANNER,
+            MessageType.STATUS_UPDATE,
+            {"progress": 0.5},
+        )
+    )
+    coordinator.execute_session(session_id)
+    store.close()
+
+    reopened = SQLiteSessionStore(tmp_path / "sessions.db")
+    record = reopened.load_session(session_id)
+    reopened.close()
+
+    assert [t["status"] for t in record["tasks"]] == ["completed", "completed"]
+    assert record["tasks"][1]["dependencies"] == ["t0"]
+    assert record["tasks"][0]["results"]["agent"] == "tester"
+    assert record["messages"][0]["content"] == {"progress": 0.5}
+    assert record["completed_at"] is not None
+
+
+def test_transitions_coalesce_per_tick(tmp_path, store):
+    """Transitions of one task between flushes become a single row write."""
+    coordinator = AgentCoordinator(tmp_path, session_store=store)
+    session_id = chain_session(coordinator, 1)
+    task = coordinator.active_sessions[session_id].tasks[0]
+    before = dict(store.stats)
+
+    for status in (TaskStatus.IN_PROGRESS, TaskStatus.COMPLETED):
+        task.status = status
+        store.record_task(session_id, task)
+    store.flush()
+
+    assert store.stats["commits"] - before["commits"] == 1
+    assert store.stats["rows"] - before["rows"] == 1
+    assert store.load_session(session_id)["tasks"][0]["status"] == "completed"
+
+
+def test_session_commits_are_batched(tmp_path, store):
+    """A busy session commits per scheduling tick, not per transition."""
+    coordinator = AgentCoordinator(tmp_path, session_store=store)
+    session_id = coordinator.create_session("problem", [AgentRole.TESTER])
+    coordinator.active_sessions[session_id].tasks = [
+        Task(task_id=f"t{i}", description="d", assigned_agent=AgentRole.TESTER)
+        for i in range(50)
+    ]
+    coordinator._save_session(coordinator.active_sessions[session_id])
+    before = dict(store.stats)
+
+    coordinator.execute_session(session_id)
+
+    # 100 transitions (started + completed per task) in a handful of commits.
+    assert store.stats["commits"] - before["commits"] <= 10
+    assert store.stats["rows"] - before["rows"] <= 101
+
+
+def test_resume_reruns_only_unfinished_tasks(tmp_path, monkeypatch):
+    """After a crash, a new process resumes without redoing completed work."""
+    db = tmp_path / "sessions.db"
+    crashed = AgentCoordinator(tmp_path, session_store=SQLiteSessionStore(db))
+    session_id = chain_session(crashed)
+
+    original = crashed._execute_agent_task_async
+
+    async def crash_on_t2(task):
+        if task.task_id == "t2":
+            raise RuntimeError("worker died")
+        return await original(task)
+
+    monkeypatch.setattr(crashed, "_execute_agent_task_async", crash_on_t2)
+    failed = crashed.execute_session(session_id)
+    crashed.session_store.close()
+    assert failed["errors"] == {"t2": "RuntimeError: worker died"}
+
+    resumed = AgentCoordinator(tmp_path, session_store=SQLiteSessionStore(db))
+    executed = []
+    original_resumed = resumed._execute_agent_task_async
+
+    async def record(task):
+        executed.append(task.task_id)
+        return await original_resumed(task)
+
+    monkeypatch.setattr(resumed, "_execute_agent_task_async", record)
+    result = resumed.resume_session(session_id)
+    resumed.close()
+
+    assert executed == ["t2", "t3"]
+    assert list(result["results"]) == ["t0", "t1", "t2", "t3"]
+    tasks = resumed.active_sessions[session_id].tasks
+    assert all(task.status == TaskStatus.COMPLETED for task in tasks)
+
+
+def test_resume_unknown_session(tmp_path, store):
+    coordinator = AgentCoordinator(tmp_path, session_store=store)
+    with pytest.raises(ValueError, match="not found"):
+        coordinator.resume_session("session_missing")
+
+
+def test_saving_again_does_not_duplicate_messages(tmp_path, store):
+    coordinator = AgentCoordinator(tmp_path, session_store=store)
+    session_id = chain_session(coordinator, 1)
+    coordinator.send_message(
+        AgentMessage(AgentRole.TESTER, AgentRole.PLANNER, MessageType.STATUS_UPDATE, {})
+    )
+    session = coordinator.active_sessions[session_id]
+
+    coordinator._save_session(session)
+    store.flush()
+    coordinator._save_session(session)
+
+    assert len(store.load_session(session_id)["messages"]) == 1
+
+
+def test_new_decomposition_replaces_stored_tasks(tmp_path, store):
+    coordinator = AgentCoordinator(tmp_path, session_store=store)
+    session_id = chain_session(coordinator, 3)
+    store.flush()
+    session = coordinator.active_sessions[session_id]
+    session.tasks = session.tasks[:1]
+
+    coordinator._save_session(session)
+
+    assert [t["task_id"] for t in store.load_session(session_id)["tasks"]] == ["t0"]
+
+
+def test_reassignment_is_recorded(tmp_path, store):
+    coordinator = AgentCoordinator(tmp_path, session_store=store)
+    session_id = chain_session(coordinator, 1)
+    store.flush()
+    task = coordinator.active_sessions[session_id].tasks[0]
+
+    task.assigned_agent = AgentRole.PLANNER
+    store.record_task(session_id, task)
+
+    assert store.load_session(session_id)["tasks"][0]["assigned_agent"] == "planner"
+
+
+def test_session_store_is_abstract():
+    with pytest.raises(TypeError):
+        SessionStore()
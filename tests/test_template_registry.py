@@ -0,0 +1,124 @@
+"""Tests for template_registry module."""
+
+import json
+
+import pytest
+
+from agentic_dev_boilerplate.template_registry import (
+    AGENT,
+    SCRIPT,
+    WORKFLOW,
+    TemplateRegistry,
+    get_template_registry,
+)
+
+
+@pytest.fixture
+def template_pack(tmp_path):
+    """A small pack mixing convention-named and front-matter templates."""
+    pack = tmp_path / "pack"
+    (pack / "nested").mkdir(parents=True)
+    (pack / "agent_test_engineer_instructions.md.j2").write_text("tests")
+    (pack / "agent_planner_instructions.md.j2").write_text("plans")
+    (pack / "agent_base_instructions.md.j2").write_text("shared")
+    (pack / "script_setup_uv.py.j2").write_text("print('uv')")
+    (pack / "workflow_ci_cd.yml.j2").write_text("on: push")
+    (pack / "frontend.md.j2").write_text(
+        "{#---\nrole: frontend-developer\nmode: '0640'\n---#}\nUI"
+    )
+    (pack / "nested" / "agent_ignored_instructions.md.j2").write_text("x")
+    return pack
+
+
+def test_naming_conventions(template_pack):
+    """Agents, scripts and workflows are classified from file names."""
+    registry = TemplateRegistry.scan(template_pack)
+
+    planner = registry.get(AGENT, "planner")
+    assert planner.name == "agent_planner_instructions.md.j2"
+    assert planner.output_path(role="planner") == (
+        ".github/instructions/planner.instructions.md"
+    )
+
+    script = registry.get(SCRIPT, "setup_uv.py")
+    assert script.output_path() == "scripts/setup_uv.py"
+    assert script.mode == 0o755
+
+    assert (
+        registry.get(WORKFLOW, "ci-cd").output_path() == ".github/workflows/ci-cd.yml"
+    )
+
+
+@pytest.mark.parametrize("role", ["test_engineer", "test-engineer", "Test_Engineer"])
+def test_roles_are_normalized(template_pack, role):
+    """Hyphen and underscore spellings of a role find the same template."""
+    registry = TemplateRegistry.scan(template_pack)
+
+    entry = registry.get(AGENT, role)
+
+    assert entry.name == "agent_test_engineer_instructions.md.j2"
+    assert (
+        entry.output_path(role=role) == f".github/instructions/{role}.instructions.md"
+    )
+
+
+def test_front_matter_metadata(template_pack):
+    """Front matter registers templates that do not follow naming conventions."""
+    registry = TemplateRegistry.scan(template_pack)
+
+    entry = registry.get(AGENT, "frontend_developer")
+
+    assert entry.name == "frontend.md.j2"
+    assert entry.mode == 0o640
+
+
+def test_nested_templates_need_front_matter(template_pack):
+    """Conventions apply only at the pack root."""
+    registry = TemplateRegistry.scan(template_pack)
+
+    assert registry.get(AGENT, "ignored") is None
+    assert registry.has("nested/agent_ignored_instructions.md.j2")
+
+
+def test_base_instructions_are_not_a_role(template_pack):
+    """The shared base instructions template is not registered as a role."""
+    registry = TemplateRegistry.scan(template_pack)
+
+    assert registry.get(AGENT, "base") is None
+    assert registry.has("agent_base_instructions.md.j2")
+
+
+def test_missing_template_lookup_returns_none(template_pack):
+    """Unknown roles are a dictionary miss, not an exception."""
+    registry = TemplateRegistry.scan(template_pack)
+
+    assert registry.get(AGENT, "ml-engineer") is None
+
+
+def test_index_persisted_and_reused(template_pack, tmp_path):
+    """A matching persisted index is loaded instead of rescanning."""
+    index_path = tmp_path / "index.json"
+    registry = get_template_registry(template_pack, index_path)
+    index = json.loads(index_path.read_text())
+    assert index["signature"] == registry.signature
+
+    # Tamper with the index: if it is reused, the tampered entry shows up.
+    index["entries"][0]["key"] = "from-index"
+    index_path.write_text(json.dumps(index))
+    from agentic_dev_boilerplate import template_registry
+
+    template_registry._registries.clear()
+    reloaded = get_template_registry(template_pack, index_path)
+
+    assert any(entry.key == "from-index" for entry in reloaded.entries)
+
+
+def test_changed_pack_is_rescanned(template_pack, tmp_path):
+    """Adding a template invalidates both the in-process and persisted index."""
+    index_path = tmp_path / "index.json"
+    get_template_registry(template_pack, index_path)
+
+    (template_pack / "agent_debugger_instructions.md.j2").write_text("debug")
+    registry = get_template_registry(template_pack, index_path)
+
+    assert registry.get(AGENT, "debugger") is not None
@@ -0,0 +1,172 @@
+"""Tests for tracing module and session spans."""
+
+import asyncio
+import json
+
+import pytest
+
+from agentic_dev_boilerplate.multi_agent_solver import AgentCoordinator, AgentRole, Task
+from agentic_dev_boilerplate.tracing import (
+    NOOP_SPAN,
+    STATUS_ERROR,
+    OTLPJsonFileExporter,
+    Tracer,
+    current_span,
+)
+
+
+@pytest.fixture
+def trace_file(tmp_path):
+    return tmp_path / "trace.jsonl"
+
+
+def read_spans(path):
+    spans = []
+    for line in path.read_text().splitlines():
+        (resource,) = json.loads(line)["resourceSpans"]
+        (scope,) = resource["scopeSpans"]
+        spans.extend(scope["spans"])
+    return spans
+
+
+def attributes(span):
+    return {a["key"]: next(iter(a["value"].values())) for a in span["attributes"]}
+
+
+def test_nested_spans_share_trace_and_export_as_otlp(trace_file):
+    tracer = Tracer(OTLPJsonFileExporter(trace_file))
+    with tracer.span("outer", attributes={"n": 3, "ok": True}) as outer:
+        with tracer.span("inner") as inner:
+            assert current_span() is inner
+        assert current_span() is outer
+    with pytest.raises(ValueError):
+        with tracer.span("broken"):
+            raise ValueError("bad input")
+    tracer.shutdown()
+
+    inner_span, outer_span, broken = read_spans(trace_file)
+    assert inner_span["traceId"] == outer_span["traceId"] != broken["traceId"]
+    assert inner_span["parentSpanId"] == outer_span["spanId"]
+    assert "parentSpanId" not in outer_span
+    assert attributes(outer_span) == {"n": "3", "ok": True}
+    assert broken["status"] == {
+        "code": STATUS_ERROR,
+        "message": "ValueError: bad input",
+    }
+    assert int(outer_span["endTimeUnixNano"]) >= int(inner_span["endTimeUnixNano"])
+
+
+def test_spans_are_batched(trace_file):
+    exporter = OTLPJsonFileExporter(trace_file, max_batch=2, flush_interval=60)
+    tracer = Tracer(exporter)
+    for i in range(5):
+        tracer.span(f"s{i}").end()
+    assert exporter.force_flush(5)
+
+    lines = trace_file.read_text().splitlines()
+    assert [
+        len(json.loads(l)["resourceSpans"][0]["scopeSpans"][0]["spans"]) for l in lines
+    ] == [2, 2, 1]
+    assert exporter.exported == 5
+    tracer.shutdown()
+
+
+@pytest.mark.parametrize("ratio,expected", [(0.0, 0), (1.0, 200)])
+def test_sampling_keeps_or_drops_whole_traces(trace_file, ratio, expected):
+    tracer = Tracer(OTLPJsonFileExporter(trace_file), sample_ratio=ratio)
+    for _ in range(100):
+        with tracer.span("root"):
+            tracer.span("child").end()
+    tracer.shutdown()
+
+    spans = read_spans(trace_file) if trace_file.exists() else []
+    assert len(spans) == expected
+
+
+def test_partial_sampling_is_per_trace(trace_file):
+    tracer = Tracer(OTLPJsonFileExporter(trace_file), sample_ratio=0.5)
+    for _ in range(400):
+        with tracer.span("root"):
+            tracer.span("child").end()
+    tracer.shutdown()
+
+    spans = read_spans(trace_file)
+    roots = {s["spanId"] for s in spans if s["name"] == "root"}
+    children = [s for s in spans if s["name"] == "child"]
+    assert 100 < len(roots) < 300
+    assert {c["parentSpanId"] for c in children} == roots
+
+
+def test_disabled_tracer_is_a_noop():
+    tracer = Tracer()
+    with tracer.span("anything") as span:
+        assert span is NOOP_SPAN
+        assert current_span() is None
+    with pytest.raises(ValueError):
+        Tracer(sample_ratio=1.5)
+
+
+def test_session_spans_follow_task_dependencies(tmp_path, trace_file):
+    tracer = Tracer(OTLPJsonFileExporter(trace_file))
+    coordinator = AgentCoordinator(tmp_path, tracer=tracer)
+    session_id = coordinator.create_session("problem", [AgentRole.TESTER])
+    coordinator.active_sessions[session_id].tasks = [
+        Task(task_id="a", description="a", assigned_agent=AgentRole.TESTER),
+        Task(task_id="b", description="b", assigned_agent=AgentRole.TESTER),
+        Task(
+            task_id="c",
+            description="c",
+            assigned_agent=AgentRole.TESTER,
+            dependencies=["a", "b"],
+        ),
+    ]
+
+    async def execute(task):
+        await asyncio.sleep(0.05 if task.task_id == "b" else 0)
+        return {"confidence": 0.9}
+
+    coordinator._execute_agent_task_async = execute
+    coordinator.execute_session(session_id)
+    coordinator.close()
+
+    spans = read_spans(trace_file)
+    assert len({s["traceId"] for s in spans}) == 1
+    by_name = {}
+    for span in spans:
+        by_name.setdefault(span["name"], []).append(span)
+    (root,) = by_name["session"]
+    (create,) = by_name["create_session"]
+    (execute_span,) = by_name["execute_session"]
+    (consensus,) = by_name["consensus"]
+    tasks = {attributes(s)["task.id"]: s for s in by_name["run_task"]}
+
+    assert create["parentSpanId"] == root["spanId"]
+    assert execute_span["parentSpanId"] == root["spanId"]
+    # The root stays open until the session has finished executing.
+    assert int(root["startTimeUnixNano"]) <= int(create["startTimeUnixNano"])
+    assert int(root["endTimeUnixNano"]) >= int(execute_span["endTimeUnixNano"])
+    assert not coordinator._session_spans
+    assert consensus["parentSpanId"] == execute_span["spanId"]
+    assert attributes(consensus)["consensus.reached"] is True
+    assert attributes(consensus)["consensus.reported"] == "3"
+    assert tasks["a"]["parentSpanId"] == execute_span["spanId"]
+    assert tasks["b"]["parentSpanId"] == execute_span["spanId"]
+    # b finished last, so it released c; a is linked.
+    assert tasks["c"]["parentSpanId"] == tasks["b"]["spanId"]
+    assert tasks["c"]["links"] == [
+        {"traceId": root["traceId"], "spanId": tasks["a"]["spanId"]}
+    ]
+
+
+def test_unexecuted_session_spans_end_on_close(tmp_path, trace_file):
+    tracer = Tracer(OTLPJsonFileExporter(trace_file))
+    coordinator = AgentCoordinator(tmp_path, tracer=tracer)
+    kept = coordinator.create_session("kept", [AgentRole.TESTER])
+    closed = coordinator.create_session("closed", [AgentRole.TESTER])
+
+    coordinator.close_session(closed)
+    assert list(coordinator._session_spans) == [kept]
+    coordinator.close()
+
+    roots = [s for s in read_spans(trace_file) if s["name"] == "session"]
+    assert sorted(attributes(s)["session.id"] for s in roots) == sorted([kept, closed])